@@ -4,12 +4,29 @@
 # Tanggal Buat  : Jumat, 19 November 2025
 # Deskripsi     : Membuat Program Vigenere Cipher
 
+import html
+import io
+import os
+
 import streamlit as st
-import string
-import hashlib
-import binascii
-import math
-import secrets
+
+# Engine cipher, statistik dan utilitas key ada di package `vigivault`
+# (tanpa dependensi Streamlit; dipakai juga oleh CLI `python -m vigivault`).
+from vigivault.analysis import time_to_break
+from vigivault.batch import BATCH_WORKERS, encrypt_batch_to_tempzip, items_from_uploads
+from vigivault.cache import ResultCache, SharedFile
+from vigivault.classic import stream_transform_text, vigenere_decrypt_classic, vigenere_encrypt_classic
+from vigivault.compare import compare_streams
+from vigivault.container import (VERIFY_LEVELS, decrypt_range, decrypt_stream, encrypt_stream,
+                                 read_container, verify_decrypted)
+from vigivault.hexview import HEX_PAGE, HEX_PAGES, page_start, parse_offset, view_page
+from vigivault.jobs import Job, JobQueue
+from vigivault.keys import estimate_key_strength, key_digest, random_key
+from vigivault.localfile import decrypt_file, encrypt_file
+from vigivault.metrics import recording, to_jsonl
+from vigivault.schedule import key_schedule
+from vigivault.stats import FileStats
+from vigivault.utils import clean_filename, hex_preview, sha256
 
 
 # ==============================
@@ -84,125 +101,237 @@ st.markdown(
 )
 
 # ==============================
-# UTILS
-# ==============================
-def hex_preview(b: bytes, n: int = 64) -> str:
-    if not b:
-        return "(kosong)"
-    head = b[:n]
-    hx = binascii.hexlify(head).decode("ascii")
-    bytes_list = [hx[i:i+2] for i in range(0, len(hx), 2)]
-    lines = []
-    for i in range(0, len(bytes_list), 16):
-        chunk = bytes_list[i:i+16]
-        raw = head[i:i+16]
-        ascii_col = "".join([chr(c) if 32 <= c <= 126 else "." for c in raw])
-        lines.append(f"{i:04x}  " + " ".join(chunk).ljust(16*3-1) + "  |" + ascii_col + "|")
-    return "\n".join(lines)
-
-def sha256(b: bytes) -> str:
-    return hashlib.sha256(b).hexdigest()
-
-def shannon_entropy(b: bytes) -> float:
-    if not b:
-        return 0.0
-    from collections import Counter
-    cnt = Counter(b); total = len(b); ent = 0.0
-    for c in cnt.values():
-        p = c / total
-        ent -= p * math.log2(p)
-    return ent
-
-def clean_filename(name: str, remove_spaces: bool = False) -> str:
-    if not name:
-        return name
-    base = name
-    if remove_spaces:
-        base = base.replace(" ", "_")
-    return base.replace("(", "").replace(")", "")
-
-def estimate_key_strength(key: str) -> dict:
-    length = len(key)
-    classes = {
-        "lower": any(c.islower() for c in key),
-        "upper": any(c.isupper() for c in key),
-        "digit": any(c.isdigit() for c in key),
-        "other": any(not c.isalnum() for c in key),
-    }
-    pool = (26 if classes["lower"] else 0) + (26 if classes["upper"] else 0) + (10 if classes["digit"] else 0) + (32 if classes["other"] else 0)
-    entropy_bits = length * (math.log2(pool) if pool>0 else 0)
-    if length == 0: level = "empty"
-    elif entropy_bits < 32: level = "weak"
-    elif entropy_bits < 64: level = "fair"
-    elif entropy_bits < 96: level = "strong"
-    else: level = "very strong"
-    return {"length": length, "pool": pool, "entropy_bits": entropy_bits, "level": level}
-
-def random_key(n: int, include_symbols: bool=True) -> str:
-    alphabet = string.ascii_letters + string.digits + ("!@#$%^&*()-_=+[]{};:,.?/" if include_symbols else "")
-    return "".join(secrets.choice(alphabet) for _ in range(n))
-
-# ==============================
-# VIGENERE CLASSIC (A–Z)
-# ==============================
-ALPHABET = string.ascii_uppercase
-def _clean_key_alpha(key: str) -> str:
-    return "".join([c for c in key.upper() if c.isalpha()])
-
-def vigenere_encrypt_classic(pt: str, key: str, keep_non_letters: bool = True) -> str:
-    key = _clean_key_alpha(key)
-    if not key:
-        raise ValueError("Key harus berisi huruf A–Z.")
-    res = []; j = 0
-    for ch in pt:
-        if ch.isalpha():
-            p = (ord(ch.upper()) - 65)
-            k = (ord(key[j % len(key)]) - 65)
-            c = (p + k) % 26
-            out = chr(c + 65)
-            out = out if ch.isupper() else out.lower()
-            res.append(out); j += 1
-        else:
-            res.append(ch if keep_non_letters else "")
-    return "".join(res)
-
-def vigenere_decrypt_classic(ct: str, key: str, keep_non_letters: bool = True) -> str:
-    key = _clean_key_alpha(key)
-    if not key:
-        raise ValueError("Key harus berisi huruf A–Z.")
-    res = []; j = 0
-    for ch in ct:
-        if ch.isalpha():
-            c = (ord(ch.upper()) - 65)
-            k = (ord(key[j % len(key)]) - 65)
-            p = (c - k) % 26
-            out = chr(p + 65)
-            out = out if ch.isupper() else out.lower()
-            res.append(out); j += 1
-        else:
-            res.append(ch if keep_non_letters else "")
-    return "".join(res)
+# CACHE HASIL (LRU by bytes)
+# ==============================
+# Streamlit menjalankan ulang seluruh script tiap interaksi widget. Hasil
+# (stats, cipher/plain, hex preview, verifikasi) disimpan per
+# (digest konten, digest key, operasi) agar rerun tidak menghitung ulang.
+# Cache dibagi semua sesi: file hasil menjadi SharedFile (ber-referensi),
+# dibaca hanya lewat handle sendiri (open()), tidak pernah lewat posisi bersama.
+CACHE_MAX_BYTES = 1 << 30
+
+@st.cache_resource
+def get_result_cache() -> ResultCache:
+    return ResultCache(CACHE_MAX_BYTES)
+
+def upload_digest(f) -> str:
+    # file_id unik per upload di Streamlit; fallback ke SHA-256 isi file
+    fid = getattr(f, "file_id", None)
+    if fid:
+        return f"{fid}:{f.size}"
+    return FileStats.of_stream(f).sha256
+
+def cached_stats(f) -> FileStats:
+    return get_result_cache().get_or_compute((upload_digest(f), None, "stats"),
+                                             lambda: FileStats.of_stream(f), cost=lambda v: v.hist.nbytes + len(v.head))
+
+def cached_container(fenc):
+    return get_result_cache().get_or_compute((upload_digest(fenc), None, "container"),
+                                             lambda: read_container(fenc),
+                                             cost=lambda v: len(v["index"]) + 256 if v else 1)
+
+def cached_compare(fa, fb, regions: bool) -> dict:
+    return get_result_cache().get_or_compute((upload_digest(fa) + "|" + upload_digest(fb), None,
+                                              "compare:regions" if regions else "compare"),
+                                             lambda: compare_streams(fa, fb, regions=regions),
+                                             cost=lambda v: 16 * len(v["regions"] or ()) + 256)
+
+def cached_break_time(key: str, mode: str):
+    # simulasi serangan Kasiski/Friedman: hanya bergantung pada key, bukan file
+    return get_result_cache().get_or_compute((None, key_digest(key), "ttb:" + mode),
+                                             lambda: time_to_break(key, mode))
+
+def format_break_time(ttb) -> str:
+    if ttb is None:
+        return "—"
+    if not ttb["recovered"]:
+        return "tidak terbobol pada simulasi"
+    secs = ttb["seconds"]
+    took = f"{secs * 1000:.0f} ms" if secs < 1 else f"{secs:.1f} s"
+    return f"≈ {took} dari ~{ttb['ciphertext_len']:,} {'huruf' if ttb['mode'] == 'classic' else 'byte'} cipher"
+
+def cached_hex(content_id: str, b: bytes, n: int = 64) -> str:
+    return get_result_cache().get_or_compute((content_id, None, f"hex{n}"),
+                                             lambda: hex_preview(b, n), cost=len)
 
 # ==============================
-# VIGENERE BYTE-WISE (0–255)
+# DOWNLOAD (dibaca saat diklik)
 # ==============================
-def vigenere_encrypt_bytes(data: bytes, key: str) -> bytes:
-    if not key:
-        raise ValueError("Key tidak boleh kosong.")
-    key_bytes = key.encode("utf-8")
-    out = bytearray(); klen = len(key_bytes)
-    for i, b in enumerate(data):
-        out.append((b + key_bytes[i % klen]) % 256)
-    return bytes(out)
+# st.download_button dengan data file/bytes membaca seluruh isi file di setiap
+# rerun dan menyimpannya per sesi di media file manager. Dengan callable, file
+# hasil (temporer di disk) baru dibaca saat tombol diklik. Untuk SharedFile,
+# handle sendiri dipegang selama callable masih terdaftar (ditutup saat dibuang).
+def lazy_download(f):
+    src = f.open() if isinstance(f, SharedFile) else f
+    def read() -> bytes:
+        src.seek(0)
+        return src.read()
+    return read
 
-def vigenere_decrypt_bytes(data: bytes, key: str) -> bytes:
-    if not key:
-        raise ValueError("Key tidak boleh kosong.")
-    key_bytes = key.encode("utf-8")
-    out = bytearray(); klen = len(key_bytes)
-    for i, b in enumerate(data):
-        out.append((b - key_bytes[i % klen]) % 256)
-    return bytes(out)
+# ==============================
+# HEX VIEWER (paginated)
+# ==============================
+# Hanya page yang tampil yang dibaca (seek + read, atau decrypt_range untuk
+# plaintext), diformat, dan di-cache per (konten, key, awal page). Offset
+# disimpan di session_state per slot, sehingga bisa di-set dari luar (mis.
+# lompat ke byte berbeda pertama hasil Compare Mode).
+def cached_hex_page(content_id: str, src, offset: int, page: int, size: int, key: str | None = None, meta=None) -> dict:
+    start = page_start(offset, size, page)
+    return get_result_cache().get_or_compute((content_id, key_digest(key) if key else None, f"hexpage:{start}:{page}"),
+                                             lambda: view_page(src, start, page, key, meta, size),
+                                             cost=lambda v: len(v["text"]) + len(v["data"]))
+
+def hex_jump(slot: str, offset: int) -> None:
+    st.session_state[slot + "_off"] = f"0x{offset:x}"
+
+def _hex_step(slot: str, direction: int, size: int) -> None:
+    page = st.session_state.get(slot + "_page", HEX_PAGE)
+    try:
+        off = parse_offset(st.session_state.get(slot + "_off", "0"))
+    except ValueError:
+        off = 0
+    hex_jump(slot, page_start(max(0, page_start(off, size, page) + direction * page), size, page))
+
+def hex_viewer(slot: str, src, content_id: str, size: int, key: str | None = None, meta=None) -> None:
+    st.session_state.setdefault(slot + "_off", "0x0")
+    h1, h2, h3, h4 = st.columns([3, 2, 1, 1])
+    with h1:
+        st.text_input("Offset (desimal / 0x…)", key=slot + "_off")
+    with h2:
+        page = st.selectbox("Byte per halaman", HEX_PAGES, index=HEX_PAGES.index(HEX_PAGE), key=slot + "_page")
+    with h3:
+        st.button("◀", key=slot + "_prev", on_click=_hex_step, args=(slot, -1, size), use_container_width=True)
+    with h4:
+        st.button("▶", key=slot + "_next", on_click=_hex_step, args=(slot, 1, size), use_container_width=True)
+    try:
+        offset = parse_offset(st.session_state[slot + "_off"])
+    except ValueError:
+        st.warning("Offset tidak valid; menampilkan awal file.")
+        offset = 0
+    if size == 0:
+        st.markdown('<div class="hexbox">(kosong)</div>', unsafe_allow_html=True)
+        return
+    view = cached_hex_page(content_id, src, offset, page, size, key, meta)
+    st.caption(f"Byte {view['start']:#x}–{max(view['start'], view['end'] - 1):#x} dari {size:,} "
+               f"({view['start'] / size:.1%})" + (" · plaintext (didekripsi saat dilihat)" if key else ""))
+    st.markdown(f'<div class="hexbox">{html.escape(view["text"])}</div>', unsafe_allow_html=True)
+
+# ==============================
+# METRICS (per operasi)
+# ==============================
+# Tiap aksi (enkripsi, dekripsi, batch, compare) diukur per tahap: read,
+# cipher, write, sha256, histogram, entropy, index, hex_preview, diff, dan
+# cache_hit. Riwayat disimpan per sesi dan ditampilkan di sidebar.
+METRICS_KEEP = 50
+
+def push_metrics(record: dict) -> None:
+    runs = st.session_state.setdefault("metrics", [])
+    runs.append(record)
+    del runs[:-METRICS_KEEP]
+
+# Opsi sidebar cProfile/tracemalloc; job latar belakang membacanya saat submit.
+def metric_opts() -> dict:
+    return {"profile": st.session_state.get("m_profile", False),
+            "trace_memory": st.session_state.get("m_trace", False)}
+
+def track(op: str, nbytes: int | None = None, **labels):
+    return recording(op, sink=push_metrics, nbytes=nbytes, **metric_opts(), **labels)
+
+# ==============================
+# JOB LATAR BELAKANG (enkripsi/dekripsi)
+# ==============================
+# Cipher berjalan di executor global, di luar siklus rerun: sesi hanya
+# menyimpan id job di st.session_state dan mem-poll progress lewat fragment.
+# Hasil juga masuk ResultCache, sehingga submit ulang input + key yang sama
+# langsung selesai. Job membaca BytesIO terpisah atas bytes upload agar posisi
+# baca tidak bentrok dengan preview di rerun. Pakai getvalue(), bukan
+# getbuffer(): BytesIO(bytes) berbagi buffer, sedangkan getbuffer() memaksa
+# salinan di upload dan di BytesIO baru (2× ukuran file per job).
+JOB_POLL_SECONDS = 1.0
+
+@st.cache_resource
+def get_job_queue() -> JobQueue:
+    return JobQueue()
+
+def submit_encrypt(f, key: str) -> Job:
+    cache = get_result_cache()
+    ck = (upload_digest(f), key_digest(key), "encrypt")
+    src = io.BytesIO(f.getvalue()); name = f.name
+    def run(job):
+        return cache.get_or_compute(ck, lambda: encrypt_stream(job.reader(src), key, name=name),
+                                    cost=lambda v: v[1].size)
+    return get_job_queue().submit("encrypt", run, total=f.size, key=ck, file=name, **metric_opts())
+
+# Satu job per level verifikasi, tetapi tahap dekripsi hanya dihitung sekali
+# per (digest, key): job level lain yang bersamaan menunggu hasil yang sama
+# di cache (single-flight), lalu memverifikasi lewat handle plaintext sendiri.
+def submit_decrypt(fenc, key: str, level: str) -> Job:
+    cache = get_result_cache()
+    key = key_schedule(key)   # satu schedule untuk dekripsi + verifikasi
+    digest, kd = upload_digest(fenc), key.digest
+    src = io.BytesIO(fenc.getvalue())
+    def run(job):
+        enc = job.reader(src)
+        plain, stats, meta = cache.get_or_compute((digest, kd, "decrypt"), lambda: decrypt_stream(enc, key),
+                                                  cost=lambda v: v[1].size)
+        with plain.open() as ph:
+            # level "sampled" sengaja tidak di-cache: tiap klik memakai sampel baru
+            if level == "sampled":
+                verified = verify_decrypted(ph, enc, key, stats, meta, level)
+            else:
+                verified = cache.get_or_compute((digest, kd, "verify:" + level),
+                                                lambda: verify_decrypted(ph, enc, key, stats, meta, level))
+        return plain, stats, meta, verified
+    # verifikasi penuh membaca ciphertext dua kali
+    total = fenc.size * (2 if level == "full" else 1)
+    return get_job_queue().submit("decrypt", run, total=total, key=(digest, kd, "decrypt:" + level),
+                                  file=fenc.name, level=level, **metric_opts())
+
+def submit_text(f, key: str, decrypt: bool, keep_non_letters: bool) -> Job:
+    # file teks UTF-8 besar: Vigenere klasik streaming, hasil ke file temporer
+    cache = get_result_cache()
+    op = "text_decrypt" if decrypt else "text_encrypt"
+    ck = (upload_digest(f), key_digest(key), f"{op}:{int(keep_non_letters)}")
+    src = io.BytesIO(f.getvalue())
+    def run(job):
+        return cache.get_or_compute(ck, lambda: stream_transform_text(job.reader(src), key, decrypt, keep_non_letters),
+                                    cost=lambda v: v[1]["bytes_out"])
+    return get_job_queue().submit(op, run, total=f.size, key=ck, file=f.name, **metric_opts())
+
+def session_job(slot: str, key) -> Job | None:
+    # job sesi hanya ditampilkan selama input (file + key) masih sama
+    job = get_job_queue().get(st.session_state.get(slot))
+    return job if job is not None and key is not None and job.key == key else None
+
+def collect_job_metrics(job: Job) -> None:
+    seen = st.session_state.setdefault("metrics_jobs", set())
+    if job.metrics is not None and job.id not in seen:
+        seen.add(job.id); push_metrics(job.metrics)
+
+@st.fragment(run_every=JOB_POLL_SECONDS)
+def job_progress(job_id: str) -> None:
+    job = get_job_queue().get(job_id)
+    if job is None or not job.is_active:
+        st.rerun()   # hasil dirender oleh run penuh
+    text = "Menunggu worker…" if job.status == "queued" else f"{job.progress:.0%} · {job.mb_s:.1f} MB/s · {job.elapsed:.1f} s"
+    st.progress(job.progress, text=f"{job.labels.get('file', job.op)} · {text}")
+    if st.button("✖️ Batalkan", key=f"cancel_{job_id}"):
+        job.cancel()
+        st.rerun()
+
+# ==============================
+# FILE LOKAL (mmap, tanpa upload)
+# ==============================
+# Hanya aktif bila VIGIVAULT_LOCAL_ROOT di-set; semua path dibatasi di bawah
+# root tersebut karena UI bisa diakses pengguna lain.
+LOCAL_ROOT = os.environ.get("VIGIVAULT_LOCAL_ROOT", "")
+
+def local_path(rel: str) -> str:
+    root = os.path.realpath(LOCAL_ROOT)
+    path = os.path.realpath(os.path.join(root, rel))
+    if os.path.commonpath([root, path]) != root:
+        raise ValueError("Path berada di luar VIGIVAULT_LOCAL_ROOT.")
+    return path
 
 # ==============================
 # SIDEBAR (SETTINGS)
@@ -215,6 +344,12 @@ st.sidebar.write("• Mode TEKS: hanya huruf A–Z diproses (mod 26).")
 st.sidebar.write("• Mode FILE: seluruh byte diproses (mod 256), aman untuk semua tipe file.")
 st.sidebar.write("• Simpan hasil enkripsi sebagai **.enc** (biner).")
 st.sidebar.markdown("---")
+cache_box = st.sidebar.empty()
+
+with st.sidebar.expander("📊 Metrics"):
+    st.checkbox("Capture cProfile", value=False, key="m_profile")
+    st.checkbox("Capture tracemalloc (peak alokasi)", value=False, key="m_trace")
+    metrics_box = st.empty()
 
 with st.sidebar.expander("🔑 Manajemen Key"):
     c1, c2 = st.columns([2,1])
@@ -243,8 +378,10 @@ if mode.startswith("Teks"):
                 st.info(f"Random: {st.session_state['random_key']}", icon="🎲")
         with colk3:
             st.caption("Gunakan huruf A–Z saja.")
+            if key_input_text:
+                st.caption(f"Waktu bobol (Kasiski/Friedman) {format_break_time(cached_break_time(key_input_text, 'classic'))}")
 
-    tab_enc, tab_dec = st.tabs(["🔒 Enkripsi Teks", "🔓 Dekripsi Teks"])
+    tab_enc, tab_dec, tab_txt_file = st.tabs(["🔒 Enkripsi Teks", "🔓 Dekripsi Teks", "📄 File Teks (besar)"])
 
     with tab_enc:
         pt = st.text_area("Plaintext", height=160, placeholder="Contoh: OMEGA atau kalimat bebas…")
@@ -280,6 +417,38 @@ if mode.startswith("Teks"):
                 except Exception as e:
                     st.error(f"Gagal dekripsi: {e}")
 
+    with tab_txt_file:
+        st.markdown("File teks UTF-8 (log, korpus) diproses **per chunk**: memori tetap, hasil identik dengan mode teks di atas.")
+        ftxt = st.file_uploader("Pilih file teks (UTF-8)", type=None, key="text_file")
+        txt_op = st.radio("Operasi", ["Enkripsi", "Dekripsi"], horizontal=True, key="text_file_op")
+        txt_decrypt = txt_op == "Dekripsi"
+        if st.button("▶️ Proses File Teks", key="text_file_btn"):
+            if ftxt is None:
+                st.warning("Silakan upload file teks terlebih dahulu.")
+            elif not key_input_text:
+                st.warning("Key tidak boleh kosong.")
+            else:
+                st.session_state["text_job"] = submit_text(ftxt, key_input_text, txt_decrypt, keep_non).id
+
+        txt_job = session_job("text_job", (upload_digest(ftxt), key_digest(key_input_text),
+                                           f"{'text_decrypt' if txt_decrypt else 'text_encrypt'}:{int(keep_non)}")
+                              if ftxt is not None and key_input_text else None)
+        if txt_job is not None and txt_job.is_active:
+            job_progress(txt_job.id)
+        elif txt_job is not None and txt_job.status == "done":
+            collect_job_metrics(txt_job)
+            tout, tinfo = txt_job.result
+            base = ftxt.name[:-4] if ftxt.name.endswith(".vig") else ftxt.name
+            st.success(f"Selesai: {tinfo['chars']:,} karakter · {tinfo['bytes_out']:,} byte ({txt_job.elapsed:.2f} s)")
+            st.markdown("**Awal hasil**")
+            st.code(tinfo["head"].decode("utf-8", errors="ignore"))
+            st.download_button("💾 Download Hasil", data=lazy_download(tout), mime="text/plain",
+                               file_name=("decrypted_" + base) if txt_decrypt else (ftxt.name + ".vig"))
+        elif txt_job is not None and txt_job.status == "error":
+            st.error(f"Gagal memproses file teks: {txt_job.error}")
+        elif txt_job is not None:
+            st.warning("Proses file teks dibatalkan.")
+
 # ==============================
 # MODE FILE
 # ==============================
@@ -302,10 +471,12 @@ else:
                 <div class="muted">Kekuatan Key</div>
                 <div style="font-size:1.15rem; font-weight:800; color:{level_color}">{kinfo['level'].upper()}</div>
                 <div class="muted">Entropi ≈ {kinfo['entropy_bits']:.1f} bit</div>
+                <div class="muted">Waktu bobol {format_break_time(cached_break_time(keyf, "bytes") if keyf else None)}</div>
             </div>
             """, unsafe_allow_html=True)
 
-    tab_enc_f, tab_dec_f, tab_examples, tab_compare = st.tabs(["🔒 Enkripsi File", "🔓 Dekripsi File", "📦 Contoh File", "🆚 Compare Mode"])
+    tab_enc_f, tab_dec_f, tab_batch, tab_local, tab_examples, tab_compare = st.tabs(
+        ["🔒 Enkripsi File", "🔓 Dekripsi File", "🗂️ Batch", "💽 File Lokal", "📦 Contoh File", "🆚 Compare Mode"])
 
     # -------- ENKRIPSI --------
     with tab_enc_f:
@@ -319,18 +490,21 @@ else:
             rename_opt = st.checkbox("Bersihkan nama (.enc): ganti spasi & hapus ( )", value=False)
 
         if f is not None and show_preview:
-            data0 = f.getvalue()
-            e0 = shannon_entropy(data0)
+            st0 = cached_stats(f)
+            e0 = st0.entropy
             a, b, c = st.columns([1,1,2])
             with a:
                 st.markdown('<div class="soft-card"><h4>Info Asli</h4><div class="muted">Size</div><div class="kpi">'
-                            f'{len(data0)}</div><div class="muted">SHA-256</div><div class="kpi">{sha256(data0)[:16]}…</div></div>', unsafe_allow_html=True)
+                            f'{st0.size}</div><div class="muted">SHA-256</div><div class="kpi">{st0.sha256[:16]}…</div></div>', unsafe_allow_html=True)
             with b:
                 st.markdown(f'<div class="soft-card"><h4>Entropy Asli</h4><div class="kpi">{e0:.3f}</div><div class="muted">maks 8</div></div>', unsafe_allow_html=True)
             with c:
                 st.markdown('<div class="soft-card"><h4>64 byte pertama (hex)</h4>', unsafe_allow_html=True)
-                st.markdown(f'<div class="hexbox">{hex_preview(data0, 64)}</div>', unsafe_allow_html=True)
+                st.markdown(f'<div class="hexbox">{cached_hex(upload_digest(f), st0.head, 64)}</div>', unsafe_allow_html=True)
                 st.markdown('</div>', unsafe_allow_html=True)
+        if f is not None:
+            with st.expander("🔍 Hex viewer (file asli)"):
+                hex_viewer("hx_enc", f, upload_digest(f), f.size)
 
         if st.button("🔒 Enkripsi Sekarang"):
             if f is None:
@@ -338,62 +512,97 @@ else:
             elif not keyf:
                 st.warning("Key tidak boleh kosong.")
             else:
-                try:
-                    data = f.getvalue()
-                    cipher = vigenere_encrypt_bytes(data, keyf)
-                    out_name = f.name + ".enc"
-                    if rename_opt:
-                        out_name = clean_filename(out_name, remove_spaces=True)
-
-                    st.session_state["last_original_name"] = f.name
-                    st.session_state["last_encrypted_name"] = out_name
-
-                    e1 = shannon_entropy(cipher)
-                    s1, s2, s3 = st.columns([1,1,2])
-                    with s1:
-                        st.markdown('<div class="soft-card"><h4>Info Cipher</h4><div class="muted">Size</div>'
-                                    f'<div class="kpi">{len(cipher)}</div><div class="muted">SHA-256</div>'
-                                    f'<div class="kpi">{sha256(cipher)[:16]}…</div></div>', unsafe_allow_html=True)
-                    with s2:
-                        st.markdown(f'<div class="soft-card"><h4>Entropy Cipher</h4><div class="kpi">{e1:.3f}</div></div>', unsafe_allow_html=True)
-                    with s3:
-                        st.markdown('<div class="soft-card"><h4>64 byte pertama Cipher (hex)</h4>', unsafe_allow_html=True)
-                        st.markdown(f'<div class="hexbox">{hex_preview(cipher, 64)}</div>', unsafe_allow_html=True)
-                        st.markdown('</div>', unsafe_allow_html=True)
-
-                    st.success("File berhasil dienkripsi!")
-                    st.download_button("💾 Download File Terenkripsi (.enc)", data=cipher,
-                                       file_name=out_name, mime="application/octet-stream")
-                    st.info(f"Nama asli disimpan: `{f.name}` → otomatis dipakai sebagai prefill di tab Dekripsi.", icon="💡")
-                except Exception as e:
-                    st.error(f"Gagal enkripsi file: {e}")
+                st.session_state["enc_job"] = submit_encrypt(f, keyf).id
+
+        enc_job = session_job("enc_job", (upload_digest(f), key_digest(keyf), "encrypt") if f is not None and keyf else None)
+        if enc_job is not None and enc_job.is_active:
+            job_progress(enc_job.id)
+        elif enc_job is not None and enc_job.status == "done":
+            collect_job_metrics(enc_job)
+            try:
+                cipher, cinfo = enc_job.result
+                out_name = f.name + ".enc"
+                if rename_opt:
+                    out_name = clean_filename(out_name, remove_spaces=True)
+
+                st.session_state["last_original_name"] = f.name
+                st.session_state["last_encrypted_name"] = out_name
+
+                e1 = cinfo.entropy
+                s1, s2, s3 = st.columns([1,1,2])
+                with s1:
+                    st.markdown('<div class="soft-card"><h4>Info Cipher</h4><div class="muted">Size</div>'
+                                f'<div class="kpi">{cinfo.size}</div><div class="muted">SHA-256</div>'
+                                f'<div class="kpi">{cinfo.sha256[:16]}…</div></div>', unsafe_allow_html=True)
+                with s2:
+                    st.markdown(f'<div class="soft-card"><h4>Entropy Cipher</h4><div class="kpi">{e1:.3f}</div></div>', unsafe_allow_html=True)
+                with s3:
+                    st.markdown('<div class="soft-card"><h4>64 byte pertama Cipher (hex)</h4>', unsafe_allow_html=True)
+                    st.markdown(f'<div class="hexbox">{cached_hex(upload_digest(f) + ":enc:" + key_digest(keyf), cinfo.head, 64)}</div>', unsafe_allow_html=True)
+                    st.markdown('</div>', unsafe_allow_html=True)
+
+                st.success(f"File berhasil dienkripsi! ({enc_job.elapsed:.2f} s)")
+                st.download_button("💾 Download File Terenkripsi (.enc)", data=lazy_download(cipher),
+                                   file_name=out_name, mime="application/octet-stream")
+                st.info(f"Nama asli disimpan di header .enc: `{f.name}` → otomatis dipakai sebagai prefill di tab Dekripsi.", icon="💡")
+            except Exception as e:
+                st.error(f"Gagal enkripsi file: {e}")
+        elif enc_job is not None and enc_job.status == "error":
+            st.error(f"Gagal enkripsi file: {enc_job.error}")
+        elif enc_job is not None:
+            st.warning("Enkripsi dibatalkan.")
 
     # -------- DEKRIPSI --------
     with tab_dec_f:
         st.markdown("**Upload file terenkripsi (.enc)** untuk didekripsi")
         fenc = st.file_uploader("Pilih file terenkripsi .enc", type=None, key="dec_file")
 
+        try:
+            fmeta = cached_container(fenc) if fenc is not None else None
+        except ValueError as e:
+            st.error(str(e)); fmeta = None
         colh1, colh2 = st.columns([2,1])
         with colh1:
-            default_hint = st.session_state.get("last_original_name", "")
+            default_hint = (fmeta or {}).get("name") or st.session_state.get("last_original_name", "")
             hint = st.text_input("Nama file asli (opsional – untuk mengembalikan ekstensi)", value=default_hint, placeholder="misal: gambar.png")
         with colh2:
             show_preview_dec = st.checkbox("Preview 64B & info cipher", value=True, key="pv_dec")
+            verify_level = st.selectbox("Level verifikasi", list(VERIFY_LEVELS), format_func=VERIFY_LEVELS.get, key="verify_level")
 
         if fenc is not None and show_preview_dec:
-            enc0 = fenc.getvalue()
-            e0 = shannon_entropy(enc0)
+            st0 = cached_stats(fenc)
+            e0 = st0.entropy
             a, b, c = st.columns([1,1,2])
             with a:
                 st.markdown('<div class="soft-card"><h4>Info Cipher (Input)</h4><div class="muted">Size</div>'
-                            f'<div class="kpi">{len(enc0)}</div><div class="muted">SHA-256</div>'
-                            f'<div class="kpi">{sha256(enc0)[:16]}…</div></div>', unsafe_allow_html=True)
+                            f'<div class="kpi">{st0.size}</div><div class="muted">SHA-256</div>'
+                            f'<div class="kpi">{st0.sha256[:16]}…</div></div>', unsafe_allow_html=True)
             with b:
                 st.markdown(f'<div class="soft-card"><h4>Entropy Cipher</h4><div class="kpi">{e0:.3f}</div></div>', unsafe_allow_html=True)
             with c:
                 st.markdown('<div class="soft-card"><h4>64 byte pertama Cipher (hex)</h4>', unsafe_allow_html=True)
-                st.markdown(f'<div class="hexbox">{hex_preview(enc0, 64)}</div>', unsafe_allow_html=True)
+                st.markdown(f'<div class="hexbox">{cached_hex(upload_digest(fenc), st0.head, 64)}</div>', unsafe_allow_html=True)
                 st.markdown('</div>', unsafe_allow_html=True)
+                if fmeta is not None and keyf:
+                    # container: 64 byte pertama plaintext didekripsi langsung (O(64))
+                    head_plain = decrypt_range(fenc, keyf, 0, 64, fmeta)
+                    st.markdown('<div class="soft-card"><h4>64 byte pertama Plain (hex)</h4>', unsafe_allow_html=True)
+                    st.markdown(f'<div class="hexbox">{cached_hex(upload_digest(fenc) + ":dec:" + key_digest(keyf), head_plain, 64)}</div>', unsafe_allow_html=True)
+                    st.markdown('</div>', unsafe_allow_html=True)
+            if fmeta is not None:
+                st.caption(f"Container .enc v{fmeta['version']} · plaintext {fmeta['size']} byte"
+                           + (f" · nama asli `{fmeta['name']}`" if fmeta.get("name") else ""))
+        if fenc is not None:
+            with st.expander("🔍 Hex viewer (.enc)"):
+                view_plain = st.checkbox("Dekripsi saat dilihat (tampilkan plaintext)", value=False,
+                                         disabled=not keyf, key="hx_dec_plain")
+                if view_plain and keyf and fmeta is not None and fmeta["key_fp"] != key_schedule(keyf).fingerprint:
+                    st.warning("Key tidak cocok dengan container .enc; menampilkan ciphertext.")
+                    view_plain = False
+                if view_plain and keyf:
+                    hex_viewer("hx_dec", fenc, upload_digest(fenc), fmeta["size"] if fmeta else fenc.size, keyf, fmeta)
+                else:
+                    hex_viewer("hx_dec", fenc, upload_digest(fenc), fenc.size)
 
         if st.button("🔓 Dekripsi Sekarang"):
             if fenc is None:
@@ -401,41 +610,166 @@ else:
             elif not keyf:
                 st.warning("Key tidak boleh kosong.")
             else:
-                try:
-                    enc = fenc.getvalue()
-                    plain = vigenere_decrypt_bytes(enc, keyf)
-
-                    if hint.strip():
-                        out_name = "decrypted_" + hint.strip()
+                st.session_state["dec_job"] = submit_decrypt(fenc, keyf, verify_level).id
+
+        dec_job = session_job("dec_job", (upload_digest(fenc), key_digest(keyf), "decrypt:" + verify_level)
+                              if fenc is not None and keyf else None)
+        if dec_job is not None and dec_job.is_active:
+            job_progress(dec_job.id)
+        elif dec_job is not None and dec_job.status == "done":
+            collect_job_metrics(dec_job)
+            try:
+                plain, pinfo, pmeta, (ok, used_level) = dec_job.result
+
+                if hint.strip():
+                    out_name = "decrypted_" + hint.strip()
+                else:
+                    base = fenc.name[:-4] if fenc.name.endswith(".enc") else fenc.name
+                    out_name = "decrypted_" + base
+
+                x1, x2, x3 = st.columns([1,1,2])
+                with x1:
+                    st.markdown('<div class="soft-card"><h4>Info Plain (Output)</h4><div class="muted">Size</div>'
+                                f'<div class="kpi">{pinfo.size}</div><div class="muted">SHA-256</div>'
+                                f'<div class="kpi">{pinfo.sha256[:16]}…</div></div>', unsafe_allow_html=True)
+                with x2:
+                    if used_level == "key":
+                        msg = "❌ Key TIDAK cocok"
                     else:
-                        base = fenc.name[:-4] if fenc.name.endswith(".enc") else fenc.name
-                        out_name = "decrypted_" + base
-
-                    recheck = vigenere_encrypt_bytes(plain, keyf)
-                    ok = (recheck == enc)
-
-                    x1, x2, x3 = st.columns([1,1,2])
-                    with x1:
-                        st.markdown('<div class="soft-card"><h4>Info Plain (Output)</h4><div class="muted">Size</div>'
-                                    f'<div class="kpi">{len(plain)}</div><div class="muted">SHA-256</div>'
-                                    f'<div class="kpi">{sha256(plain)[:16]}…</div></div>', unsafe_allow_html=True)
-                    with x2:
-                        msg = "✅ Re-encrypt cocok" if ok else "❌ Re-encrypt TIDAK cocok"
-                        color = ACCENT["good"] if ok else ACCENT["bad"]
-                        st.markdown(f'<div class="soft-card"><h4>Verifikasi</h4><div class="kpi" style="color:{color}">{msg}</div></div>', unsafe_allow_html=True)
-                    with x3:
-                        st.markdown('<div class="soft-card"><h4>64 byte pertama Plain (hex)</h4>', unsafe_allow_html=True)
-                        st.markdown(f'<div class="hexbox">{hex_preview(plain, 64)}</div>', unsafe_allow_html=True)
-                        st.markdown('</div>', unsafe_allow_html=True)
-
-                    st.success("File berhasil didekripsi!" if ok else "Dekripsi selesai, namun verifikasi ulang gagal.")
-                    st.download_button("💾 Download File Hasil Dekripsi", data=plain,
-                                       file_name=out_name, mime="application/octet-stream")
-
-                    if not hint.strip():
-                        st.info("Isi kolom **Nama file asli** agar ekstensi kembali seperti semula (misal `.pdf`, `.png`).", icon="💡")
+                        msg = ("✅ " if ok else "❌ ") + VERIFY_LEVELS[used_level] + (" cocok" if ok else " TIDAK cocok")
+                    color = ACCENT["good"] if ok else ACCENT["bad"]
+                    st.markdown(f'<div class="soft-card"><h4>Verifikasi</h4><div class="kpi" style="color:{color}">{msg}</div></div>', unsafe_allow_html=True)
+                    if pmeta is None and verify_level == "header":
+                        st.caption("File .enc lama tanpa trailer → memakai verifikasi sampel.")
+                with x3:
+                    st.markdown('<div class="soft-card"><h4>64 byte pertama Plain (hex)</h4>', unsafe_allow_html=True)
+                    st.markdown(f'<div class="hexbox">{cached_hex(upload_digest(fenc) + ":dec:" + key_digest(keyf), pinfo.head, 64)}</div>', unsafe_allow_html=True)
+                    st.markdown('</div>', unsafe_allow_html=True)
+
+                st.success("File berhasil didekripsi!" if ok else "Dekripsi selesai, namun verifikasi ulang gagal.")
+                st.download_button("💾 Download File Hasil Dekripsi", data=lazy_download(plain),
+                                   file_name=out_name, mime="application/octet-stream")
+
+                if not hint.strip():
+                    st.info("Isi kolom **Nama file asli** agar ekstensi kembali seperti semula (misal `.pdf`, `.png`).", icon="💡")
+            except Exception as e:
+                st.error(f"Gagal dekripsi file: {e}")
+        elif dec_job is not None and dec_job.status == "error":
+            st.error(f"Gagal dekripsi file: {dec_job.error}")
+        elif dec_job is not None:
+            st.warning("Dekripsi dibatalkan.")
+
+    # -------- BATCH --------
+    with tab_batch:
+        st.markdown("**Upload banyak file** untuk dienkripsi sekaligus → satu `.zip` berisi file `.enc`")
+        fbatch = st.file_uploader("Pilih file (bisa banyak)", type=None, accept_multiple_files=True, key="batch_files")
+        n_workers = st.slider("Jumlah worker", min_value=1, max_value=max(2, os.cpu_count() or 1),
+                              value=BATCH_WORKERS, step=1, key="batch_workers")
+
+        if st.button("🔒 Enkripsi Semua"):
+            if not fbatch:
+                st.warning("Silakan upload file terlebih dahulu.")
+            elif not keyf:
+                st.warning("Key tidak boleh kosong.")
+            else:
+                try:
+                    with track("encrypt_batch", sum(x.size for x in fbatch), files=len(fbatch)):
+                        bar = st.progress(0.0, text="Memulai…")
+                        def on_progress(done, total, rec):
+                            speed = f"{rec['mb_s']:.1f} MB/s" if rec["ok"] else "gagal"
+                            bar.progress(done / total, text=f"{done}/{total} · {rec['name']} · {speed}")
+                        zip_out, results = encrypt_batch_to_tempzip(items_from_uploads(fbatch), keyf,
+                                                                   workers=n_workers, on_progress=on_progress)
+                        st.dataframe([{"File": r["name"], "Size": r["size"], "Size .enc": r.get("enc_size"),
+                                       "Detik": round(r.get("seconds", 0.0), 3), "MB/s": round(r.get("mb_s", 0.0), 1),
+                                       "Status": "✅" if r["ok"] else f"❌ {r['error']}"} for r in results],
+                                     use_container_width=True)
+                        n_ok = sum(r["ok"] for r in results)
+                        st.success(f"{n_ok}/{len(results)} file berhasil dienkripsi.")
+                        st.download_button("💾 Download Semua (.zip)", data=lazy_download(zip_out),
+                                           file_name="vigivault_batch.zip", mime="application/zip")
                 except Exception as e:
-                    st.error(f"Gagal dekripsi file: {e}")
+                    st.error(f"Gagal enkripsi batch: {e}")
+
+    # -------- FILE LOKAL (mmap) --------
+    with tab_local:
+        if not LOCAL_ROOT:
+            st.info("Mode file lokal nonaktif. Set env `VIGIVAULT_LOCAL_ROOT` ke direktori data di host ini "
+                    "untuk memproses file langsung dari disk (mmap, tanpa upload/download).", icon="💽")
+        else:
+            st.markdown(f"Proses file yang sudah ada di host (di bawah `{LOCAL_ROOT}`) lewat **mmap**: "
+                        "tanpa salinan di memori, I/O ditangani page cache OS.")
+            lc1, lc2 = st.columns([3,1])
+            with lc1:
+                local_rel = st.text_input("Path file (relatif terhadap root)", placeholder="misal: arsip/data.tar", key="local_path")
+            with lc2:
+                local_op = st.radio("Operasi", ["Enkripsi", "Dekripsi"], horizontal=True, key="local_op")
+            in_place = st.checkbox("In-place: timpa file sumber lalu rename (+/− .enc). Tidak atomik — jangan dihentikan di tengah.",
+                                   value=False, key="local_in_place")
+
+            if st.button("💽 Proses File Lokal"):
+                if not local_rel.strip():
+                    st.warning("Isi path file terlebih dahulu.")
+                elif not keyf:
+                    st.warning("Key tidak boleh kosong.")
+                else:
+                    try:
+                        src = local_path(local_rel.strip())
+                        if not os.path.isfile(src):
+                            raise FileNotFoundError(f"File tidak ditemukan: {local_rel}")
+                        base = os.path.basename(src)
+                        if local_op == "Enkripsi":
+                            dst = src + ".enc"
+                        elif in_place:
+                            dst = src[:-4] if src.endswith(".enc") else src
+                        else:
+                            dst = os.path.join(os.path.dirname(src), "decrypted_" + (base[:-4] if base.endswith(".enc") else base))
+                        if dst != src and os.path.exists(dst):
+                            raise FileExistsError(f"Output sudah ada: {os.path.relpath(dst, LOCAL_ROOT)}")
+                        with track("local_" + ("encrypt" if local_op == "Enkripsi" else "decrypt"),
+                                   os.path.getsize(src), file=base, in_place=in_place):
+                            if local_op == "Enkripsi":
+                                lstats = encrypt_file(src, keyf, None if in_place else dst)
+                                ok = True
+                            else:
+                                lstats, lmeta = decrypt_file(src, keyf, None if in_place else dst)
+                                ok = lmeta is None or (lmeta["size"] == lstats.size and lmeta["sha256"] == lstats.sha256)
+                            if in_place and dst != src:
+                                os.replace(src, dst)
+                        l1, l2 = st.columns([1,1])
+                        with l1:
+                            st.markdown('<div class="soft-card"><h4>Output</h4><div class="muted">Size</div>'
+                                        f'<div class="kpi">{lstats.size}</div><div class="muted">SHA-256</div>'
+                                        f'<div class="kpi">{lstats.sha256[:16]}…</div></div>', unsafe_allow_html=True)
+                        with l2:
+                            st.markdown(f'<div class="soft-card"><h4>Entropy Output</h4><div class="kpi">{lstats.entropy:.3f}</div></div>', unsafe_allow_html=True)
+                        rel_out = os.path.relpath(dst, LOCAL_ROOT)
+                        if ok:
+                            st.success(f"Selesai → `{rel_out}`")
+                        else:
+                            st.error(f"Dekripsi selesai → `{rel_out}`, namun SHA-256 tidak cocok dengan trailer.")
+                    except Exception as e:
+                        st.error(f"Gagal memproses file lokal: {e}")
+
+            if local_rel.strip():
+                with st.expander("🔍 Hex viewer (file lokal)"):
+                    try:
+                        lpath = local_path(local_rel.strip())
+                        if not os.path.isfile(lpath):
+                            raise FileNotFoundError(f"File tidak ditemukan: {local_rel}")
+                        lst = os.stat(lpath)
+                        lcid = f"local:{lpath}:{lst.st_mtime_ns}:{lst.st_size}"
+                        with open(lpath, "rb") as lfh:
+                            lmeta = get_result_cache().get_or_compute((lcid, None, "container"), lambda: read_container(lfh),
+                                                                      cost=lambda v: len(v["index"]) + 256 if v else 1)
+                            lplain = (lmeta is not None and keyf and lmeta["key_fp"] == key_schedule(keyf).fingerprint
+                                      and st.checkbox("Dekripsi saat dilihat (tampilkan plaintext)", value=True, key="hx_local_plain"))
+                            if lplain:
+                                hex_viewer("hx_local", lfh, lcid, lmeta["size"], keyf, lmeta)
+                            else:
+                                hex_viewer("hx_local", lfh, lcid, lst.st_size)
+                    except Exception as e:
+                        st.error(f"Gagal membaca file lokal: {e}")
 
     # -------- CONTOH FILE --------
     with tab_examples:
@@ -475,34 +809,92 @@ else:
         with c1:  fa = st.file_uploader("File A", type=None, key="cmp_a")
         with c2:  fb = st.file_uploader("File B", type=None, key="cmp_b")
 
+        cmp1, cmp2 = st.columns(2)
+        with cmp1:
+            want_regions = st.checkbox("Laporkan semua rentang berbeda (pindai penuh)", value=False, key="cmp_regions")
+        with cmp2:
+            want_hash = st.checkbox("Hitung SHA-256 kedua file", value=False, key="cmp_hash")
+
+        pair_id = upload_digest(fa) + "|" + upload_digest(fb) if fa and fb else None
         if st.button("🔎 Compare"):
             if not fa or not fb:
                 st.warning("Unggah kedua file terlebih dahulu.")
             else:
-                A = fa.getvalue(); B = fb.getvalue(); same = (A == B)
-                ca, cb, cc = st.columns([1,1,2])
-                with ca:
-                    st.markdown('<div class="soft-card"><h4>File A</h4>'
-                                f'<div class="muted">Size</div><div class="kpi">{len(A)}</div>'
-                                f'<div class="muted">SHA-256</div><div class="kpi">{sha256(A)[:16]}…</div></div>', unsafe_allow_html=True)
-                with cb:
-                    st.markdown('<div class="soft-card"><h4>File B</h4>'
-                                f'<div class="muted">Size</div><div class="kpi">{len(B)}</div>'
-                                f'<div class="muted">SHA-256</div><div class="kpi">{sha256(B)[:16]}…</div></div>', unsafe_allow_html=True)
-                with cc:
-                    if same:
-                        st.success("✅ IDENTIK (byte-by-byte sama).")
-                    else:
-                        st.error("❌ BERBEDA.")
-                        first_diff = next((i for i in range(min(len(A), len(B))) if A[i] != B[i]), None)
-                        if first_diff is not None:
-                            st.info(f"Byte pertama yang berbeda pada offset: `{first_diff}`")
-                        st.markdown('<div class="soft-card"><h4>Preview A (64B)</h4>', unsafe_allow_html=True)
-                        st.markdown(f'<div class="hexbox">{hex_preview(A, 64)}</div>', unsafe_allow_html=True)
-                        st.markdown('</div>', unsafe_allow_html=True)
-                        st.markdown('<div class="soft-card"><h4>Preview B (64B)</h4>', unsafe_allow_html=True)
-                        st.markdown(f'<div class="hexbox">{hex_preview(B, 64)}</div>', unsafe_allow_html=True)
-                        st.markdown('</div>', unsafe_allow_html=True)
+                with track("compare", fa.size + fb.size, regions=want_regions):
+                    res = cached_compare(fa, fb, want_regions)
+                    same = res["identical"]
+                    ca, cb, cc = st.columns([1,1,2])
+                    for col, label, fx in ((ca, "File A", fa), (cb, "File B", fb)):
+                        with col:
+                            digest = f'{cached_stats(fx).sha256[:16]}…' if want_hash else "—"
+                            st.markdown(f'<div class="soft-card"><h4>{label}</h4>'
+                                        f'<div class="muted">Size</div><div class="kpi">{fx.size}</div>'
+                                        f'<div class="muted">SHA-256</div><div class="kpi">{digest}</div></div>', unsafe_allow_html=True)
+                    with cc:
+                        if same:
+                            st.success("✅ IDENTIK (byte-by-byte sama).")
+                        else:
+                            st.error("❌ BERBEDA.")
+                            st.info(f"Byte pertama yang berbeda pada offset: `{res['first_diff']}` "
+                                    f"(`{res['first_diff']:#x}`) → hex viewer di bawah sudah diarahkan ke sana.")
+                            st.session_state["cmp_first_diff"] = (pair_id, res["first_diff"])
+                            hex_jump("hx_cmp_a", res["first_diff"]); hex_jump("hx_cmp_b", res["first_diff"])
+                            if res["regions"] is not None:
+                                st.markdown(f"**{res['diff_bytes']}** byte berbeda (**{res['percent']:.4f}%**) "
+                                            f"dalam {len(res['regions'])}{'+' if res['regions_truncated'] else ''} rentang.")
+                                st.dataframe([{"Awal": s0, "Akhir (eksklusif)": e0, "Panjang": e0 - s0}
+                                              for s0, e0 in res["regions"]], use_container_width=True, height=200)
+                            for label, fx in (("A", fa), ("B", fb)):
+                                fx.seek(0); head = fx.read(64); fx.seek(0)
+                                st.markdown(f'<div class="soft-card"><h4>Preview {label} (64B)</h4>', unsafe_allow_html=True)
+                                st.markdown(f'<div class="hexbox">{hex_preview(head, 64)}</div>', unsafe_allow_html=True)
+                                st.markdown('</div>', unsafe_allow_html=True)
+
+        if pair_id is not None:
+            with st.expander("🔍 Hex viewer A / B", expanded="cmp_first_diff" in st.session_state):
+                known = st.session_state.get("cmp_first_diff")
+                if known is not None and known[0] == pair_id and known[1] is not None:
+                    if st.button(f"⤵️ Lompat ke byte berbeda pertama ({known[1]:#x})", key="hx_cmp_jump"):
+                        hex_jump("hx_cmp_a", known[1]); hex_jump("hx_cmp_b", known[1])
+                va, vb = st.columns(2)
+                with va:
+                    st.markdown("**File A**")
+                    hex_viewer("hx_cmp_a", fa, upload_digest(fa), fa.size)
+                with vb:
+                    st.markdown("**File B**")
+                    hex_viewer("hx_cmp_b", fb, upload_digest(fb), fb.size)
+
+# ==============================
+# CACHE & JOB STATUS (sidebar)
+# ==============================
+_cs = get_result_cache().stats()
+_js = get_job_queue().stats()
+cache_box.caption(f"🧠 Cache: {_cs['hits']} hit · {_cs['misses']} miss · "
+                  f"{_cs['entries']} entri · {_cs['bytes'] / (1 << 20):.1f} MB  \n"
+                  f"⏳ Job: {_js['running']} jalan · {_js['queued']} antre · {_js['done']} selesai")
+
+# ==============================
+# METRICS PANEL (sidebar)
+# ==============================
+_runs = st.session_state.get("metrics", [])
+with metrics_box.container():
+    if not _runs:
+        st.caption("Belum ada operasi yang diukur.")
+    else:
+        _last = _runs[-1]
+        _speed = f" · {_last['mb_s']:.1f} MB/s" if _last["mb_s"] else ""
+        _alloc = f" · alloc {_last['peak_alloc_mb']:.1f} MB" if _last["peak_alloc_mb"] is not None else ""
+        st.caption(f"**{_last['op']}** · {_last['seconds']:.3f} s{_speed} · RSS {_last['peak_rss_mb']:.0f} MB{_alloc}"
+                   + (f" · ❌ {_last['error']}" if _last.get("error") else ""))
+        st.dataframe([{"Tahap": name, "Detik": round(v["seconds"], 4),
+                       "%": round(100 * v["seconds"] / _last["seconds"], 1) if _last["seconds"] else 0.0,
+                       "MB/s": round(v["mb_s"], 1) if v["mb_s"] else None, "Panggilan": v["calls"]}
+                      for name, v in sorted(_last["stages"].items(), key=lambda kv: -kv[1]["seconds"])],
+                     use_container_width=True, hide_index=True)
+        if _last.get("profile"):
+            st.code(_last["profile"], language=None)
+        st.download_button("⬇️ Metrics (.jsonl)", data=to_jsonl(_runs), file_name="vigivault_metrics.jsonl",
+                           mime="application/x-ndjson", key="dl_metrics")
 
 # ==============================
 # FOOTER
@@ -511,5 +903,5 @@ st.markdown("---")
 st.caption(
     "Mode TEKS: E(x)=(x+K) mod 26, D(x)=(x−K) mod 26, hanya huruf A–Z diproses. "
     "Mode FILE: adaptasi byte-wise (0–255) untuk semua tipe data. "
-    "Simpan hasil enkripsi sebagai .enc (biner). Saat dekripsi, isi 'Nama file asli' agar ekstensi kembali."
+    "Simpan hasil enkripsi sebagai .enc (biner). Nama file asli tersimpan di header .enc; untuk .enc lama, isi 'Nama file asli' agar ekstensi kembali."
 )
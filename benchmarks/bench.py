@@ -0,0 +1,198 @@
+"""Benchmark VigiVault: throughput, persentil latensi, dan memori per jalur cipher/stats.
+
+Contoh:
+    python benchmarks/bench.py                                   # default: 1M & 16M, semua case
+    python benchmarks/bench.py --sizes 64M --data random,zeros --cases bytes_encrypt,entropy
+    python benchmarks/bench.py --out hasil.json --save-baseline  # simpan baseline lokal
+    python benchmarks/bench.py --baseline benchmarks/baseline.json --threshold 0.15
+
+Data dibangkitkan deterministik dari --seed. Tiap case dipanaskan sekali, lalu
+diukur --repeat kali; MB/s dihitung dari median. Peak alokasi per case diukur
+dengan tracemalloc pada satu run terpisah (NumPy melaporkan alokasinya ke
+tracemalloc), peak RSS adalah maksimum proses sampai case tersebut selesai.
+Jika --baseline diberikan, case yang MB/s-nya turun lebih dari --threshold
+ditandai REGRESI dan exit code menjadi 1.
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from vigivault import bytewise, classic, compare, container, hexview, stats, utils  # noqa: E402
+from vigivault.metrics import peak_rss_mb  # noqa: E402
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+HEX_BENCH_PAGE = hexview.HEX_PAGES[-1]   # page terbesar hex viewer
+WORDS = ("the quick brown fox jumps over lazy dog vigenere cipher kunci rahasia data file "
+         "teks enkripsi dekripsi 2025 OMEGA, LEMON. Lorem ipsum dolor sit amet!").split()
+
+
+def parse_size(s: str) -> int:
+    s = s.strip().upper()
+    mult = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30}.get(s[-1:], 1)
+    return int(float(s[:-1] if s[-1:] in "KMG" else s) * mult)
+
+
+def make_data(kind: str, size: int, seed: int) -> bytes:
+    rng = np.random.default_rng(seed)
+    if kind == "random":
+        return rng.integers(0, 256, size, dtype=np.uint8).tobytes()
+    if kind == "zeros":
+        return bytes(size)
+    if kind == "text":
+        idx = rng.integers(0, len(WORDS), size // 4 + 1)
+        text = " ".join(WORDS[i] for i in idx.tolist())
+        return text.encode("ascii")[:size].ljust(size, b" ")
+    raise ValueError(f"jenis data tidak dikenal: {kind}")
+
+
+def make_key(n: int, seed: int) -> str:
+    rng = np.random.default_rng(seed + 1)
+    return "".join(chr(c) for c in rng.integers(65, 91, n).tolist())
+
+
+# Tiap case: fungsi(data, key) -> callable tanpa argumen yang diukur.
+def _cases(data: bytes, key: str) -> dict:
+    # classic butuh str; byte dipetakan ke ASCII (Latin-1 memuat "ß" yang ditolak engine)
+    text = (np.frombuffer(data, dtype=np.uint8) & 0x7F).tobytes().decode("ascii")
+    enc = bytewise.vigenere_encrypt_bytes(data, key)
+    other = bytearray(data)
+    if other:
+        other[-1] ^= 1
+    other = bytes(other)
+    return {
+        "bytes_encrypt": lambda: bytewise.vigenere_encrypt_bytes(data, key),
+        "bytes_decrypt": lambda: bytewise.vigenere_decrypt_bytes(enc, key),
+        "bytes_encrypt_parallel": lambda: bytewise.vigenere_encrypt_bytes_parallel(data, key),
+        "bytes_stream": lambda: sum(len(c) for c in bytewise.iter_encrypt_bytes(
+            utils.iter_file_chunks(io.BytesIO(data), 1 << 20), key)),
+        "classic_encrypt": lambda: classic.vigenere_encrypt_classic(text, key),
+        "classic_decrypt": lambda: classic.vigenere_decrypt_classic(text, key),
+        "entropy": lambda: stats.shannon_entropy(data),
+        "filestats": lambda: stats.FileStats.of_stream(io.BytesIO(data)),
+        "sha256": lambda: utils.sha256(data),
+        # seluruh buffer diformat per page viewer, jadi MB/s = byte yang benar-benar diformat
+        "hex_format": lambda: [hexview.format_hex(data[i:i + HEX_BENCH_PAGE], i)
+                               for i in range(0, len(data), HEX_BENCH_PAGE)],
+        "container_encrypt": lambda: container.encrypt_to(io.BytesIO(data), io.BytesIO(), key),
+        "compare": lambda: compare.compare_streams(io.BytesIO(data), io.BytesIO(other), regions=True),
+        # referensi pure-Python: hanya jika diminta lewat --cases (sangat lambat)
+        "bytes_encrypt_ref": lambda: bytewise.vigenere_encrypt_bytes_ref(data, key),
+        "classic_encrypt_ref": lambda: classic.vigenere_encrypt_classic_ref(text, key),
+    }
+
+
+DEFAULT_CASES = [c for c in _cases(b"", "K") if not c.endswith("_ref")]
+
+
+def run_case(fn, size: int, repeat: int) -> dict:
+    fn()  # warm-up
+    lat = []
+    for _ in range(repeat):
+        t0 = time.perf_counter(); fn(); lat.append(time.perf_counter() - t0)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    lat_ms = np.array(lat) * 1000
+    med = float(np.median(lat))
+    return {"mb_s": (size / (1 << 20)) / med if med > 0 else float("inf"),
+            "p50_ms": float(np.percentile(lat_ms, 50)), "p90_ms": float(np.percentile(lat_ms, 90)),
+            "p99_ms": float(np.percentile(lat_ms, 99)), "min_ms": float(lat_ms.min()),
+            "peak_alloc_mb": peak / (1 << 20), "peak_rss_mb": peak_rss_mb()}
+
+
+def case_id(r: dict) -> tuple:
+    return (r["case"], r["size"], r["key_len"], r["data"])
+
+
+def compare_baseline(results: list, baseline: dict, threshold: float) -> list:
+    base = {case_id(r): r for r in baseline.get("results", [])}
+    flagged = []
+    for r in results:
+        b = base.get(case_id(r))
+        if b is None:
+            r["vs_baseline"] = None; continue
+        ratio = r["mb_s"] / b["mb_s"] if b["mb_s"] else float("inf")
+        r["vs_baseline"] = ratio
+        if ratio < 1 - threshold:
+            flagged.append(r)
+    return flagged
+
+
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--sizes", default="1M,16M", help="ukuran input, mis. 64K,1M,16M")
+    p.add_argument("--key-lens", default="8,64", help="panjang key, mis. 1,8,64")
+    p.add_argument("--data", default="random,text,zeros", help="jenis data: random,text,zeros")
+    p.add_argument("--cases", default=",".join(DEFAULT_CASES), help="daftar case (pisah koma)")
+    p.add_argument("--repeat", type=int, default=5)
+    p.add_argument("--seed", type=int, default=1234)
+    p.add_argument("--out", help="simpan hasil JSON ke file ini")
+    p.add_argument("--baseline", help=f"bandingkan dengan baseline JSON (default simpan: {DEFAULT_BASELINE})")
+    p.add_argument("--save-baseline", action="store_true", help="tulis hasil sebagai baseline")
+    p.add_argument("--threshold", type=float, default=0.10, help="toleransi penurunan MB/s (0.10 = 10%%)")
+    args = p.parse_args(argv)
+
+    sizes = [parse_size(s) for s in args.sizes.split(",")]
+    key_lens = [int(k) for k in args.key_lens.split(",")]
+    kinds = args.data.split(",")
+    cases = args.cases.split(",")
+    unknown = set(cases) - set(_cases(b"", "K"))
+    if unknown:
+        p.error(f"case tidak dikenal: {', '.join(sorted(unknown))}")
+
+    results = []
+    print(f"{'case':<24}{'size':>10}{'key':>5}{'data':>8}{'MB/s':>11}{'p50 ms':>10}{'p99 ms':>10}{'alloc MB':>10}")
+    for kind in kinds:
+        for size in sizes:
+            data = make_data(kind, size, args.seed)
+            for klen in key_lens:
+                key = make_key(klen, args.seed)
+                table = _cases(data, key)
+                for name in cases:
+                    r = {"case": name, "size": size, "key_len": klen, "data": kind}
+                    r.update(run_case(table[name], size, args.repeat))
+                    results.append(r)
+                    print(f"{name:<24}{size:>10}{klen:>5}{kind:>8}{r['mb_s']:>11.1f}{r['p50_ms']:>10.2f}"
+                          f"{r['p99_ms']:>10.2f}{r['peak_alloc_mb']:>10.1f}", flush=True)
+
+    import vigivault
+    report = {"meta": {"timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"), "python": platform.python_version(),
+                       "numpy": np.__version__, "vigivault": vigivault.__version__,
+                       "platform": platform.platform(), "cpu_count": os.cpu_count(),
+                       "seed": args.seed, "repeat": args.repeat},
+              "results": results}
+
+    rc = 0
+    if args.baseline and os.path.exists(args.baseline):
+        with open(args.baseline) as fh:
+            flagged = compare_baseline(results, json.load(fh), args.threshold)
+        for r in flagged:
+            print(f"REGRESI: {r['case']} size={r['size']} key={r['key_len']} data={r['data']}: "
+                  f"{r['vs_baseline']:.2f}x baseline", file=sys.stderr)
+        rc = 1 if flagged else 0
+        if not flagged:
+            print(f"OK: tidak ada regresi > {args.threshold:.0%} terhadap {args.baseline}")
+    if args.out:
+        with open(args.out, "w") as fh:
+            json.dump(report, fh, indent=2)
+    if args.save_baseline:
+        path = args.baseline or DEFAULT_BASELINE
+        with open(path, "w") as fh:
+            json.dump(report, fh, indent=2)
+        print(f"baseline disimpan: {path}")
+    return rc
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,468 @@
+"""Load test VigiVault: banyak sesi bersamaan, memori per sesi, latensi, dan titik saturasi.
+
+Contoh:
+    python benchmarks/loadtest.py                                   # engine: 1,2,4,8 user, file 4M
+    python benchmarks/loadtest.py --users 1,4,16,32 --size 16M --flows encrypt,decrypt
+    python benchmarks/loadtest.py --driver apptest --users 1,2,4 --size 1M   # app.py asli via AppTest
+    python benchmarks/loadtest.py --out lt.json --save-baseline            # simpan baseline lokal
+    python benchmarks/loadtest.py --baseline benchmarks/loadtest_baseline.json --threshold 0.15
+
+Driver "engine" meniru alur app per sesi: upload dipegang di memori, enkripsi/
+dekripsi dikirim ke JobQueue bersama (worker = default app), hasil masuk
+ResultCache, lalu file hasil dibaca ke memori seperti st.download_button.
+Compare berjalan di thread sesi (seperti script Streamlit). Satu thread per
+sesi, jadi konkurensinya nyata. Driver "apptest" menjalankan app.py asli lewat
+streamlit.testing (AppTest) dengan st.file_uploader diganti data sintetis:
+semua sesi hidup bersamaan, tetapi script-nya dijalankan bergiliran (Runtime
+AppTest tidak thread-safe); job tetap paralel di worker. Latensinya ikut
+memuat biaya rerun script.
+
+Per jumlah user dilaporkan: throughput (MB/s dan alur/detik), persentil
+latensi per alur (p50/p90/p99, termasuk antrean job), peak RSS selama level
+dikurangi RSS awal level (dibagi jumlah user = memori per sesi), dan
+efisiensi skala = throughput / (user × throughput 1 user). Level pertama
+dengan efisiensi di bawah --saturation ditandai SATURASI. Secara default tiap
+level berjalan di proses baru (--no-isolate untuk mematikan) agar RSS
+level sebelumnya tidak ikut terhitung. Jika --baseline diberikan, level yang
+MB/s-nya turun atau memori per sesinya naik lebih dari --threshold ditandai
+REGRESI dan exit code menjadi 1.
+"""
+
+import argparse
+import gc
+import io
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench import make_data, make_key, parse_size  # noqa: E402
+from vigivault.cache import ResultCache  # noqa: E402
+from vigivault.compare import compare_streams  # noqa: E402
+from vigivault.container import decrypt_stream, encrypt_stream, encrypt_to, verify_decrypted  # noqa: E402
+from vigivault.jobs import JOB_WORKERS, JobQueue  # noqa: E402
+from vigivault.keys import key_digest  # noqa: E402
+from vigivault.metrics import current_rss_mb, peak_rss_mb  # noqa: E402
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "loadtest_baseline.json")
+FLOWS = ("encrypt", "decrypt", "compare")
+RSS_INTERVAL = 0.02
+CACHE_MAX_BYTES = 1 << 30   # = app.CACHE_MAX_BYTES
+
+
+class RssSampler:
+    # thread pengambil sampel RSS saat ini; peak = maksimum selama berjalan
+    def __init__(self, interval: float = RSS_INTERVAL):
+        self.interval = interval
+        self.start_mb = current_rss_mb()
+        self.peak_mb = self.start_mb
+        self._stop = threading.Event()
+        self._t = threading.Thread(target=self._run, daemon=True)
+        self._t.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.peak_mb = max(self.peak_mb, current_rss_mb())
+
+    def stop(self) -> float:
+        self._stop.set(); self._t.join()
+        self.peak_mb = max(self.peak_mb, current_rss_mb())
+        return self.peak_mb
+
+
+def _other(data: bytes) -> bytes:
+    # file B untuk compare: satu byte di tengah berbeda
+    b = bytearray(data)
+    if b:
+        b[len(b) // 2] ^= 1
+    return bytes(b)
+
+
+def percentiles(lat: list) -> dict:
+    if not lat:
+        return {}
+    ms = np.array(lat) * 1000
+    return {"n": len(lat), "p50_ms": float(np.percentile(ms, 50)), "p90_ms": float(np.percentile(ms, 90)),
+            "p99_ms": float(np.percentile(ms, 99)), "max_ms": float(ms.max())}
+
+
+# ==============================
+# DRIVER ENGINE (thread per sesi)
+# ==============================
+class Session:
+    def __init__(self, sid: int, args: dict):
+        self.sid = sid
+        self.key = make_key(args["key_len"], args["seed"] + sid)
+        self.upload = make_data(args["data"], args["size"], args["seed"] + sid)   # upload dipegang sesi
+        self.name = f"user{sid}.bin"
+        self.round = 0       # iterasi berikutnya = upload baru (key cache berbeda, tidak ada cache hit)
+        self.enc = None      # hasil download .enc (juga dipakai sebagai upload untuk dekripsi)
+        self.plain = None    # hasil download dekripsi
+
+    def held_bytes(self) -> int:
+        return sum(len(b) for b in (self.upload, self.enc, self.plain) if b is not None)
+
+
+def _wait(job):
+    job.future.result()
+    if job.status != "done":
+        raise RuntimeError(f"job {job.op} {job.status}: {job.error}")
+    return job.result
+
+
+def _download(f) -> bytes:
+    # klik download: seluruh file hasil dibaca ke memori (media file manager), lewat handle sendiri
+    with f.open() as h:
+        return h.read()
+
+
+def flow_encrypt(s: Session, queue: JobQueue, cache: ResultCache, args: dict) -> int:
+    ck = (f"lt{s.sid}:{s.round}", key_digest(s.key), "encrypt")
+    src = io.BytesIO(s.upload)
+    def run(job):
+        return cache.get_or_compute(ck, lambda: encrypt_stream(job.reader(src), s.key, name=s.name),
+                                    cost=lambda v: v[1].size)
+    cipher, _ = _wait(queue.submit("encrypt", run, total=len(s.upload), key=ck, file=s.name))
+    s.enc = _download(cipher)
+    return len(s.upload)
+
+
+def flow_decrypt(s: Session, queue: JobQueue, cache: ResultCache, args: dict) -> int:
+    digest, kd, level = f"lt{s.sid}:{s.round}:enc", key_digest(s.key), args["level"]
+    src = io.BytesIO(s.enc)
+    def run(job):
+        enc = job.reader(src)
+        plain, stats, meta = cache.get_or_compute((digest, kd, "decrypt"), lambda: decrypt_stream(enc, s.key),
+                                                  cost=lambda v: v[1].size)
+        with plain.open() as ph:
+            ok, _ = verify_decrypted(ph, enc, s.key, stats, meta, level)
+        if not ok:
+            raise RuntimeError("verifikasi gagal")
+        return plain
+    total = len(s.enc) * (2 if level == "full" else 1)
+    plain = _wait(queue.submit("decrypt", run, total=total, key=(digest, kd, "decrypt:" + level), file=s.name))
+    s.plain = _download(plain)
+    return len(s.enc)
+
+
+def flow_compare(s: Session, queue: JobQueue, cache: ResultCache, args: dict) -> int:
+    b = s.plain if s.plain is not None else _other(s.upload)
+    res = cache.get_or_compute((f"lt{s.sid}:{s.round}:cmp", None, "compare"),
+                               lambda: compare_streams(io.BytesIO(s.upload), io.BytesIO(b)))
+    if res["identical"] != (b == s.upload):
+        raise RuntimeError("hasil compare salah")
+    return len(s.upload) + len(b)
+
+
+ENGINE_FLOWS = {"encrypt": flow_encrypt, "decrypt": flow_decrypt, "compare": flow_compare}
+
+
+def run_level_engine(users: int, args: dict) -> dict:
+    gc.collect()
+    queue = JobQueue(workers=args["workers"]); cache = ResultCache(args["cache_bytes"])
+    flows = args["flows"]
+    lat = {f: [] for f in flows}; errors = []; processed = [0]; lock = threading.Lock()
+    barrier = threading.Barrier(users + 1)
+    sessions = [None] * users
+    sampler = RssSampler()
+
+    def user(i):
+        try:
+            s = sessions[i] = Session(i, args)
+            if "decrypt" in flows and "encrypt" not in flows:
+                flow_encrypt(s, queue, cache, args)          # persiapan, tidak diukur
+        finally:
+            barrier.wait()   # sesi yang gagal persiapan tetap melepas barrier
+        for _ in range(args["iterations"]):
+            for name in flows:
+                t0 = time.perf_counter()
+                try:
+                    n = ENGINE_FLOWS[name](s, queue, cache, args)
+                except Exception as e:
+                    with lock:
+                        errors.append(f"{name}: {e}")
+                    continue
+                dt = time.perf_counter() - t0
+                with lock:
+                    lat[name].append(dt); processed[0] += n
+            s.round += 1
+
+    threads = [threading.Thread(target=user, args=(i,), name=f"lt-user{i}") for i in range(users)]
+    for t in threads:
+        t.start()
+    barrier.wait()
+    t0 = time.perf_counter()
+    for t in threads:
+        t.join()
+    wall = time.perf_counter() - t0
+    peak = sampler.stop()
+    held = sum(s.held_bytes() for s in sessions if s is not None)
+    cache_bytes = cache.stats()["bytes"]
+    queue.shutdown()
+    return _level_record(users, args, wall, lat, processed[0], errors, sampler.start_mb, peak, held, cache_bytes)
+
+
+# ==============================
+# DRIVER APPTEST (app.py asli)
+# ==============================
+# st.file_uploader diganti: data upload per sesi diambil dari session_state
+# "_loadtest_files" {key widget: (nama, bytes)} yang di-set harness.
+_APPTEST_WRAPPER = '''
+import os, sys
+import streamlit as st
+from streamlit.runtime.uploaded_file_manager import UploadedFile, UploadedFileRec
+sys.path.insert(0, {root!r})
+_files = st.session_state.get("_loadtest_files", {{}})
+def _uploader(label, *a, key=None, accept_multiple_files=False, **k):
+    v = _files.get(key)
+    if v is None:
+        return [] if accept_multiple_files else None
+    name, data = v
+    f = UploadedFile(UploadedFileRec(file_id=f"lt-{{key}}-{{id(data)}}", name=name,
+                                     type="application/octet-stream", data=data), None)
+    return [f] if accept_multiple_files else f
+st.file_uploader = _uploader
+os.chdir({root!r})
+exec(compile(open({app!r}, encoding="utf-8").read(), {app!r}, "exec"))
+'''
+FILE_MODE = "File (Byte-wise 0–255)"
+APPTEST_POLL = 0.05
+
+
+def _uploads(i: int, rnd: int, args: dict) -> dict:
+    # upload sesi i pada iterasi rnd; .enc untuk tab Dekripsi disiapkan di sini (tidak diukur)
+    sid = i + rnd * 1000
+    key = make_key(args["key_len"], args["seed"] + i)
+    data = make_data(args["data"], args["size"], args["seed"] + sid)
+    enc = io.BytesIO(); encrypt_to(io.BytesIO(data), enc, key, name=f"user{sid}.bin")
+    return {"enc_file": (f"user{sid}.bin", data), "dec_file": (f"user{sid}.bin.enc", enc.getvalue()),
+            "cmp_a": ("a.bin", data), "cmp_b": ("b.bin", _other(data))}
+
+# alur → (label tombol, teks st.success saat selesai, upload yang dihitung sebagai byte diproses)
+APPTEST_FLOWS = {"encrypt": ("Enkripsi Sekarang", "dienkripsi", ("enc_file",)),
+                 "decrypt": ("Dekripsi Sekarang", "didekripsi", ("dec_file",)),
+                 "compare": ("Compare", "IDENTIK", ("cmp_a", "cmp_b"))}
+
+def _finished(at, name: str, word: str) -> bool:
+    if at.exception:
+        raise RuntimeError(str(at.exception[0].value))
+    if name == "compare":   # compare sinkron: hasil (identik/berbeda) tampil di run klik
+        return any(word in s.value for s in at.success) or any("BERBEDA" in e.value for e in at.error)
+    if any("Gagal" in e.value or "gagal" in e.value for e in at.error):
+        raise RuntimeError(next(e.value for e in at.error))
+    return any(word in s.value for s in at.success)
+
+def run_level_apptest(users: int, args: dict) -> dict:
+    from streamlit.testing.v1 import AppTest
+    for name in ("streamlit.deprecation_util", "streamlit.runtime.scriptrunner_utils.script_run_context"):
+        logging.getLogger(name).disabled = True   # peringatan yang tercetak di tiap rerun/sesi
+    gc.collect()
+    wrapper = tempfile.NamedTemporaryFile("w", suffix="_loadtest_app.py", delete=False, encoding="utf-8")
+    wrapper.write(_APPTEST_WRAPPER.format(root=ROOT, app=os.path.join(ROOT, "app.py"))); wrapper.close()
+    flows = args["flows"]
+    lat = {f: [] for f in flows}; lat["rerun"] = []; errors = []; processed = 0; wall = 0.0
+    sampler = RssSampler()
+
+    def timed_run(at, click=None):
+        t = time.perf_counter()
+        (click.click() if click is not None else at).run()
+        lat["rerun"].append(time.perf_counter() - t)
+
+    try:
+        sess = []
+        for i in range(users):
+            at = AppTest.from_file(wrapper.name, default_timeout=args["timeout"])
+            at.session_state["_loadtest_files"] = files = _uploads(i, 0, args)
+            at.run()
+            at.sidebar.radio[0].set_value(FILE_MODE).run()
+            next(t for t in at.text_input if t.label == "Key").set_value(make_key(args["key_len"], args["seed"] + i)).run()
+            if args["level"] != "header":
+                at.selectbox(key="verify_level").set_value(args["level"]).run()
+            sess.append({"at": at, "files": files})
+
+        for rnd in range(args["iterations"]):
+            if rnd:
+                for i, s in enumerate(sess):
+                    s["at"].session_state["_loadtest_files"] = s["files"] = _uploads(i, rnd, args)
+                    s["at"].run()
+            t_round = time.perf_counter()
+            for name in flows:
+                label, word, counted = APPTEST_FLOWS[name]
+                # semua sesi "mengklik" hampir bersamaan, lalu di-poll bergiliran
+                start = {}
+                for i, s in enumerate(sess):
+                    start[i] = time.perf_counter()
+                    timed_run(s["at"], next(b for b in s["at"].button if label in b.label))
+                pending = set(range(users))
+                deadline = time.perf_counter() + args["timeout"]
+                while pending and time.perf_counter() < deadline:
+                    for i in sorted(pending):
+                        at = sess[i]["at"]
+                        try:
+                            finished = _finished(at, name, word)
+                        except RuntimeError as e:
+                            errors.append(f"{name}: {e}"); pending.discard(i); continue
+                        if finished:
+                            lat[name].append(time.perf_counter() - start[i]); pending.discard(i)
+                            processed += sum(len(sess[i]["files"][k][1]) for k in counted)
+                        else:
+                            timed_run(at)
+                    if pending:
+                        time.sleep(APPTEST_POLL)
+                errors.extend(f"{name}: timeout" for _ in pending)
+            wall += time.perf_counter() - t_round
+        held = sum(sum(len(v[1]) for v in s["files"].values()) for s in sess)
+    finally:
+        peak = sampler.stop()
+        os.unlink(wrapper.name)
+    # cache hasil app ada di st.cache_resource proses ini; ukurannya ikut di RSS
+    return _level_record(users, args, wall, lat, processed, errors, sampler.start_mb, peak, held, None)
+
+
+def _level_record(users, args, wall, lat, processed, errors, start_mb, peak_mb, held, cache_bytes) -> dict:
+    flows_done = sum(len(v) for k, v in lat.items() if k != "rerun")
+    return {"driver": args["driver"], "users": users, "size": args["size"], "flows": ",".join(args["flows"]),
+            "iterations": args["iterations"], "wall_s": wall,
+            "mb_s": (processed / (1 << 20)) / wall if wall > 0 else 0.0,
+            "flows_s": flows_done / wall if wall > 0 else 0.0,
+            "latency": {k: percentiles(v) for k, v in lat.items() if v},
+            "rss_start_mb": start_mb, "rss_peak_mb": peak_mb, "peak_rss_mb": peak_rss_mb(),
+            "per_session_mb": max(0.0, peak_mb - start_mb) / users,
+            "held_mb_per_session": held / (1 << 20) / users,
+            "cache_mb": None if cache_bytes is None else cache_bytes / (1 << 20),
+            "errors": errors[:20], "n_errors": len(errors)}
+
+
+def run_level(users: int, args: dict) -> dict:
+    fn = run_level_apptest if args["driver"] == "apptest" else run_level_engine
+    return fn(users, args)
+
+
+def run_isolated(users: int, args: dict) -> dict:
+    # proses baru per level: RSS awal bersih, tidak ada sisa alokasi level sebelumnya
+    with multiprocessing.get_context("spawn").Pool(1) as pool:
+        return pool.apply(run_level, (users, args))
+
+
+# ==============================
+# SATURASI & BASELINE
+# ==============================
+def mark_saturation(results: list, threshold: float):
+    base = next((r for r in results if r["users"] == 1), results[0] if results else None)
+    saturated = None
+    for r in results:
+        per_user = base["mb_s"] / base["users"] if base and base["mb_s"] else 0.0
+        r["efficiency"] = r["mb_s"] / (r["users"] * per_user) if per_user else None
+        if saturated is None and r["efficiency"] is not None and r["efficiency"] < threshold:
+            saturated = r["users"]
+    return saturated
+
+
+def case_id(r: dict) -> tuple:
+    return (r["driver"], r["users"], r["size"], r["flows"])
+
+
+def compare_baseline(results: list, baseline: dict, threshold: float) -> list:
+    base = {case_id(r): r for r in baseline.get("results", [])}
+    flagged = []
+    for r in results:
+        b = base.get(case_id(r))
+        if b is None:
+            r["vs_baseline"] = None; continue
+        speed = r["mb_s"] / b["mb_s"] if b["mb_s"] else float("inf")
+        mem = r["per_session_mb"] / b["per_session_mb"] if b["per_session_mb"] else 1.0
+        r["vs_baseline"] = {"mb_s": speed, "per_session_mb": mem}
+        if speed < 1 - threshold or mem > 1 + threshold:
+            flagged.append(r)
+    return flagged
+
+
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--driver", choices=["engine", "apptest"], default="engine")
+    p.add_argument("--users", default="1,2,4,8", help="jumlah sesi bersamaan per level, mis. 1,4,16")
+    p.add_argument("--size", default="4M", help="ukuran upload per sesi, mis. 256K, 4M, 64M")
+    p.add_argument("--data", default="random", help="jenis data: random,text,zeros")
+    p.add_argument("--key-len", type=int, default=16)
+    p.add_argument("--flows", default=",".join(FLOWS), help="alur per iterasi: encrypt,decrypt,compare")
+    p.add_argument("--iterations", type=int, default=3, help="iterasi alur per sesi")
+    p.add_argument("--level", choices=["header", "sampled", "full"], default="header", help="level verifikasi dekripsi")
+    p.add_argument("--workers", type=int, default=JOB_WORKERS, help="worker JobQueue (default: sama dengan app)")
+    p.add_argument("--cache-mb", type=int, default=CACHE_MAX_BYTES >> 20, help="batas ResultCache (driver engine)")
+    p.add_argument("--timeout", type=float, default=120.0, help="batas waktu per alur (driver apptest)")
+    p.add_argument("--saturation", type=float, default=0.7, help="efisiensi skala minimum sebelum dianggap saturasi")
+    p.add_argument("--no-isolate", action="store_true", help="jalankan semua level di proses ini")
+    p.add_argument("--seed", type=int, default=1234)
+    p.add_argument("--out", help="simpan hasil JSON ke file ini")
+    p.add_argument("--baseline", help=f"bandingkan dengan baseline JSON (default simpan: {DEFAULT_BASELINE})")
+    p.add_argument("--save-baseline", action="store_true", help="tulis hasil sebagai baseline")
+    p.add_argument("--threshold", type=float, default=0.15, help="toleransi regresi MB/s dan memori (0.15 = 15%%)")
+    args = p.parse_args(argv)
+
+    flows = args.flows.split(",")
+    unknown = set(flows) - set(FLOWS)
+    if unknown:
+        p.error(f"alur tidak dikenal: {', '.join(sorted(unknown))}")
+    cfg = {"driver": args.driver, "size": parse_size(args.size), "data": args.data, "key_len": args.key_len,
+           "flows": flows, "iterations": args.iterations, "level": args.level, "workers": args.workers,
+           "cache_bytes": args.cache_mb << 20, "timeout": args.timeout, "seed": args.seed}
+    levels = [int(u) for u in args.users.split(",")]
+
+    results = []
+    print(f"{'users':>6}{'MB/s':>10}{'alur/s':>9}{'efis.':>7}{'MB/sesi':>9}{'RSS peak':>10}  latensi p50/p99 ms")
+    for users in levels:
+        r = run_level(users, cfg) if args.no_isolate else run_isolated(users, cfg)
+        results.append(r)
+        base = next((x for x in results if x["users"] == 1), results[0])
+        eff = r["mb_s"] / (users * base["mb_s"] / base["users"]) if base["mb_s"] else float("nan")
+        lat = "  ".join(f"{k} {v['p50_ms']:.0f}/{v['p99_ms']:.0f}" for k, v in r["latency"].items())
+        print(f"{users:>6}{r['mb_s']:>10.1f}{r['flows_s']:>9.2f}{eff:>7.2f}{r['per_session_mb']:>9.1f}"
+              f"{r['rss_peak_mb']:>10.0f}  {lat}" + (f"  ❌ {r['n_errors']} error" if r["n_errors"] else ""), flush=True)
+        for e in r["errors"][:3]:
+            print(f"    {e}", file=sys.stderr)
+    saturated = mark_saturation(results, args.saturation)
+    if saturated is not None:
+        print(f"SATURASI: efisiensi < {args.saturation:.0%} mulai {saturated} user "
+              f"(worker job = {args.workers}, CPU = {os.cpu_count()})")
+
+    import vigivault
+    report = {"meta": {"timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"), "python": platform.python_version(),
+                       "numpy": np.__version__, "vigivault": vigivault.__version__,
+                       "platform": platform.platform(), "cpu_count": os.cpu_count(), "seed": args.seed,
+                       "driver": args.driver, "workers": args.workers, "saturated_at": saturated},
+              "results": results}
+
+    rc = 1 if any(r["n_errors"] for r in results) else 0
+    if args.baseline and os.path.exists(args.baseline):
+        with open(args.baseline) as fh:
+            flagged = compare_baseline(results, json.load(fh), args.threshold)
+        for r in flagged:
+            v = r["vs_baseline"]
+            print(f"REGRESI: {r['driver']} users={r['users']} size={r['size']} flows={r['flows']}: "
+                  f"{v['mb_s']:.2f}x MB/s, {v['per_session_mb']:.2f}x memori/sesi", file=sys.stderr)
+        rc = max(rc, 1 if flagged else 0)
+        if not flagged:
+            print(f"OK: tidak ada regresi > {args.threshold:.0%} terhadap {args.baseline}")
+    if args.out:
+        with open(args.out, "w") as fh:
+            json.dump(report, fh, indent=2)
+    if args.save_baseline:
+        path = args.baseline or DEFAULT_BASELINE
+        with open(path, "w") as fh:
+            json.dump(report, fh, indent=2)
+        print(f"baseline disimpan: {path}")
+    return rc
+
+
+if __name__ == "__main__":
+    sys.exit(main())
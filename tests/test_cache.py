@@ -0,0 +1,124 @@
+# ResultCache dengan file hasil bersama: eviction tidak menutup file yang masih dipegang, posisi baca terpisah.
+import tempfile
+import threading
+
+import pytest
+
+from vigivault.cache import ResultCache, SharedFile, release
+from vigivault.jobs import JobQueue
+
+
+def _tmp(data: bytes):
+    f = tempfile.TemporaryFile(buffering=0)
+    f.write(data); f.seek(0)
+    return f
+
+
+def test_eviction_keeps_file_open_for_holder():
+    cache = ResultCache(max_bytes=10)
+    held, _ = cache.get_or_compute(("a",), lambda: (_tmp(b"hasil A"), 7), cost=lambda v: v[1])
+    assert isinstance(held, SharedFile)
+    cache.get_or_compute(("b",), lambda: (_tmp(b"hasil B"), 7), cost=lambda v: v[1])   # A dievict
+    assert cache.stats()["entries"] == 1
+    with held.open() as h:
+        assert h.read() == b"hasil A"
+    release(held)
+    assert held.closed
+
+
+def test_handles_have_independent_positions():
+    cache = ResultCache(max_bytes=1 << 20)
+    data = bytes(range(256)) * 64
+    shared = cache.get_or_compute(("x",), lambda: _tmp(data))
+    a, b = shared.open(), shared.open()
+    assert a.read(10) == data[:10]
+    b.seek(100)
+    assert b.read(5) == data[100:105]
+    assert a.read(5) == data[10:15]
+    a.seek(-3, 2)
+    assert a.read() == data[-3:]
+    a.close(); b.close(); release(shared)
+    assert not shared.closed   # cache masih memegang
+
+
+def test_concurrent_readers():
+    data = bytes(range(256)) * 4096
+    shared = SharedFile(_tmp(data))
+    out, errors = [None] * 8, []
+
+    def reader(i):
+        try:
+            with shared.open() as h:
+                h.seek(i * 1000)
+                out[i] = b"".join(iter(lambda: h.read(4093), b""))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=reader, args=(i,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not errors
+    assert all(o == data[i * 1000:] for i, o in enumerate(out))
+    shared.release()
+    with pytest.raises(ValueError):
+        shared.open()
+
+
+def test_job_result_survives_eviction_until_pruned():
+    cache = ResultCache(max_bytes=1)
+    queue = JobQueue(workers=1, keep=0)
+    job = queue.submit("encrypt", lambda job: cache.get_or_compute(("a",), lambda: _tmp(b"A"), cost=lambda v: 1))
+    job.future.result()
+    cache.get_or_compute(("b",), lambda: _tmp(b"B"), cost=lambda v: 1)   # evict A dari cache
+    with job.result.open() as h:
+        assert h.read() == b"A"
+    queue.submit("other", lambda job: None).future.result()   # prune: job A dibuang
+    assert job.result.closed
+    queue.shutdown()
+
+
+def test_concurrent_misses_compute_once():
+    cache = ResultCache(max_bytes=1 << 20)
+    calls, gate = [], threading.Event()
+
+    def compute():
+        calls.append(1); gate.wait(5)
+        return _tmp(b"plaintext"), 9
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_compute(("d", "k", "decrypt"), compute,
+                                                                                   cost=lambda v: v[1])))
+               for _ in range(4)]
+    for t in threads:
+        t.start()
+    gate.set()
+    for t in threads:
+        t.join()
+    assert len(calls) == 1
+    assert len({id(r[0]) for r in results}) == 1
+    assert cache.stats()["misses"] == 1 and cache.stats()["hits"] == 3
+
+
+def test_failed_compute_lets_waiter_retry():
+    cache = ResultCache(max_bytes=1 << 20)
+    started, gate = threading.Event(), threading.Event()
+    out = {}
+
+    def failing():
+        started.set(); gate.wait(5)
+        raise RuntimeError("gagal")
+
+    def owner():
+        try:
+            cache.get_or_compute(("x",), failing)
+        except RuntimeError as e:
+            out["owner"] = str(e)
+
+    t = threading.Thread(target=owner); t.start(); started.wait(5)
+    waiter = threading.Thread(target=lambda: out.setdefault("waiter", cache.get_or_compute(("x",), lambda: 7)))
+    waiter.start(); gate.set()
+    t.join(); waiter.join()
+    assert out == {"owner": "gagal", "waiter": 7}
+    assert cache.get_or_compute(("x",), lambda: 0) == 7
@@ -0,0 +1,92 @@
+# Kesetaraan engine klasik NumPy (dan streaming) dengan referensi per-karakter, atas teks acak.
+import io
+import random
+
+import pytest
+
+from vigivault import classic
+
+# kumpulan karakter: ASCII, huruf non-ASCII, titlecase (ǅ ǈ ǋ ǲ), codepoint astral
+# (huruf matematis, Deseret, emoji), CJK, spasi dan tanda baca
+ASCII = list("abcxyzABCXYZ") + list(" \t\n.,;:!?-'\"0123456789")
+POOL = (ASCII + list("éÉñÑøØåÅçÇ") + list("αβΩΣжЖяЯ") + list("ǅǈǋǲ")
+        + ["𝐀", "𝐳", "𝔄", "𝔞", "𐐀", "𐐨", "😀", "🔑"] + list("漢字かな"))
+EXPANDING = list("ßŉﬀ")   # upper() lebih dari satu karakter
+KEYS = ["LEMON", "lemon", "le-mon 42!", "K3Y_w1th.sym", "ÜberKey", "ß", "Ωmega𝐀", "a"]
+
+
+def _outcome(fn, *args):
+    # huruf yang upper()-nya >1 karakter ditolak (ValueError); engine harus sama persis dengan referensi
+    try:
+        return "ok", fn(*args)
+    except Exception as e:
+        return "error", type(e)
+
+
+def _same(name: str, *args) -> None:
+    np_fn = getattr(classic, f"vigenere_{name}_classic")
+    ref_fn = getattr(classic, f"vigenere_{name}_classic_ref")
+    assert _outcome(np_fn, *args) == _outcome(ref_fn, *args), repr(args[0])
+
+
+def _text(rng: random.Random, n: int, pool: list = POOL) -> str:
+    return "".join(rng.choice(pool) for _ in range(n))
+
+
+@pytest.mark.parametrize("keep", [True, False])
+@pytest.mark.parametrize("key", KEYS)
+def test_random_text_matches_ref(key, keep):
+    rng = random.Random(f"{key}:{keep}")
+    for trial in range(60):
+        pool = (ASCII, POOL, POOL + EXPANDING)[trial % 3]
+        text = _text(rng, rng.randrange(0, 200), pool)
+        _same("encrypt", text, key, keep)
+        _same("decrypt", text, key, keep)
+
+
+@pytest.mark.parametrize("ch", ["ǅ", "ǈ", "ǲ", "𝐀", "𝔞", "𐐀", "ß", "ŉ", "é", "Ω"])
+def test_special_letters_match_ref(ch):
+    text = f"a{ch}b {ch}{ch}C!"
+    for keep in (True, False):
+        _same("encrypt", text, "KEY", keep)
+        _same("decrypt", text, "KEY", keep)
+
+
+@pytest.mark.parametrize("key", KEYS)
+def test_round_trip_ascii(key):
+    rng = random.Random(key)
+    text = _text(rng, 500, ASCII)
+    enc = classic.vigenere_encrypt_classic(text, key)
+    assert classic.vigenere_decrypt_classic(enc, key) == text
+
+
+def test_key_without_letters_rejected():
+    for fn in (classic.vigenere_encrypt_classic, classic.vigenere_encrypt_classic_ref):
+        with pytest.raises(ValueError):
+            fn("abc", "123 !?")
+
+
+@pytest.mark.parametrize("keep", [True, False])
+@pytest.mark.parametrize("chunk", [1, 3, 7, 64])
+def test_streaming_matches_one_shot(keep, chunk):
+    # chunk kecil memotong urutan UTF-8 multi-byte di tengah karakter
+    rng = random.Random(chunk)
+    text = _text(rng, 2000)
+    out = io.BytesIO()
+    classic.transform_text_to(io.BytesIO(text.encode("utf-8")), out, "Ωmega key", False, keep, chunk_size=chunk)
+    assert out.getvalue().decode("utf-8") == classic.vigenere_encrypt_classic_ref(text, "Ωmega key", keep)
+
+
+@pytest.mark.parametrize("ch", EXPANDING)
+def test_expanding_letter_names_char_and_offset(ch):
+    text = "ab, " + ch + "cd"
+    for fn in (classic.vigenere_encrypt_classic, classic.vigenere_decrypt_classic_ref):
+        with pytest.raises(ValueError, match=rf"{ch!r}.*offset karakter 4\b"):
+            fn(text, "KEY")
+
+
+@pytest.mark.parametrize("chunk", [1, 5, 4096])
+def test_streaming_expanding_letter_reports_stream_offset(chunk):
+    text = "Hallo Welt, die Straße"
+    with pytest.raises(ValueError, match=r"offset karakter 20\b"):
+        classic.transform_text_to(io.BytesIO(text.encode("utf-8")), io.BytesIO(), "LEMON", chunk_size=chunk)
@@ -0,0 +1,71 @@
+# read_container: container valid, legacy, dan container rusak (tidak boleh jatuh ke legacy).
+import io
+import json
+
+import pytest
+
+from vigivault.container import (HEADER_LEN, HEADER_MAGIC, TRAILER, decrypt_stream, encrypt_to,
+                                 read_container)
+
+KEY = "kunci rahasia"
+DATA = bytes(range(256)) * 40
+
+
+def _enc(data: bytes = DATA, name: str = "data.bin") -> bytes:
+    out = io.BytesIO()
+    encrypt_to(io.BytesIO(data), out, KEY, name=name, index_chunk=4096)
+    return out.getvalue()
+
+
+def _with_header(enc: bytes, header: bytes) -> bytes:
+    # ganti JSON header tanpa mengubah panjangnya (layout tetap konsisten)
+    (hlen,) = HEADER_LEN.unpack_from(enc, len(HEADER_MAGIC))
+    assert len(header) <= hlen
+    start = len(HEADER_MAGIC) + HEADER_LEN.size
+    return enc[:start] + header.ljust(hlen) + enc[start + hlen:]
+
+
+def test_valid_container_round_trip():
+    enc = _enc()
+    meta = read_container(io.BytesIO(enc))
+    assert meta["name"] == "data.bin" and meta["size"] == len(DATA)
+    plain, stats, _ = decrypt_stream(io.BytesIO(enc), KEY)
+    assert plain.read() == DATA
+
+
+def test_legacy_raw_ciphertext_is_none():
+    assert read_container(io.BytesIO(b"ciphertext mentah tanpa trailer" * 10)) is None
+    assert read_container(io.BytesIO(b"")) is None
+
+
+@pytest.mark.parametrize("header", [b"[1, 2, 3]", b'"nama"', b"42", b"null"])
+def test_non_object_header_is_corrupt(header):
+    with pytest.raises(ValueError, match="rusak"):
+        read_container(io.BytesIO(_with_header(_enc(), header)))
+
+
+def test_invalid_json_header_is_corrupt():
+    with pytest.raises(ValueError, match="rusak"):
+        read_container(io.BytesIO(_with_header(_enc(), b"{bukan json")))
+
+
+def test_non_string_name_ignored():
+    enc = _with_header(_enc(name="x" * 20), json.dumps({"name": 5, "chunk_size": 4096}).encode())
+    assert read_container(io.BytesIO(enc))["name"] is None
+
+
+@pytest.mark.parametrize("damage", ["extra_byte", "truncated", "size_field", "version"])
+def test_bad_layout_with_magics_is_corrupt(damage):
+    enc = bytearray(_enc())
+    if damage == "extra_byte":
+        enc[len(HEADER_MAGIC) + HEADER_LEN.size + 40:len(HEADER_MAGIC) + HEADER_LEN.size + 40] = b"\x00"
+    elif damage == "truncated":
+        del enc[-TRAILER.size // 2:]
+    elif damage == "size_field":
+        enc[-TRAILER.size + 1:-TRAILER.size + 9] = (len(DATA) + 1).to_bytes(8, "big")
+    else:
+        enc[-TRAILER.size] = 9
+    with pytest.raises(ValueError, match="rusak"):
+        read_container(io.BytesIO(bytes(enc)))
+    with pytest.raises(ValueError, match="rusak"):
+        decrypt_stream(io.BytesIO(bytes(enc)), KEY)
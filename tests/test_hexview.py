@@ -0,0 +1,29 @@
+# page_start: offset disejajarkan ke baris; lompatan dekat EOF memberi page terakhir yang memuat EOF.
+import io
+
+from vigivault.hexview import HEX_ROW, page_start, view_page
+
+
+def test_aligned_to_row():
+    assert page_start(37, 10_000, 256) == 32
+    assert page_start(-5, 10_000, 256) == 0
+
+
+def test_near_eof_clamps_to_last_page():
+    for size in (1000, 1024, 1031, 4096):
+        start = page_start(size - 1, size, 256)
+        assert start % HEX_ROW == 0
+        assert start <= size - 1 < start + 256
+        assert size - start > 256 - HEX_ROW
+        assert page_start(size * 2, size, 256) == start
+
+
+def test_small_file_starts_at_zero():
+    assert page_start(50, 100, 256) == 0
+
+
+def test_view_page_near_eof_is_full():
+    data = bytes(range(256)) * 8
+    view = view_page(io.BytesIO(data), len(data) - 3, page=256)
+    assert view["end"] == len(data)
+    assert len(view["data"]) == 256
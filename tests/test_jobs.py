@@ -0,0 +1,29 @@
+# JobQueue meneruskan opsi profile/trace_memory ke recording() job.
+import pytest
+
+from vigivault.jobs import JobQueue
+
+
+@pytest.fixture
+def queue():
+    q = JobQueue(workers=1)
+    yield q
+    q.shutdown()
+
+
+def _busy(job):
+    return sum(i * i for i in range(20000))
+
+
+def test_metrics_options_reach_recording(queue):
+    job = queue.submit("encrypt", _busy, profile=True, trace_memory=True, file="a.bin")
+    job.future.result()
+    assert job.status == "done"
+    assert job.metrics["profile"] and job.metrics["peak_alloc_mb"] is not None
+    assert job.metrics["file"] == "a.bin"
+
+
+def test_metrics_options_default_off(queue):
+    job = queue.submit("encrypt", _busy)
+    job.future.result()
+    assert not job.metrics.get("profile") and job.metrics["peak_alloc_mb"] is None
@@ -0,0 +1,102 @@
+# Mode file lokal (mmap): hasil identik dengan encrypt_to/decrypt_to, ke file tujuan maupun in-place.
+import io
+import random
+
+import pytest
+
+from vigivault.bytewise import vigenere_encrypt_bytes
+from vigivault.container import decrypt_to, encrypt_to
+from vigivault.localfile import decrypt_file, encrypt_file
+
+KEY = "kunci lokal"
+BLOCK = 64
+INDEX = 48
+SIZES = [0, 1, 13, BLOCK - 1, BLOCK, BLOCK + 1, 5 * BLOCK + 7]
+
+
+def _data(n: int) -> bytes:
+    return random.Random(n).randbytes(n)
+
+
+def _expected_enc(data: bytes, name: str) -> bytes:
+    out = io.BytesIO()
+    encrypt_to(io.BytesIO(data), out, KEY, name=name, chunk_size=BLOCK, index_chunk=INDEX)
+    return out.getvalue()
+
+
+def _expected_dec(enc: bytes) -> bytes:
+    out = io.BytesIO()
+    decrypt_to(io.BytesIO(enc), out, KEY, chunk_size=BLOCK)
+    return out.getvalue()
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_encrypt_to_destination(tmp_path, size):
+    src = tmp_path / "data.bin"; dst = tmp_path / "data.bin.enc"
+    src.write_bytes(_data(size))
+    stats = encrypt_file(str(src), KEY, str(dst), block=BLOCK, index_chunk=INDEX)
+    expected = _expected_enc(_data(size), "data.bin")
+    assert dst.read_bytes() == expected
+    assert stats.size == len(expected)
+    assert src.read_bytes() == _data(size)
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_encrypt_in_place(tmp_path, size):
+    src = tmp_path / "data.bin"
+    src.write_bytes(_data(size))
+    encrypt_file(str(src), KEY, None, block=BLOCK, index_chunk=INDEX)
+    assert src.read_bytes() == _expected_enc(_data(size), "data.bin")
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_decrypt_to_destination(tmp_path, size):
+    enc = _expected_enc(_data(size), "data.bin")
+    src = tmp_path / "data.bin.enc"; dst = tmp_path / "out.bin"
+    src.write_bytes(enc)
+    stats, meta = decrypt_file(str(src), KEY, str(dst), block=BLOCK)
+    assert dst.read_bytes() == _expected_dec(enc) == _data(size)
+    assert meta["size"] == stats.size == size and meta["sha256"] == stats.sha256
+    assert src.read_bytes() == enc
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_decrypt_in_place(tmp_path, size):
+    src = tmp_path / "data.bin.enc"
+    src.write_bytes(_expected_enc(_data(size), "data.bin"))
+    decrypt_file(str(src), KEY, None, block=BLOCK)
+    assert src.read_bytes() == _data(size)
+
+
+@pytest.mark.parametrize("in_place", [False, True])
+@pytest.mark.parametrize("size", SIZES)
+def test_decrypt_legacy(tmp_path, size, in_place):
+    enc = vigenere_encrypt_bytes(_data(size), KEY)
+    src = tmp_path / "legacy.enc"; dst = tmp_path / "out.bin"
+    src.write_bytes(enc)
+    _, meta = decrypt_file(str(src), KEY, None if in_place else str(dst), block=BLOCK)
+    assert meta is None
+    assert (src if in_place else dst).read_bytes() == _expected_dec(enc) == _data(size)
+
+
+@pytest.mark.parametrize("size", [0, 1, 5 * BLOCK + 7])
+def test_existing_larger_destination_truncated(tmp_path, size):
+    src = tmp_path / "data.bin"; enc = tmp_path / "data.bin.enc"; out = tmp_path / "out.bin"
+    src.write_bytes(_data(size))
+    junk = b"\xff" * (10 * BLOCK)
+    enc.write_bytes(junk); out.write_bytes(junk)
+    encrypt_file(str(src), KEY, str(enc), block=BLOCK, index_chunk=INDEX)
+    assert enc.read_bytes() == _expected_enc(_data(size), "data.bin")
+    decrypt_file(str(enc), KEY, str(out), block=BLOCK)
+    assert out.read_bytes() == _data(size)
+
+
+@pytest.mark.parametrize("in_place", [False, True])
+def test_wrong_key_rejected_before_touching_files(tmp_path, in_place):
+    enc = _expected_enc(_data(5 * BLOCK + 7), "data.bin")
+    src = tmp_path / "data.bin.enc"; dst = tmp_path / "out.bin"
+    src.write_bytes(enc)
+    with pytest.raises(ValueError):
+        decrypt_file(str(src), "key lain", None if in_place else str(dst), block=BLOCK)
+    assert src.read_bytes() == enc
+    assert not dst.exists()
@@ -0,0 +1,22 @@
+# KeySchedule: bentuk turunan key, dan tidak ada cache schedule global yang dibagi antar sesi.
+from vigivault.keys import key_digest, key_fingerprint
+from vigivault.schedule import KeySchedule, key_schedule
+
+
+def test_derived_forms():
+    sched = KeySchedule("Rahasia-123")
+    assert sched.key_bytes == b"Rahasia-123"
+    assert sched.alpha == "RAHASIA"
+    assert sched.fingerprint == key_fingerprint("Rahasia-123")
+    assert sched.digest == key_digest("Rahasia-123")
+    assert "Rahasia" not in repr(sched)
+
+
+def test_schedule_passed_through():
+    sched = KeySchedule("kunci")
+    assert key_schedule(sched) is sched
+
+
+def test_no_process_wide_cache():
+    # str dibangun per panggilan: tidak ada schedule (berisi key) yang tertinggal di modul
+    assert key_schedule("kunci") is not key_schedule("kunci")
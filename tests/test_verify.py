@@ -0,0 +1,73 @@
+# verify_decrypted: semua level (header, sampled, full) pada .enc valid, payload diubah, key salah, dan legacy.
+import io
+
+import pytest
+
+from vigivault.bytewise import vigenere_encrypt_bytes
+from vigivault.container import decrypt_stream, encrypt_to, read_container, verify_decrypted
+
+KEY = "kunci verifikasi"
+DATA = bytes(range(256)) * 300
+LEVELS = ("header", "sampled", "full")
+
+
+def _enc(data: bytes = DATA) -> bytes:
+    out = io.BytesIO()
+    encrypt_to(io.BytesIO(data), out, KEY, name="data.bin", index_chunk=4096)
+    return out.getvalue()
+
+
+def _verify(enc_bytes: bytes, key: str, level: str):
+    enc = io.BytesIO(enc_bytes)
+    plain, stats, meta = decrypt_stream(enc, key)
+    try:
+        return verify_decrypted(plain, enc, key, stats, meta, level)
+    finally:
+        plain.close()
+
+
+def _flip(enc_bytes: bytes, pos: int) -> bytes:
+    b = bytearray(enc_bytes); b[pos] ^= 0x01
+    return bytes(b)
+
+
+@pytest.mark.parametrize("level", LEVELS)
+def test_valid_container(level):
+    assert _verify(_enc(), KEY, level) == (True, level)
+
+
+@pytest.mark.parametrize("level", LEVELS)
+@pytest.mark.parametrize("where", ("first", "middle", "last"))
+def test_tampered_payload_fails(level, where):
+    enc = _enc()
+    meta = read_container(io.BytesIO(enc))
+    off = {"first": 0, "middle": meta["size"] // 2, "last": meta["size"] - 1}[where]
+    ok, used = _verify(_flip(enc, meta["data_start"] + off), KEY, level)
+    assert not ok and used == "header"
+
+
+@pytest.mark.parametrize("level", LEVELS)
+def test_wrong_key_fails(level):
+    assert _verify(_enc(), "key lain", level) == (False, "key")
+
+
+@pytest.mark.parametrize("level", LEVELS)
+def test_empty_container(level):
+    assert _verify(_enc(b""), KEY, level) == (True, level)
+
+
+@pytest.mark.parametrize("level", LEVELS)
+def test_legacy_valid(level):
+    # tanpa trailer: "header" turun ke "sampled"
+    ok, used = _verify(vigenere_encrypt_bytes(DATA, KEY), KEY, level)
+    assert ok and used == ("full" if level == "full" else "sampled")
+
+
+@pytest.mark.parametrize("level", ("sampled", "full"))
+def test_legacy_mismatched_plain_fails(level):
+    # legacy hanya bisa membandingkan plaintext dengan ciphertext lewat re-encrypt
+    enc_bytes = vigenere_encrypt_bytes(DATA, KEY)
+    enc = io.BytesIO(enc_bytes)
+    plain, stats, meta = decrypt_stream(enc, KEY)
+    bad = io.BytesIO(_flip(plain.read(), 0)); plain.close()
+    assert verify_decrypted(bad, enc, KEY, stats, meta, level) == (False, level)
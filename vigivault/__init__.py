@@ -0,0 +1,52 @@
+"""VigiVault — engine Vigenere klasik (A–Z) dan byte-wise (0–255) tanpa UI.
+
+Submodule (dan NumPy) baru di-import saat atribut pertama kali dipakai,
+sehingga ``import vigivault`` dan CLI tetap ringan.
+"""
+
+import importlib
+
+__version__ = "2.0.0"
+
+_EXPORTS = {
+    "utils": ["hex_preview", "sha256", "clean_filename", "iter_file_chunks", "STREAM_CHUNK"],
+    "keys": ["estimate_key_strength", "random_key", "key_fingerprint", "key_digest"],
+    "schedule": ["KeySchedule", "key_schedule"],
+    "stats": ["FileStats", "shannon_entropy"],
+    "classic": ["vigenere_encrypt_classic", "vigenere_decrypt_classic",
+                "vigenere_encrypt_classic_ref", "vigenere_decrypt_classic_ref",
+                "iter_encrypt_classic", "iter_decrypt_classic", "transform_text_to", "stream_transform_text"],
+    "bytewise": ["vigenere_encrypt_bytes", "vigenere_decrypt_bytes",
+                 "vigenere_encrypt_bytes_ref", "vigenere_decrypt_bytes_ref",
+                 "vigenere_encrypt_bytes_parallel", "vigenere_decrypt_bytes_parallel",
+                 "iter_encrypt_bytes", "iter_decrypt_bytes", "transform_to", "stream_transform"],
+    "container": ["read_container", "encrypt_to", "encrypt_stream", "decrypt_to", "decrypt_stream",
+                  "decrypt_range", "verify_range", "verify_reencrypt", "verify_sampled",
+                  "verify_decrypted", "VERIFY_LEVELS"],
+    "localfile": ["encrypt_file", "decrypt_file"],
+    "batch": ["encrypt_batch", "encrypt_batch_to_tempzip", "items_from_paths", "items_from_dir",
+              "items_from_zip", "items_from_uploads"],
+    "compare": ["compare_streams"],
+    "hexview": ["format_hex", "view_page", "parse_offset"],
+    "cache": ["ResultCache", "SharedFile"],
+    "jobs": ["JobQueue", "Job", "JobCancelled"],
+    "metrics": ["recording", "stage", "Recorder", "jsonl_sink", "to_jsonl"],
+    "analysis": ["break_classic", "break_bytes", "estimate_key_length", "friedman_key_length",
+                 "index_of_coincidence", "period_scores", "time_to_break"],
+}
+_LOOKUP = {name: mod for mod, names in _EXPORTS.items() for name in names}
+
+__all__ = sorted(_LOOKUP)
+
+
+def __getattr__(name):
+    mod = _LOOKUP.get(name)
+    if mod is None:
+        raise AttributeError(f"module 'vigivault' has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{mod}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
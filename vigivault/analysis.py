@@ -0,0 +1,184 @@
+"""Kriptanalisis Vigenere (Kasiski/Friedman): estimasi panjang key dan pemulihan key."""
+
+import time
+
+import numpy as np
+
+from .bytewise import vigenere_encrypt_bytes
+from .classic import _char_tables, vigenere_encrypt_classic
+from .schedule import _clean_key_alpha
+
+# Frekuensi huruf bahasa Inggris (%), A–Z.
+ENGLISH_FREQ = np.array([8.167, 1.492, 2.782, 4.253, 12.702, 2.228, 2.015, 6.094, 6.966, 0.153, 0.772, 4.025,
+                         2.406, 6.749, 7.507, 1.929, 0.095, 5.987, 6.327, 9.056, 2.758, 0.978, 2.360, 0.150,
+                         1.974, 0.074])
+
+ANALYSIS_SAMPLE = 1 << 20   # cukup untuk statistik kolom; file besar hanya dianalisis prefix-nya
+MAX_KEY_LEN = 64            # = panjang maksimum random_key di UI
+COLUMN_SAMPLES = {"classic": 120, "bytes": 400}   # ciphertext per kolom key agar pemulihan andal
+
+
+def _byte_profile() -> np.ndarray:
+    # Profil byte plaintext "teks" generik: huruf (frekuensi Inggris), spasi,
+    # newline, angka, tanda baca; sisa byte diberi massa kecil.
+    p = np.full(256, 1e-4)
+    low = ENGLISH_FREQ / ENGLISH_FREQ.sum()
+    p[97:123] += 0.62 * low
+    p[65:91] += 0.04 * low
+    p[32] += 0.17
+    p[10] += 0.02
+    p[48:58] += 0.02 / 10
+    for c in b".,;:'\"-()!?":
+        p[c] += 0.03 / 11
+    return p / p.sum()
+
+BYTE_PROFILE = _byte_profile()
+LETTER_PROFILE = ENGLISH_FREQ / ENGLISH_FREQ.sum()
+
+
+# ==============================
+# STATISTIK KOLOM (Friedman)
+# ==============================
+# Index of coincidence: peluang dua simbol acak dari teks sama. Plaintext alami
+# jauh di atas 1/alphabet; ciphertext yang kolomnya dipisah per periode key
+# yang benar kembali ke IoC plaintext karena tiap kolom hanya digeser konstan.
+def index_of_coincidence(vals: np.ndarray, alphabet: int) -> float:
+    n = vals.size
+    if n < 2:
+        return 0.0
+    c = np.bincount(vals, minlength=alphabet).astype(np.float64)
+    return float((c * (c - 1)).sum() / (n * (n - 1)))
+
+def column_hist(vals: np.ndarray, period: int, alphabet: int) -> np.ndarray:
+    # histogram (period, alphabet) dalam satu bincount: kode = kolom*alphabet + simbol
+    n = vals.size - vals.size % period
+    codes = vals[:n].astype(np.int32, copy=False).reshape(-1, period) + np.arange(period, dtype=np.int32) * alphabet
+    return np.bincount(codes.ravel(), minlength=period * alphabet).reshape(period, alphabet)
+
+def period_scores(vals: np.ndarray, alphabet: int, max_len: int = MAX_KEY_LEN) -> np.ndarray:
+    # rata-rata IoC kolom untuk periode 1..max_len (indeks = periode - 1)
+    max_len = max(1, min(max_len, vals.size // 8))
+    scores = np.zeros(max_len)
+    vals = vals.astype(np.int32)
+    for p in range(1, max_len + 1):
+        c = column_hist(vals, p, alphabet).astype(np.float64)
+        n = c.sum(axis=1)
+        scores[p - 1] = ((c * (c - 1)).sum(axis=1) / np.maximum(n * (n - 1), 1)).mean()
+    return scores
+
+def estimate_key_length(vals: np.ndarray, alphabet: int, max_len: int = MAX_KEY_LEN, scores=None) -> int:
+    # Kelipatan periode benar juga memberi IoC tinggi: ambil periode terkecil
+    # yang sudah mencapai 80% jarak dari IoC acak ke IoC terbaik.
+    if scores is None:
+        scores = period_scores(vals, alphabet, max_len)
+    base = 1.0 / alphabet
+    best = scores.max()
+    if best <= base:
+        return 1
+    return int(np.flatnonzero(scores >= base + 0.8 * (best - base))[0]) + 1
+
+def _detected(scores: np.ndarray, alphabet: int) -> bool:
+    # plaintext tanpa struktur (terkompresi/acak) tidak memberi puncak IoC:
+    # hasil estimasi dianggap tidak bermakna bila IoC terbaik < 1.5× acak
+    return bool(scores.max() >= 1.5 / alphabet)
+
+def friedman_key_length(vals: np.ndarray, alphabet: int = 26, profile: np.ndarray = LETTER_PROFILE) -> float:
+    # Rumus Friedman: L ≈ (κp − κr) / (κo − κr)
+    kp = float((profile ** 2).sum()); kr = 1.0 / alphabet
+    ko = index_of_coincidence(vals, alphabet)
+    return (kp - kr) / (ko - kr) if ko > kr else float("inf")
+
+
+# ==============================
+# PEMULIHAN KEY (frekuensi per kolom)
+# ==============================
+# Untuk tiap kolom, semua pergeseran k dinilai sekaligus: skor[k] =
+# Σ_c hist[c] · log q[(c − k) mod A], yaitu log-likelihood plaintext hasil
+# dekripsi dengan k terhadap profil q. Satu perkalian matriks (period × A × A).
+def recover_shifts(hist: np.ndarray, profile: np.ndarray) -> np.ndarray:
+    a = profile.size
+    logq = np.log(np.maximum(profile, 1e-12))
+    shift_matrix = logq[(np.arange(a)[:, None] - np.arange(a)[None, :]) % a]
+    return np.argmax(hist @ shift_matrix, axis=1)
+
+def _profile_from(reference, alphabet: int, default: np.ndarray) -> np.ndarray:
+    if reference is None:
+        return default
+    ref = np.asarray(reference, dtype=np.float64)
+    if ref.size != alphabet:
+        raise ValueError(f"Profil referensi harus {alphabet} bin.")
+    ref = ref + 1e-3 * max(ref.sum(), 1.0) / alphabet
+    return ref / ref.sum()
+
+def classic_letters(text: str) -> np.ndarray:
+    # nilai 0–25 dari huruf yang memajukan key (sama persis dengan engine klasik)
+    cps = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+    tables = _char_tables(cps)
+    if tables is None:
+        return np.array([(ord(c.upper()[0]) - 65) % 26 for c in text if c.isalpha()], dtype=np.uint8)
+    idx, is_alpha, _, base = tables
+    return base[idx[is_alpha[idx]]]
+
+def break_classic(ct: str, max_len: int = MAX_KEY_LEN, reference=None, sample: int = ANALYSIS_SAMPLE) -> dict:
+    vals = classic_letters(ct)[:sample]
+    if vals.size < 2:
+        raise ValueError("Ciphertext terlalu pendek untuk dianalisis.")
+    profile = _profile_from(reference, 26, LETTER_PROFILE)
+    scores = period_scores(vals, 26, max_len)
+    klen = estimate_key_length(vals, 26, max_len, scores)
+    shifts = recover_shifts(column_hist(vals, klen, 26), profile)
+    return {"key_len": klen, "key": "".join(chr(65 + int(s)) for s in shifts),
+            "friedman": friedman_key_length(vals, 26, profile), "detected": _detected(scores, 26),
+            "scores": scores, "letters": int(vals.size)}
+
+# Byte-wise: kolom = posisi mod panjang key (byte UTF-8). Profil default
+# adalah teks; untuk file biner berikan `reference` berupa histogram 256-bin
+# dari plaintext sejenis (mis. FileStats.hist file lain bertipe sama).
+def break_bytes(data, max_len: int = MAX_KEY_LEN, reference=None, sample: int = ANALYSIS_SAMPLE) -> dict:
+    vals = np.frombuffer(data, dtype=np.uint8)[:sample]
+    if vals.size < 2:
+        raise ValueError("Ciphertext terlalu pendek untuk dianalisis.")
+    profile = _profile_from(reference, 256, BYTE_PROFILE)
+    scores = period_scores(vals, 256, max_len)
+    klen = estimate_key_length(vals, 256, max_len, scores)
+    key_bytes = recover_shifts(column_hist(vals, klen, 256), profile).astype(np.uint8).tobytes()
+    return {"key_len": klen, "key_bytes": key_bytes, "key": key_bytes.decode("utf-8", errors="replace"),
+            "detected": _detected(scores, 256), "scores": scores, "bytes": int(vals.size)}
+
+
+# ==============================
+# ESTIMASI WAKTU BOBOL
+# ==============================
+# Simulasi serangan nyata: plaintext sintetis (profil teks) secukupnya untuk
+# panjang key ini dienkripsi dengan key tersebut, lalu dibobol dan diukur.
+# Hasil = waktu serangan ciphertext-only untuk plaintext berupa teks.
+def time_to_break(key: str, mode: str = "bytes", seed: int = 0) -> dict | None:
+    rng = np.random.default_rng(seed)
+    if mode == "classic":
+        k = _clean_key_alpha(key)
+        if not k:
+            return None
+        n = len(k) * COLUMN_SAMPLES["classic"]
+        plain = "".join(chr(65 + c) for c in rng.choice(26, n, p=LETTER_PROFILE).tolist())
+        ct = vigenere_encrypt_classic(plain, k)
+        t0 = time.perf_counter()
+        res = break_classic(ct, max_len=max(MAX_KEY_LEN, len(k)))
+        secs = time.perf_counter() - t0
+        ok = vigenere_encrypt_classic(plain, res["key"]) == ct
+    elif mode == "bytes":
+        kb = key.encode("utf-8")
+        if not kb:
+            return None
+        n = len(kb) * COLUMN_SAMPLES["bytes"]
+        plain = rng.choice(256, n, p=BYTE_PROFILE).astype(np.uint8).tobytes()
+        ct = vigenere_encrypt_bytes(plain, key)
+        t0 = time.perf_counter()
+        res = break_bytes(ct, max_len=max(MAX_KEY_LEN, len(kb)))
+        secs = time.perf_counter() - t0
+        # key periodik (mis. "abab") boleh terbaca sebagai periode terpendeknya
+        ok = np.array_equal(np.resize(np.frombuffer(res["key_bytes"], dtype=np.uint8), n),
+                            np.resize(np.frombuffer(kb, dtype=np.uint8), n))
+    else:
+        raise ValueError(f"mode tidak dikenal: {mode}")
+    return {"mode": mode, "key_len": len(k) if mode == "classic" else len(kb), "ciphertext_len": n, "seconds": secs,
+            "recovered": bool(ok)}
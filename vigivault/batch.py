@@ -0,0 +1,94 @@
+"""Batch: enkripsi banyak file secara paralel ke satu zip berisi file .enc."""
+
+import contextlib
+import contextvars
+import os
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from .container import encrypt_stream
+from .schedule import KeySchedule, key_schedule
+from .utils import STREAM_CHUNK, _spool, iter_file_chunks
+
+BATCH_WORKERS = min(4, os.cpu_count() or 1)
+
+# Item batch = (nama relatif, opener, size). opener() mengembalikan context
+# manager yang menghasilkan file-like, sehingga file lokal/anggota zip ditutup
+# setelah dipakai, sedangkan upload Streamlit dibiarkan terbuka.
+
+def items_from_paths(paths: list) -> list:
+    items = []
+    for path in paths:
+        if os.path.isdir(path):
+            items.extend(items_from_dir(path))
+        else:
+            items.append((os.path.basename(path), lambda p=path: open(p, "rb"), os.path.getsize(path)))
+    return items
+
+def items_from_dir(root: str) -> list:
+    items = []
+    for base, _, files in os.walk(root):
+        for fn in sorted(files):
+            path = os.path.join(base, fn)
+            rel = os.path.relpath(path, root).replace(os.sep, "/")
+            items.append((rel, lambda p=path: open(p, "rb"), os.path.getsize(path)))
+    return items
+
+def items_from_zip(zf: zipfile.ZipFile) -> list:
+    return [(info.filename, lambda n=info.filename: zf.open(n), info.file_size)
+            for info in zf.infolist() if not info.is_dir()]
+
+def items_from_uploads(files: list) -> list:
+    return [(f.name, lambda f=f: contextlib.nullcontext(f), f.size) for f in files]
+
+def _unique_name(name: str, used: set) -> str:
+    cand = name; i = 1
+    while cand in used:
+        stem, ext = os.path.splitext(name)
+        cand = f"{stem}_{i}{ext}"; i += 1
+    used.add(cand)
+    return cand
+
+def _encrypt_item(item, key: KeySchedule, chunk_size: int):
+    name, opener, _ = item
+    t0 = time.perf_counter()
+    with opener() as src:
+        dst, stats = encrypt_stream(src, key, name=os.path.basename(name), chunk_size=chunk_size)
+    return dst, stats, time.perf_counter() - t0
+
+# Worker pool mengenkripsi tiap file ke file temporer; thread pemanggil
+# menyalin hasil yang sudah selesai ke zip `out` per chunk (zipfile tidak
+# thread-safe untuk menulis). Memori O(workers × chunk) berapa pun jumlah file.
+# Key schedule dibangun sekali dan dipakai bersama oleh semua worker.
+# on_progress(selesai, total, record) dipanggil dari thread pemanggil.
+def encrypt_batch(items: list, key: str | KeySchedule, out, workers: int | None = None, chunk_size: int = STREAM_CHUNK,
+                  on_progress=None) -> list:
+    results = []; used = set(); key = key_schedule(key)
+    with zipfile.ZipFile(out, "w", compression=zipfile.ZIP_STORED, allowZip64=True) as zf, \
+            ThreadPoolExecutor(max_workers=workers or BATCH_WORKERS, thread_name_prefix="vigi-batch") as ex:
+        # tiap task membawa salinan context pemanggil (recorder metrics ikut ke worker)
+        futs = {ex.submit(contextvars.copy_context().run, _encrypt_item, it, key, chunk_size): it for it in items}
+        for done, fut in enumerate(as_completed(futs), 1):
+            name, _, size = futs[fut]
+            try:
+                dst, stats, secs = fut.result()
+            except Exception as e:
+                rec = {"name": name, "size": size, "ok": False, "error": str(e)}
+            else:
+                arc = _unique_name(name + ".enc", used)
+                with dst, zf.open(arc, "w", force_zip64=True) as zw:
+                    for chunk in iter_file_chunks(dst, chunk_size):
+                        zw.write(chunk)
+                rec = {"name": name, "output": arc, "size": size, "enc_size": stats.size, "seconds": secs,
+                       "mb_s": (size / (1 << 20)) / secs if secs > 0 else 0.0, "ok": True}
+            results.append(rec)
+            if on_progress is not None:
+                on_progress(done, len(items), rec)
+    return results
+
+# Sama seperti encrypt_batch, tetapi zip ditulis ke file temporer di disk.
+# Return (zip raw file di disk, results).
+def encrypt_batch_to_tempzip(items: list, key: str | KeySchedule, workers: int | None = None,
+                             chunk_size: int = STREAM_CHUNK, on_progress=None):
+    return _spool(lambda w: encrypt_batch(items, key, w, workers, chunk_size, on_progress), chunk_size)
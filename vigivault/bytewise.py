@@ -0,0 +1,156 @@
+"""Vigenere byte-wise (0–255, mod 256): engine NumPy, paralel, dan streaming."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from .metrics import stage
+from .schedule import KeySchedule, key_schedule
+from .stats import FileStats
+from .utils import STREAM_CHUNK, _spool, _tap, iter_file_chunks
+
+# ==============================
+# VIGENERE BYTE-WISE (0–255)
+# ==============================
+# Referensi pure-Python (lambat, dipakai untuk uji paritas engine NumPy).
+def vigenere_encrypt_bytes_ref(data: bytes, key: str | KeySchedule) -> bytes:
+    key_bytes = _key_bytes(key)
+    out = bytearray(); klen = len(key_bytes)
+    for i, b in enumerate(data):
+        out.append((b + key_bytes[i % klen]) % 256)
+    return bytes(out)
+
+def vigenere_decrypt_bytes_ref(data: bytes, key: str | KeySchedule) -> bytes:
+    key_bytes = _key_bytes(key)
+    out = bytearray(); klen = len(key_bytes)
+    for i, b in enumerate(data):
+        out.append((b - key_bytes[i % klen]) % 256)
+    return bytes(out)
+
+# Engine NumPy: keystream ter-tile diambil dari KeySchedule (dibangun sekali
+# per key, fase = slice), lalu add uint8 (wraparound otomatis = mod 256) ke
+# buffer output per blok KEY_TILE; dekripsi menambahkan shift ternegasi.
+
+def _key_bytes(key: str | KeySchedule) -> bytes:
+    return key_schedule(key).require_bytes()
+
+def _vigenere_bytes_into(src, dst, key: str | KeySchedule, decrypt: bool = False, offset: int = 0) -> None:
+    # offset = posisi absolut byte pertama src dalam stream (fase key).
+    a = np.frombuffer(src, dtype=np.uint8)
+    o = np.frombuffer(dst, dtype=np.uint8)
+    n = a.size
+    if n == 0:
+        return
+    ks = key_schedule(key).keystream(offset, decrypt)
+    block = ks.size
+    for s in range(0, n, block):
+        e = min(s + block, n)
+        np.add(a[s:e], ks[:e - s], out=o[s:e])
+
+def vigenere_encrypt_bytes(data: bytes, key: str | KeySchedule) -> bytes:
+    out = bytearray(len(data))
+    _vigenere_bytes_into(data, out, key_schedule(key))
+    return bytes(out)
+
+def vigenere_decrypt_bytes(data: bytes, key: str | KeySchedule) -> bytes:
+    out = bytearray(len(data))
+    _vigenere_bytes_into(data, out, key_schedule(key), decrypt=True)
+    return bytes(out)
+
+# ==============================
+# PARALEL BYTE-WISE (multi-core)
+# ==============================
+# Shard dimulai pada kelipatan panjang key sehingga tiap shard bisa diproses
+# independen; ufunc NumPy melepas GIL sehingga thread pool cukup (tanpa copy
+# antar proses) dan semua worker menulis langsung ke buffer output bersama.
+PARALLEL_MIN_SHARD = 1 << 20
+_POOL = None
+
+def _pool() -> ThreadPoolExecutor:
+    global _POOL
+    if _POOL is None:
+        _POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="vigi")
+    return _POOL
+
+def _plan_shards(n: int, klen: int, workers: int | None = None) -> list:
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or n < 2 * PARALLEL_MIN_SHARD:
+        return [(0, n)]
+    shard = max(PARALLEL_MIN_SHARD, -(-n // workers))
+    shard = -(-shard // klen) * klen
+    return [(s, min(s + shard, n)) for s in range(0, n, shard)]
+
+def _vigenere_bytes_into_parallel(src, dst, key: str | KeySchedule, decrypt: bool = False, offset: int = 0,
+                                  workers: int | None = None) -> None:
+    sched = key_schedule(key)
+    a = memoryview(src).cast("B"); o = memoryview(dst).cast("B")
+    shards = _plan_shards(len(a), len(sched.require_bytes()), workers)
+    if len(shards) == 1:
+        _vigenere_bytes_into(a, o, sched, decrypt=decrypt, offset=offset)
+        return
+    futs = [_pool().submit(_vigenere_bytes_into, a[s:e], o[s:e], sched, decrypt, offset + s)
+            for s, e in shards]
+    for fut in futs:
+        fut.result()
+
+def vigenere_encrypt_bytes_parallel(data: bytes, key: str | KeySchedule, workers: int | None = None) -> bytes:
+    out = bytearray(len(data))
+    _vigenere_bytes_into_parallel(data, out, key_schedule(key), workers=workers)
+    return bytes(out)
+
+def vigenere_decrypt_bytes_parallel(data: bytes, key: str | KeySchedule, workers: int | None = None) -> bytes:
+    out = bytearray(len(data))
+    _vigenere_bytes_into_parallel(data, out, key_schedule(key), decrypt=True, workers=workers)
+    return bytes(out)
+
+# ==============================
+# STREAMING BYTE-WISE (chunked)
+# ==============================
+# Fase key dibawa antar chunk sehingga ukuran chunk berapa pun menghasilkan
+# output yang sama persis dengan fungsi one-shot di atas.
+def _iter_vigenere_bytes(chunks, key: str | KeySchedule, decrypt: bool):
+    sched = key_schedule(key); sched.require_bytes()
+    pos = 0
+    for chunk in chunks:
+        with stage("cipher", len(chunk)):
+            out = bytearray(len(chunk))
+            _vigenere_bytes_into_parallel(chunk, out, sched, decrypt=decrypt, offset=pos)
+        pos += len(chunk)
+        yield bytes(out)
+
+def iter_encrypt_bytes(chunks, key: str | KeySchedule):
+    return _iter_vigenere_bytes(chunks, key, decrypt=False)
+
+def iter_decrypt_bytes(chunks, key: str | KeySchedule):
+    return _iter_vigenere_bytes(chunks, key, decrypt=True)
+
+# Tulis hasil enkripsi/dekripsi `src` ke writer `w` (file, stdout, atau None
+# untuk dibuang). Return FileStats output — statistik terisi sambil menulis.
+def transform_to(src, w, key: str | KeySchedule, decrypt: bool = False, chunk_size: int = STREAM_CHUNK,
+                 head_n: int = 64, start: int = 0, limit: int | None = None, on_input=None,
+                 prefix: bytes = b"") -> FileStats:
+    stats = FileStats(head_n)
+    if prefix:
+        if w is not None:
+            w.write(prefix)
+        stats.update(prefix)
+    chunks = iter_file_chunks(src, chunk_size, start=start, limit=limit)
+    if on_input is not None:
+        chunks = _tap(chunks, on_input)
+    for out in _iter_vigenere_bytes(chunks, key, decrypt):
+        if w is not None:
+            with stage("write", len(out)):
+                w.write(out)
+        stats.update(out)
+    return stats
+
+# Enkripsi/dekripsi file-like `src` ke file temporer di disk; transformasinya
+# memakai memori O(chunk). Return (dst, FileStats output), dst berupa raw file
+# (io.RawIOBase). Menyerahkan dst langsung ke st.download_button membaca
+# seluruh file ke memori di setiap rerun; app memberi callable (dibaca saat diklik).
+def stream_transform(src, key: str | KeySchedule, decrypt: bool = False, chunk_size: int = STREAM_CHUNK,
+                     head_n: int = 64, start: int = 0, limit: int | None = None, on_input=None,
+                     prefix: bytes = b""):
+    return _spool(lambda w: transform_to(src, w, key, decrypt, chunk_size, head_n, start, limit, on_input, prefix),
+                  chunk_size)
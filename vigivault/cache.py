@@ -0,0 +1,172 @@
+"""Cache hasil LRU yang dibatasi total byte."""
+
+import io
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from .metrics import note
+
+# ==============================
+# FILE HASIL BERSAMA
+# ==============================
+# Hasil transform (file temporer) dibagi banyak sesi dan thread lewat cache.
+# SharedFile menghitung referensi: cache memegang satu, tiap pemilik lain
+# (job yang selesai, handle baca) memegang satu, dan file baru ditutup saat
+# referensi terakhir dilepas, sehingga eviction tidak menutup file yang masih
+# dipakai sesi lain. Pembaca tidak pernah memakai posisi file bersama: open()
+# memberi handle dengan posisi sendiri (os.pread; fallback seek+read di bawah lock).
+class SharedFile:
+    def __init__(self, f):
+        self._f = f
+        self._refs = 1
+        self._lock = threading.Lock()
+        try:
+            self._fd = f.fileno() if hasattr(os, "pread") else None
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            self._fd = None
+
+    @property
+    def closed(self) -> bool:
+        return self._refs == 0
+
+    def acquire(self) -> "SharedFile":
+        with self._lock:
+            if self._refs == 0:
+                raise ValueError("File hasil sudah ditutup.")
+            self._refs += 1
+        return self
+
+    def release(self) -> None:
+        with self._lock:
+            self._refs -= 1
+            last = self._refs == 0
+        if last:
+            self._f.close()
+
+    def open(self) -> "FileHandle":
+        return FileHandle(self.acquire())
+
+    def size(self) -> int:
+        if self._fd is not None:
+            return os.fstat(self._fd).st_size
+        with self._lock:
+            return self._f.seek(0, io.SEEK_END)
+
+    def pread(self, n: int, pos: int) -> bytes:
+        if self._fd is not None:
+            return os.pread(self._fd, n, pos)
+        with self._lock:
+            self._f.seek(pos)
+            return self._f.read(n)
+
+class FileHandle(io.RawIOBase):
+    def __init__(self, shared: SharedFile):
+        super().__init__()
+        self._shared = shared
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        data = self._shared.pread(len(b), self._pos)
+        n = len(data); b[:n] = data; self._pos += n
+        return n
+
+    def readall(self) -> bytes:
+        data = self._shared.pread(max(0, self._shared.size() - self._pos), self._pos)
+        self._pos += len(data)
+        return data
+
+    def seek(self, pos: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._pos, io.SEEK_END: self._shared.size()}[whence]
+        if base + pos < 0:
+            raise ValueError("Posisi negatif.")
+        self._pos = base + pos
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+    def close(self) -> None:
+        if not self.closed:
+            self._shared.release()
+        super().close()
+
+def _members(value):
+    return value if isinstance(value, tuple) else (value,)
+
+def _share(value):
+    # file-like di dalam hasil (atau hasil itu sendiri) dibungkus SharedFile
+    def wrap(v):
+        return SharedFile(v) if hasattr(v, "read") and hasattr(v, "close") and not isinstance(v, SharedFile) else v
+    return tuple(wrap(v) for v in value) if isinstance(value, tuple) else wrap(value)
+
+def retain(value):
+    for v in _members(value):
+        if isinstance(v, SharedFile):
+            v.acquire()
+    return value
+
+def release(value) -> None:
+    for v in _members(value):
+        if isinstance(v, SharedFile):
+            v.release()
+
+# ==============================
+# CACHE LRU
+# ==============================
+# Hasil yang memuat SharedFile dikembalikan dengan satu referensi milik
+# pemanggil (diambil di bawah lock, jadi tidak bisa ditutup oleh eviction di
+# antaranya); pemanggil melepasnya dengan release(), di app lewat JobQueue.
+# Single-flight: pemanggil lain dengan key yang sedang dihitung menunggu hasil
+# perhitungan itu (mis. job dekripsi level header dan full untuk file + key
+# yang sama), bukan menghitung ulang secara bersamaan.
+class ResultCache:
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.total = 0
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key: tuple, compute, cost=lambda v: 0):
+        while True:
+            with self._lock:
+                if key in self._items:
+                    self._items.move_to_end(key); self.hits += 1
+                    note("cache_hit", 0.0)
+                    return retain(self._items[key][0])
+                pending = self._pending.get(key)
+                if pending is None:
+                    pending = self._pending[key] = threading.Event()
+                    self.misses += 1
+                    break
+            # dihitung thread lain: tunggu, lalu ulangi (hit, atau hitung sendiri bila gagal)
+            t0 = time.perf_counter(); pending.wait()
+            note("cache_wait", time.perf_counter() - t0)
+        try:
+            value = _share(compute())
+            size = max(1, int(cost(value)))
+            with self._lock:
+                self._items[key] = (value, size); self.total += size
+                retain(value)
+                while self.total > self.max_bytes and len(self._items) > 1:
+                    _, (old, old_size) = self._items.popitem(last=False)
+                    self.total -= old_size
+                    release(old)
+        finally:
+            with self._lock:
+                del self._pending[key]
+            pending.set()
+        return value
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._items), "bytes": self.total}
@@ -0,0 +1,178 @@
+"""Vigenere klasik (A–Z, mod 26): engine NumPy dan streaming teks UTF-8."""
+
+import codecs
+import string
+
+import numpy as np
+
+from .metrics import stage
+from .schedule import KeySchedule, key_schedule
+from .utils import _spool, _tap, iter_file_chunks
+
+ALPHABET = string.ascii_uppercase
+
+# Huruf yang upper()-nya lebih dari satu karakter (mis. "ß" → "SS") tidak
+# punya posisi tunggal A–Z: ditolak dengan ValueError yang menyebut karakter
+# dan offset-nya (offset karakter dalam teks/stream).
+def _unsupported(ch: str, pos: int) -> ValueError:
+    return ValueError(f"Karakter {ch!r} (U+{ord(ch):04X}) pada offset karakter {pos} tidak didukung "
+                      f"Vigenere klasik: huruf besarnya {ch.upper()!r} lebih dari satu karakter.")
+
+# Referensi per-karakter (lambat, dipakai untuk uji kesetaraan engine NumPy).
+def vigenere_encrypt_classic_ref(pt: str, key: str | KeySchedule, keep_non_letters: bool = True) -> str:
+    key = key_schedule(key).require_alpha()
+    res = []; j = 0
+    for i, ch in enumerate(pt):
+        if ch.isalpha():
+            if len(ch.upper()) != 1:
+                raise _unsupported(ch, i)
+            p = (ord(ch.upper()) - 65)
+            k = (ord(key[j % len(key)]) - 65)
+            c = (p + k) % 26
+            out = chr(c + 65)
+            out = out if ch.isupper() else out.lower()
+            res.append(out); j += 1
+        else:
+            res.append(ch if keep_non_letters else "")
+    return "".join(res)
+
+def vigenere_decrypt_classic_ref(ct: str, key: str | KeySchedule, keep_non_letters: bool = True) -> str:
+    key = key_schedule(key).require_alpha()
+    res = []; j = 0
+    for i, ch in enumerate(ct):
+        if ch.isalpha():
+            if len(ch.upper()) != 1:
+                raise _unsupported(ch, i)
+            c = (ord(ch.upper()) - 65)
+            k = (ord(key[j % len(key)]) - 65)
+            p = (c - k) % 26
+            out = chr(p + 65)
+            out = out if ch.isupper() else out.lower()
+            res.append(out); j += 1
+        else:
+            res.append(ch if keep_non_letters else "")
+    return "".join(res)
+
+# Engine NumPy: teks dilihat sebagai array codepoint (UTF-32). Properti tiap
+# karakter unik (huruf? kapital? nilai A–Z) dihitung sekali lewat lookup table,
+# lalu shift key (dari KeySchedule) di-tile sepanjang huruf saja (j maju hanya
+# pada huruf). Tabel ASCII tidak bergantung teks: dibangun sekali saja.
+def _tables_for(uniq: np.ndarray):
+    chars = [chr(u) for u in uniq.tolist()]
+    is_alpha = np.array([c.isalpha() for c in chars], dtype=bool)
+    is_upper = np.array([c.isupper() for c in chars], dtype=bool)
+    ups = [c.upper() if a else "A" for c, a in zip(chars, is_alpha)]
+    if any(len(u) != 1 for u in ups):
+        return None
+    base = np.array([(ord(u) - 65) % 26 for u in ups], dtype=np.uint8)
+    return is_alpha, is_upper, base
+
+_ASCII_TABLES = _tables_for(np.arange(128, dtype=np.uint32))
+for _t in _ASCII_TABLES:
+    _t.flags.writeable = False   # dibagi semua pemanggil
+
+def _char_tables(cps: np.ndarray):
+    top = int(cps.max()) + 1 if cps.size else 1
+    if top <= 128:
+        return (cps, *_ASCII_TABLES)
+    present = np.zeros(top, dtype=bool); present[cps] = True
+    uniq = np.flatnonzero(present).astype(np.uint32)
+    lut = np.zeros(top, dtype=np.int32); lut[uniq] = np.arange(uniq.size, dtype=np.int32)
+    tables = _tables_for(uniq)
+    return None if tables is None else (lut[cps], *tables)
+
+# j = posisi key (jumlah huruf sebelum `text` dalam stream), pos = offset
+# karakter awal `text` dalam stream (untuk pesan error). Return (hasil, jumlah
+# huruf di `text`) agar pemanggil streaming bisa memajukan j.
+def _vigenere_classic_chunk(text: str, sched: KeySchedule, keep_non_letters: bool, decrypt: bool,
+                            j: int = 0, pos: int = 0) -> tuple:
+    sched.require_alpha()
+    cps = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+    tables = _char_tables(cps)
+    if tables is None:
+        i, ch = next((i, c) for i, c in enumerate(text) if c.isalpha() and len(c.upper()) != 1)
+        raise _unsupported(ch, pos + i)
+    idx, is_alpha, is_upper, base = tables
+    mask = is_alpha[idx]
+    li = idx[mask]
+    k = sched.classic_stream(li.size, j, decrypt=decrypt)
+    val = (base[li] + k) % 26
+    out = cps.copy() if keep_non_letters else np.empty(li.size, dtype=np.uint32)
+    letters = (val + np.where(is_upper[li], 65, 97)).astype(np.uint32)
+    if keep_non_letters:
+        out[mask] = letters
+    else:
+        out[:] = letters
+    return out.tobytes().decode("utf-32-le"), li.size
+
+def _vigenere_classic_np(text: str, key: str | KeySchedule, keep_non_letters: bool, decrypt: bool) -> str:
+    return _vigenere_classic_chunk(text, key_schedule(key), keep_non_letters, decrypt)[0]
+
+def vigenere_encrypt_classic(pt: str, key: str | KeySchedule, keep_non_letters: bool = True) -> str:
+    return _vigenere_classic_np(pt, key, keep_non_letters, decrypt=False)
+
+def vigenere_decrypt_classic(ct: str, key: str | KeySchedule, keep_non_letters: bool = True) -> str:
+    return _vigenere_classic_np(ct, key, keep_non_letters, decrypt=True)
+
+# ==============================
+# STREAMING TEKS (file UTF-8 besar)
+# ==============================
+# Byte dibaca per chunk dan di-decode dengan decoder UTF-8 inkremental: urutan
+# multi-byte yang terpotong di batas chunk ditahan sampai chunk berikutnya.
+# Posisi key j (jumlah huruf sejauh ini) dibawa antar chunk, sehingga hasil
+# gabungan sama persis dengan vigenere_*_classic atas seluruh teks. Memori
+# O(chunk): tiap chunk ditulis (UTF-8) sebelum chunk berikutnya dibaca.
+TEXT_CHUNK = 1 << 20
+
+def _iter_vigenere_classic(chunks, key: str | KeySchedule, keep_non_letters: bool, decrypt: bool,
+                           errors: str = "strict"):
+    sched = key_schedule(key); sched.require_alpha()
+    dec = codecs.getincrementaldecoder("utf-8")(errors=errors)
+    j = pos = 0
+    for chunk in chunks:
+        text = dec.decode(chunk)
+        if text:
+            with stage("cipher", len(chunk)):
+                out, n = _vigenere_classic_chunk(text, sched, keep_non_letters, decrypt, j, pos)
+            j += n; pos += len(text)
+            yield out
+    text = dec.decode(b"", final=True)
+    if text:
+        yield _vigenere_classic_chunk(text, sched, keep_non_letters, decrypt, j, pos)[0]
+
+def iter_encrypt_classic(chunks, key: str | KeySchedule, keep_non_letters: bool = True, errors: str = "strict"):
+    return _iter_vigenere_classic(chunks, key, keep_non_letters, False, errors)
+
+def iter_decrypt_classic(chunks, key: str | KeySchedule, keep_non_letters: bool = True, errors: str = "strict"):
+    return _iter_vigenere_classic(chunks, key, keep_non_letters, True, errors)
+
+# Tulis hasil teks `src` (file-like biner, UTF-8) ke writer biner `w` (atau
+# None). Return dict ringkasan: byte masuk/keluar, karakter, dan huruf.
+def transform_text_to(src, w, key: str | KeySchedule, decrypt: bool = False, keep_non_letters: bool = True,
+                      chunk_size: int = TEXT_CHUNK, errors: str = "strict", on_output=None) -> dict:
+    info = {"bytes_in": 0, "bytes_out": 0, "chars": 0}
+    def count(chunk):
+        info["bytes_in"] += len(chunk)
+    for out in _iter_vigenere_classic(_tap(iter_file_chunks(src, chunk_size), count), key,
+                                      keep_non_letters, decrypt, errors):
+        b = out.encode("utf-8")
+        if w is not None:
+            with stage("write", len(b)):
+                w.write(b)
+        if on_output is not None:
+            on_output(b)
+        info["bytes_out"] += len(b); info["chars"] += len(out)
+    return info
+
+def stream_transform_text(src, key: str | KeySchedule, decrypt: bool = False, keep_non_letters: bool = True,
+                          chunk_size: int = TEXT_CHUNK, errors: str = "strict", head_n: int = 4096):
+    # Return (dst raw file di disk, info); info["head"] = head_n byte
+    # pertama output untuk preview.
+    head = bytearray()
+    def keep_head(b):
+        if len(head) < head_n:
+            head.extend(b[:head_n - len(head)])
+    dst, info = _spool(lambda w: transform_text_to(src, w, key, decrypt, keep_non_letters, chunk_size, errors,
+                                                   keep_head), chunk_size)
+    info["head"] = bytes(head)
+    return dst, info
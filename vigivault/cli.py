@@ -0,0 +1,389 @@
+"""CLI headless: ``vigivault encrypt|decrypt|verify|analyze|stats``.
+
+Hanya argparse/glob yang di-import di awal; engine (NumPy) di-load saat
+perintah dijalankan, sehingga startup tetap cepat untuk batch ribuan file.
+"""
+
+import argparse
+import contextlib
+import glob
+import json
+import os
+import sys
+import tempfile
+
+STDIO = "-"
+
+
+def _expand(patterns: list) -> list:
+    # Glob di-expand sendiri agar bekerja juga di shell tanpa globbing (Windows).
+    paths = []
+    for pat in patterns:
+        if pat == STDIO:
+            paths.append(pat); continue
+        hits = sorted(glob.glob(pat, recursive=True))
+        if not hits and not glob.has_magic(pat):
+            hits = [pat]
+        paths.extend(p for p in hits if p == pat or os.path.isfile(p))
+    return paths
+
+
+def _read_key(args) -> str:
+    if args.key is not None:
+        key = args.key
+    elif args.key_file:
+        with open(args.key_file, encoding="utf-8") as fh:
+            key = fh.read().rstrip("\r\n")
+    else:
+        key = os.environ.get(args.key_env, "")
+    if not key:
+        raise SystemExit("vigivault: key tidak boleh kosong (pakai --key, --key-file atau --key-env).")
+    return key
+
+
+def _open_in(path: str):
+    return sys.stdin.buffer if path == STDIO else open(path, "rb")
+
+
+def _open_seekable(path: str):
+    # decrypt/verify butuh seek (trailer dibaca dulu): stdin di-spool ke disk.
+    if path != STDIO:
+        return open(path, "rb")
+    from .utils import iter_file_chunks
+    tmp = tempfile.TemporaryFile()
+    for chunk in iter_file_chunks(sys.stdin.buffer):
+        tmp.write(chunk)
+    tmp.seek(0)
+    return tmp
+
+
+def _out_path(args, src: str, default_name: str) -> str:
+    if args.output:
+        return args.output
+    if src == STDIO:
+        return STDIO
+    base_dir = args.out_dir or os.path.dirname(src)
+    return os.path.join(base_dir, default_name)
+
+
+def _ensure_parent(path: str) -> None:
+    parent = os.path.dirname(path)
+    if parent:
+        os.makedirs(parent, exist_ok=True)
+
+
+def _open_out(path: str):
+    if path == STDIO:
+        return sys.stdout.buffer
+    _ensure_parent(path)
+    return open(path, "wb")
+
+
+def _close(fh) -> None:
+    if fh not in (sys.stdin.buffer, sys.stdout.buffer):
+        fh.close()
+    else:
+        fh.flush()
+
+
+def _report(args, record: dict) -> None:
+    if args.json:
+        print(json.dumps(record), file=sys.stderr if record.get("output") == STDIO else sys.stdout)
+    elif not args.quiet:
+        print("  ".join(f"{k}={v}" for k, v in record.items()), file=sys.stderr)
+
+
+def _recording(args, op: str, nbytes: int | None = None, **labels):
+    # --metrics: satu JSON line per operasi (per file) dengan waktu per tahap
+    if not args.metrics:
+        return contextlib.nullcontext()
+    from .metrics import jsonl_sink, recording
+    if getattr(args, "metrics_sink", None) is None:
+        args.metrics_sink = jsonl_sink(args.metrics)
+    return recording(op, profile=args.profile, trace_memory=args.trace_memory, sink=args.metrics_sink,
+                     nbytes=nbytes, **labels)
+
+
+def _use_mmap(args, src: str, dst: str) -> bool:
+    if not (args.mmap or args.in_place) or STDIO in (src, dst):
+        return False
+    _ensure_parent(dst)
+    return True
+
+
+def _in_place_target(src: str, new_path: str) -> str:
+    # in-place: isi file ditransformasi, lalu file di-rename (tambah/buang .enc)
+    if new_path != src and os.path.exists(new_path):
+        raise OSError(f"{new_path} sudah ada; tidak menimpa hasil in-place.")
+    return new_path
+
+
+def cmd_encrypt(args) -> int:
+    if args.zip:
+        return _encrypt_to_zip(args)
+    from .container import encrypt_to
+    from .schedule import KeySchedule
+    key = KeySchedule(_read_key(args))   # dibangun sekali untuk semua path
+    for src in args.paths:
+        if args.in_place:
+            dst = _in_place_target(src, src + ".enc")
+        else:
+            dst = _out_path(args, src, os.path.basename(src) + ".enc")
+        with _recording(args, "encrypt", input=src):
+            if _use_mmap(args, src, dst):
+                from .localfile import encrypt_file
+                stats = encrypt_file(src, key, None if args.in_place else dst, block=args.chunk_size)
+                if args.in_place:
+                    os.replace(src, dst)
+            else:
+                fin = _open_in(src); fout = _open_out(dst)
+                try:
+                    stats = encrypt_to(fin, fout, key, name=None if src == STDIO else os.path.basename(src),
+                                       chunk_size=args.chunk_size)
+                finally:
+                    _close(fin); _close(fout)
+        _report(args, {"op": "encrypt", "input": src, "output": dst, "size": stats.size, "sha256": stats.sha256})
+    return 0
+
+
+def _encrypt_to_zip(args) -> int:
+    # Batch: direktori di-walk, --from-zip membuka isi zip input; semua hasil
+    # .enc dialirkan ke satu zip output oleh worker pool.
+    import zipfile
+    from .batch import encrypt_batch, items_from_paths, items_from_zip
+    from .schedule import KeySchedule
+    key = KeySchedule(_read_key(args))
+    if STDIO in args.paths:
+        raise SystemExit("vigivault: --zip tidak mendukung stdin.")
+    with contextlib.ExitStack() as stack:
+        items = []
+        for path in args.paths:
+            if args.from_zip and zipfile.is_zipfile(path):
+                items.extend(items_from_zip(stack.enter_context(zipfile.ZipFile(path))))
+            else:
+                items.extend(items_from_paths([path]))
+        def progress(done, total, rec):
+            _report(args, {"op": "encrypt", "done": f"{done}/{total}", **rec})
+        fout = stack.enter_context(_open_out(args.zip)) if args.zip != STDIO else sys.stdout.buffer
+        with _recording(args, "encrypt_batch", nbytes=sum(it[2] for it in items), output=args.zip, files=len(items)):
+            results = encrypt_batch(items, key, fout, workers=args.workers, chunk_size=args.chunk_size,
+                                    on_progress=progress)
+    return 0 if all(r["ok"] for r in results) else 1
+
+
+def cmd_decrypt(args) -> int:
+    from .container import decrypt_to, read_container
+    from .schedule import KeySchedule
+    key = KeySchedule(_read_key(args)); failed = 0
+    for src in args.paths:
+        fin = _open_seekable(src)
+        try:
+            meta = read_container(fin)
+            if meta is not None and meta["key_fp"] != key.fingerprint:
+                _report(args, {"op": "decrypt", "input": src, "ok": False, "error": "key tidak cocok"})
+                failed += 1; continue
+            if meta is not None and meta.get("name"):
+                name = "decrypted_" + os.path.basename(meta["name"])
+            else:
+                base = os.path.basename(src)
+                name = "decrypted_" + (base[:-4] if base.endswith(".enc") else base)
+            if args.in_place:
+                dst = _in_place_target(src, src[:-4] if src.endswith(".enc") else src)
+            else:
+                dst = _out_path(args, src, name)
+            with _recording(args, "decrypt", input=src):
+                if _use_mmap(args, src, dst):
+                    from .localfile import decrypt_file
+                    stats, meta = decrypt_file(src, key, None if args.in_place else dst, block=args.chunk_size)
+                    if args.in_place:
+                        os.replace(src, dst)
+                else:
+                    fout = _open_out(dst)
+                    try:
+                        stats, meta = decrypt_to(fin, fout, key, chunk_size=args.chunk_size)
+                    finally:
+                        _close(fout)
+        finally:
+            _close(fin)
+        ok = meta is None or (meta["size"] == stats.size and meta["sha256"] == stats.sha256)
+        failed += not ok
+        _report(args, {"op": "decrypt", "input": src, "output": dst, "size": stats.size,
+                       "sha256": stats.sha256, "ok": ok})
+    return 1 if failed else 0
+
+
+def cmd_verify(args) -> int:
+    from .container import decrypt_stream, decrypt_to, read_container, verify_decrypted
+    from .schedule import KeySchedule
+    key = KeySchedule(_read_key(args)); failed = 0
+    for src in args.paths:
+        with _recording(args, "verify", input=src, level=args.level):
+            fin = _open_seekable(src)
+            try:
+                meta = read_container(fin)
+                if meta is not None and meta["key_fp"] != key.fingerprint:
+                    ok, used = False, "key"
+                elif args.level == "header" and meta is not None:
+                    # cukup SHA-256 plaintext: output dekripsi dibuang, tanpa file temporer
+                    stats, meta = decrypt_to(fin, None, key, chunk_size=args.chunk_size)
+                    ok, used = verify_decrypted(None, fin, key, stats, meta, args.level)
+                else:
+                    plain, stats, meta = decrypt_stream(fin, key, chunk_size=args.chunk_size)
+                    try:
+                        ok, used = verify_decrypted(plain, fin, key, stats, meta, args.level)
+                    finally:
+                        plain.close()
+            finally:
+                _close(fin)
+        failed += not ok
+        _report(args, {"op": "verify", "input": src, "level": used, "ok": ok})
+    return 1 if failed else 0
+
+
+def cmd_stats(args) -> int:
+    from .stats import FileStats
+    for src in args.paths:
+        with _recording(args, "stats", input=src):
+            fin = _open_in(src)
+            try:
+                fs = FileStats.of_stream(fin, chunk_size=args.chunk_size)
+                entropy = fs.entropy
+            finally:
+                _close(fin)
+        record = {"input": src, "size": fs.size, "sha256": fs.sha256, "entropy": round(entropy, 6)}
+        if args.json:
+            print(json.dumps(record))
+        else:
+            print(f"{fs.size}\t{fs.sha256}\t{entropy:.3f}\t{src}")
+    return 0
+
+
+def cmd_text(args) -> int:
+    # Vigenere klasik A–Z atas file teks UTF-8 secara streaming (memori O(chunk)).
+    from .classic import transform_text_to
+    from .schedule import KeySchedule
+    key = KeySchedule(_read_key(args)); key.require_alpha()
+    op = "text_decrypt" if args.decrypt else "text_encrypt"
+    for src in args.paths:
+        base = os.path.basename(src)
+        if args.decrypt:
+            name = "decrypted_" + (base[:-4] if base.endswith(".vig") else base)
+        else:
+            name = base + ".vig"
+        dst = _out_path(args, src, name)
+        with _recording(args, op, input=src):
+            fin = _open_in(src); fout = _open_out(dst); info = None
+            try:
+                info = transform_text_to(fin, fout, key, decrypt=args.decrypt, keep_non_letters=not args.letters_only,
+                                         chunk_size=args.chunk_size, errors=args.errors)
+            finally:
+                _close(fin); _close(fout)
+                if info is None and dst != STDIO:
+                    os.remove(dst)   # jangan tinggalkan output setengah jadi
+        _report(args, {"op": op, "input": src, "output": dst, "chars": info["chars"], "bytes": info["bytes_out"]})
+    return 0
+
+
+def cmd_analyze(args) -> int:
+    # Serangan ciphertext-only pada payload .enc (atau file cipher mentah);
+    # hanya prefix --sample byte yang dibaca.
+    from .analysis import break_bytes
+    from .container import read_container
+    for src in args.paths:
+        with _recording(args, "analyze", input=src):
+            fin = _open_seekable(src)
+            try:
+                meta = read_container(fin)
+                start, size = (meta["data_start"], meta["size"]) if meta is not None else (0, None)
+                fin.seek(start)
+                data = fin.read(args.sample if size is None else min(size, args.sample))
+            finally:
+                _close(fin)
+            res = break_bytes(data, max_len=args.max_key_len, sample=args.sample)
+        _report(args, {"op": "analyze", "input": src, "key_len": res["key_len"], "detected": res["detected"],
+                       "key": res["key"] if args.show_key else "***"})
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(prog="vigivault", description="Vigenere byte-wise (0–255) untuk file, tanpa UI.")
+    sub = p.add_subparsers(dest="command", required=True)
+
+    def common(sp, with_key=True):
+        sp.add_argument("paths", nargs="+", help="file, glob (mis. 'data/**/*.csv'), atau '-' untuk stdin")
+        sp.add_argument("--chunk-size", type=int, default=16 << 20, help="ukuran chunk streaming (byte)")
+        sp.add_argument("--json", action="store_true", help="laporan per file sebagai JSON lines")
+        sp.add_argument("-q", "--quiet", action="store_true")
+        sp.add_argument("--metrics", metavar="PATH",
+                        help="append metrics per operasi (waktu per tahap, MB/s, memori) sebagai JSON lines; '-' = stderr")
+        sp.add_argument("--profile", action="store_true", help="sertakan ringkasan cProfile di metrics")
+        sp.add_argument("--trace-memory", action="store_true", help="ukur peak alokasi (tracemalloc) di metrics")
+        if with_key:
+            g = sp.add_mutually_exclusive_group()
+            g.add_argument("-k", "--key", help="key (hindari di shell history; lebih baik --key-env)")
+            g.add_argument("--key-file", help="baca key dari file (baris pertama)")
+            sp.add_argument("--key-env", default="VIGIVAULT_KEY", help="nama env var key (default: VIGIVAULT_KEY)")
+
+    def outputs(sp):
+        sp.add_argument("-o", "--output", help="file output ('-' untuk stdout); hanya untuk satu input")
+        sp.add_argument("--out-dir", help="direktori output (default: di samping input)")
+        sp.add_argument("--mmap", action="store_true", help="file lokal: proses lewat mmap tanpa salinan di heap")
+        sp.add_argument("--in-place", action="store_true",
+                        help="file lokal: timpa file itu sendiri via mmap lalu rename (+/- .enc); tidak atomik")
+
+    enc = sub.add_parser("encrypt", help="enkripsi file ke container .enc")
+    common(enc); outputs(enc)
+    enc.add_argument("--zip", help="batch: tulis semua .enc ke satu zip (direktori input di-walk)")
+    enc.add_argument("--from-zip", action="store_true", help="dengan --zip: isi zip input dienkripsi per file")
+    enc.add_argument("--workers", type=int, help="jumlah worker batch (default: min(4, jumlah CPU))")
+    enc.set_defaults(func=cmd_encrypt)
+    dec = sub.add_parser("decrypt", help="dekripsi .enc (container atau legacy)")
+    common(dec); outputs(dec); dec.set_defaults(func=cmd_decrypt)
+    ver = sub.add_parser("verify", help="verifikasi round-trip .enc")
+    common(ver)
+    ver.add_argument("--level", choices=["header", "sampled", "full"], default="header")
+    ver.set_defaults(func=cmd_verify)
+    txt = sub.add_parser("text", help="Vigenere klasik A–Z untuk file teks UTF-8 (streaming)")
+    common(txt)
+    txt.add_argument("-o", "--output", help="file output ('-' untuk stdout); hanya untuk satu input")
+    txt.add_argument("--out-dir", help="direktori output (default: di samping input)")
+    txt.add_argument("-d", "--decrypt", action="store_true", help="dekripsi (default: enkripsi)")
+    txt.add_argument("--letters-only", action="store_true", help="buang spasi/tanda baca (hanya huruf)")
+    txt.add_argument("--errors", choices=["strict", "replace"], default="strict",
+                     help="byte UTF-8 tidak valid: gagal (strict) atau ganti dengan U+FFFD")
+    txt.set_defaults(func=cmd_text, chunk_size=1 << 20)
+    ana = sub.add_parser("analyze", help="audit key: estimasi panjang key & pemulihan key (Kasiski/Friedman)")
+    common(ana, with_key=False)
+    ana.add_argument("--max-key-len", type=int, default=64, help="periode key maksimum yang dicoba")
+    ana.add_argument("--sample", type=int, default=1 << 20, help="byte ciphertext yang dianalisis (prefix)")
+    ana.add_argument("--show-key", action="store_true", help="tampilkan key hasil pemulihan")
+    ana.set_defaults(func=cmd_analyze)
+    sts = sub.add_parser("stats", help="size, SHA-256 dan entropi file")
+    common(sts, with_key=False); sts.set_defaults(func=cmd_stats)
+    return p
+
+
+def main(argv=None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    args.paths = _expand(args.paths)
+    if not args.paths:
+        parser.error("tidak ada file yang cocok.")
+    if getattr(args, "output", None) and len(args.paths) > 1:
+        parser.error("--output hanya untuk satu input; pakai --out-dir untuk banyak file.")
+    if getattr(args, "in_place", False) and (args.output or args.out_dir or STDIO in args.paths
+                                             or getattr(args, "zip", None)):
+        parser.error("--in-place hanya untuk file lokal, tanpa --output/--out-dir/--zip.")
+    if (args.profile or args.trace_memory) and not args.metrics:
+        args.metrics = "-"
+    try:
+        return args.func(args)
+    except BrokenPipeError:
+        return 1
+    except (OSError, ValueError) as e:
+        print(f"vigivault: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,238 @@
+"""Container .enc: header, chunk index, trailer, dekripsi rentang dan verifikasi."""
+
+import hashlib
+import json
+import secrets
+import struct
+
+from .bytewise import _vigenere_bytes_into, iter_encrypt_bytes, transform_to
+from .metrics import stage
+from .schedule import KeySchedule, key_schedule
+from .stats import FileStats
+from .utils import STREAM_CHUNK, _spool, _stream_size, iter_file_chunks
+
+# ==============================
+# CONTAINER .enc (header + trailer)
+# ==============================
+# Versi 2:  HEADER  = "VIGIVLT2" | u32 panjang JSON | JSON {name, chunk_size}
+#           PAYLOAD = ciphertext (fase key 0 di awal payload)
+#           INDEX   = SHA-256[:16] plaintext per chunk_size
+#           u32 chunk_size | u32 jumlah chunk | TRAILER
+# Versi 1 (lama): PAYLOAD | TRAILER. Tanpa trailer: ciphertext mentah (legacy).
+# TRAILER = versi, panjang plaintext, SHA-256 plaintext, fingerprint key, magic.
+# Verifikasi level "header" cukup membandingkan SHA-256 yang dihitung sambil
+# dekripsi dengan trailer (O(1) ekstra, tanpa re-enkripsi). Karena fase key di
+# posisi p adalah p mod len(key), rentang byte mana pun bisa didekripsi O(rentang).
+HEADER_MAGIC = b"VIGIVLT2"
+HEADER_LEN = struct.Struct(">I")
+TRAILER_MAGIC = b"VGVTRAIL"
+TRAILER = struct.Struct(">BQ32s8s8s")
+INDEX_INFO = struct.Struct(">II")
+CONTAINER_VERSION = 2
+INDEX_CHUNK = 1 << 20
+INDEX_DIGEST = 16
+VERIFY_LEVELS = {"header": "Header (SHA-256 trailer)", "sampled": "Sampel (re-encrypt acak)", "full": "Penuh (re-encrypt semua)"}
+VERIFY_SAMPLES = 16
+VERIFY_SAMPLE_LEN = 4096
+
+class _ChunkIndexer:
+    # SHA-256 terpotong per `chunk_size` byte plaintext, apa pun ukuran chunk stream.
+    def __init__(self, chunk_size: int = INDEX_CHUNK):
+        self.chunk_size = chunk_size
+        self.digests = []
+        self._h = hashlib.sha256(); self._fill = 0
+
+    def update(self, b) -> None:
+        mv = memoryview(b)
+        while mv:
+            take = min(len(mv), self.chunk_size - self._fill)
+            self._h.update(mv[:take]); self._fill += take; mv = mv[take:]
+            if self._fill == self.chunk_size:
+                self.digests.append(self._h.digest()[:INDEX_DIGEST])
+                self._h = hashlib.sha256(); self._fill = 0
+
+    def finish(self) -> bytes:
+        if self._fill:
+            self.digests.append(self._h.digest()[:INDEX_DIGEST])
+            self._h = hashlib.sha256(); self._fill = 0
+        return b"".join(self.digests)
+
+def _corrupt(reason: str) -> ValueError:
+    return ValueError(f"Container .enc rusak: {reason}.")
+
+def read_container(enc):
+    # Return dict metadata container, atau None untuk .enc legacy (ciphertext
+    # mentah). Jika magic header/trailer ada tetapi struktur tidak konsisten,
+    # ValueError "container rusak": jangan didekripsi sebagai legacy.
+    total = _stream_size(enc)
+    try:
+        enc.seek(0)
+        has_header = enc.read(len(HEADER_MAGIC)) == HEADER_MAGIC
+        trailer = None
+        if total >= TRAILER.size:
+            enc.seek(total - TRAILER.size)
+            trailer = TRAILER.unpack(enc.read(TRAILER.size))
+        if trailer is None or trailer[4] != TRAILER_MAGIC:
+            if has_header:
+                raise _corrupt("trailer tidak ditemukan (file terpotong?)")
+            return None
+        version, size, digest, kfp, _ = trailer
+        meta = {"version": version, "size": size, "sha256": digest.hex(), "key_fp": kfp,
+                "data_start": 0, "name": None, "chunk_size": None, "index": b""}
+        if version == 1 and not has_header:
+            if size != total - TRAILER.size:
+                raise _corrupt("ukuran payload tidak cocok dengan trailer")
+            return meta
+        if version != CONTAINER_VERSION:
+            raise _corrupt(f"versi {version} tidak dikenal")
+        if not has_header:
+            raise _corrupt("header tidak ditemukan")
+        if total < len(HEADER_MAGIC) + HEADER_LEN.size + INDEX_INFO.size + TRAILER.size:
+            raise _corrupt("file terlalu pendek")
+        enc.seek(len(HEADER_MAGIC))
+        (hlen,) = HEADER_LEN.unpack(enc.read(HEADER_LEN.size))
+        try:
+            header = json.loads(enc.read(hlen).decode("utf-8"))
+        except (ValueError, UnicodeDecodeError):
+            raise _corrupt("header bukan JSON yang valid") from None
+        if not isinstance(header, dict):
+            raise _corrupt("header bukan objek JSON")
+        enc.seek(total - TRAILER.size - INDEX_INFO.size)
+        chunk_size, n_chunks = INDEX_INFO.unpack(enc.read(INDEX_INFO.size))
+        data_start = len(HEADER_MAGIC) + HEADER_LEN.size + hlen
+        index_len = n_chunks * INDEX_DIGEST
+        if (chunk_size <= 0 or n_chunks != -(-size // chunk_size)
+                or data_start + size + index_len + INDEX_INFO.size + TRAILER.size != total):
+            raise _corrupt("ukuran header/payload/index tidak konsisten")
+        name = header.get("name")
+        enc.seek(data_start + size)
+        meta.update(data_start=data_start, name=name if isinstance(name, str) else None,
+                    chunk_size=chunk_size, index=enc.read(index_len))
+        return meta
+    except struct.error:
+        raise _corrupt("struktur biner tidak lengkap") from None
+    finally:
+        enc.seek(0)
+
+# Tulis container v2 ke writer `w` secara streaming (tanpa seek), sehingga
+# bisa langsung ke stdout. Return FileStats dari seluruh byte .enc.
+def container_prefix(name: str | None, index_chunk: int = INDEX_CHUNK) -> bytes:
+    header = json.dumps({"name": name, "chunk_size": index_chunk}).encode("utf-8")
+    return HEADER_MAGIC + HEADER_LEN.pack(len(header)) + header
+
+def container_tail(index: bytes, index_chunk: int, size: int, plain_sha256: bytes, key: str | KeySchedule) -> bytes:
+    return (index + INDEX_INFO.pack(index_chunk, len(index) // INDEX_DIGEST)
+            + TRAILER.pack(CONTAINER_VERSION, size, plain_sha256, key_schedule(key).fingerprint, TRAILER_MAGIC))
+
+def container_tail_len(size: int, index_chunk: int = INDEX_CHUNK) -> int:
+    return -(-size // index_chunk) * INDEX_DIGEST + INDEX_INFO.size + TRAILER.size
+
+def encrypt_to(src, w, key: str | KeySchedule, name: str | None = None, chunk_size: int = STREAM_CHUNK,
+               index_chunk: int = INDEX_CHUNK) -> FileStats:
+    key = key_schedule(key)
+    prefix = container_prefix(name, index_chunk)
+    plain_sha = hashlib.sha256(); indexer = _ChunkIndexer(index_chunk)
+    def on_input(chunk):
+        with stage("index", len(chunk)):
+            plain_sha.update(chunk); indexer.update(chunk)
+    stats = transform_to(src, w, key, chunk_size=chunk_size, on_input=on_input, prefix=prefix)
+    size = stats.size - len(prefix)
+    tail = container_tail(indexer.finish(), index_chunk, size, plain_sha.digest(), key)
+    w.write(tail); stats.update(tail)
+    return stats
+
+def encrypt_stream(src, key: str | KeySchedule, name: str | None = None, chunk_size: int = STREAM_CHUNK,
+                   index_chunk: int = INDEX_CHUNK):
+    return _spool(lambda w: encrypt_to(src, w, key, name, chunk_size, index_chunk), chunk_size)
+
+# `enc` harus seekable (trailer dibaca lebih dulu). Return (FileStats plaintext, meta atau None).
+def decrypt_to(enc, w, key: str | KeySchedule, chunk_size: int = STREAM_CHUNK):
+    meta = read_container(enc)
+    start = meta["data_start"] if meta else 0
+    limit = meta["size"] if meta else None
+    stats = transform_to(enc, w, key, decrypt=True, chunk_size=chunk_size, start=start, limit=limit)
+    return stats, meta
+
+def decrypt_stream(enc, key: str | KeySchedule, chunk_size: int = STREAM_CHUNK):
+    # Return (dst, FileStats plaintext, meta container atau None).
+    dst, (stats, meta) = _spool(lambda w: decrypt_to(enc, w, key, chunk_size), chunk_size)
+    return dst, stats, meta
+
+def _payload_bounds(enc, meta) -> tuple:
+    if meta is not None:
+        return meta["data_start"], meta["size"]
+    return 0, _stream_size(enc)
+
+def decrypt_range(enc, key: str | KeySchedule, start: int, length: int, meta=None) -> bytes:
+    # Dekripsi payload[start:start+length] saja, memakai fase key = start.
+    data_start, size = _payload_bounds(enc, meta)
+    start = max(0, min(start, size)); length = max(0, min(length, size - start))
+    enc.seek(data_start + start)
+    src = enc.read(length)
+    out = bytearray(len(src))
+    _vigenere_bytes_into(src, out, key, decrypt=True, offset=start)
+    enc.seek(0)
+    return bytes(out)
+
+def verify_range(enc, key: str | KeySchedule, meta, start: int, length: int) -> bool:
+    # Cek chunk index untuk semua chunk yang menutupi rentang (hanya container v2).
+    if meta is None or not meta["chunk_size"]:
+        raise ValueError("Verifikasi rentang butuh container .enc versi 2.")
+    key = key_schedule(key)
+    cs = meta["chunk_size"]
+    first = max(0, start) // cs; last = max(first, (min(start + length, meta["size"]) - 1) // cs)
+    for i in range(first, last + 1):
+        plain = decrypt_range(enc, key, i * cs, cs, meta)
+        if hashlib.sha256(plain).digest()[:INDEX_DIGEST] != meta["index"][i * INDEX_DIGEST:(i + 1) * INDEX_DIGEST]:
+            return False
+    return True
+
+# Re-encrypt `plain` per chunk dan bandingkan dengan `enc` (memori O(chunk)).
+def verify_reencrypt(plain, enc, key: str | KeySchedule, chunk_size: int = STREAM_CHUNK, start: int = 0,
+                     limit: int | None = None) -> bool:
+    enc.seek(start); seen = 0
+    for c in iter_encrypt_bytes(iter_file_chunks(plain, chunk_size), key):
+        if enc.read(len(c)) != c:
+            return False
+        seen += len(c)
+    return seen == limit if limit is not None else not enc.read(1)
+
+# Re-encrypt beberapa jendela (awal, akhir, dan acak) memakai fase key posisi
+# tersebut; biaya O(sampel) berapa pun ukuran file.
+def verify_sampled(plain, enc, key: str | KeySchedule, size: int, start: int = 0, samples: int = VERIFY_SAMPLES,
+                   sample_len: int = VERIFY_SAMPLE_LEN) -> bool:
+    key = key_schedule(key); key.require_bytes()
+    if size <= samples * sample_len:
+        starts = [0]; sample_len = size
+    else:
+        rnd = secrets.SystemRandom()
+        starts = [0, size - sample_len] + [rnd.randrange(0, size - sample_len) for _ in range(samples - 2)]
+    for s in starts:
+        plain.seek(s); enc.seek(start + s)
+        p = plain.read(sample_len); e = enc.read(sample_len)
+        if len(p) != len(e):
+            return False
+        out = bytearray(len(p))
+        _vigenere_bytes_into(p, out, key, offset=s)
+        if out != e:
+            return False
+    plain.seek(0); enc.seek(0)
+    return True
+
+def verify_decrypted(plain, enc, key: str | KeySchedule, pstats: FileStats, meta, level: str = "header"):
+    # Return (ok, level yang dipakai). Tanpa trailer, level "header" turun ke "sampled".
+    # Dengan trailer, semua level mengecek SHA-256 trailer; re-encrypt hanya
+    # tambahan (plaintext hasil dekripsi sendiri selalu cocok dengan ciphertext,
+    # jadi tanpa trailer payload yang diubah tidak terdeteksi).
+    key = key_schedule(key)
+    if meta is not None:
+        if meta["key_fp"] != key.fingerprint:
+            return False, "key"
+        ok = meta["size"] == pstats.size and meta["sha256"] == pstats.sha256
+        if level == "header" or not ok:
+            return ok, "header"
+    data_start = meta["data_start"] if meta else 0
+    data_len = meta["size"] if meta else pstats.size
+    if level == "full":
+        return verify_reencrypt(plain, enc, key, start=data_start, limit=data_len), "full"
+    return verify_sampled(plain, enc, key, data_len, start=data_start), "sampled"
@@ -0,0 +1,99 @@
+"""Hex viewer: hanya jendela yang tampil yang dibaca, didekripsi, dan diformat."""
+
+import numpy as np
+
+from .container import decrypt_range
+from .metrics import stage
+from .utils import _stream_size
+
+HEX_ROW = 16
+HEX_PAGE = 1024
+HEX_PAGES = (256, 1024, 4096, 16384)
+OFFSET_WIDTH = 8   # digit offset di viewer (melebar otomatis untuk file > 4 GiB)
+
+# ==============================
+# FORMATTER (vectorized)
+# ==============================
+# Satu page = matriks uint8 (baris × lebar baris) yang diisi lewat lookup table:
+# digit hex byte, kolom ASCII, dan digit offset; tanpa loop per byte/baris.
+# Format sama persis dengan hex_preview lama: "oooo  xx xx …  |ascii|".
+_HEX_DIGITS = np.frombuffer(b"0123456789abcdef", dtype=np.uint8)
+_PRINTABLE = np.where((np.arange(256) >= 32) & (np.arange(256) <= 126), np.arange(256), ord(".")).astype(np.uint8)
+_HEX_COLS = 3 * np.arange(HEX_ROW)
+
+def format_hex(b, base: int = 0, width: int = 4) -> str:
+    a = np.frombuffer(b, dtype=np.uint8)
+    n = a.size
+    if n == 0:
+        return ""
+    rows = -(-n // HEX_ROW)
+    width = max(width, len(f"{base + (rows - 1) * HEX_ROW:x}"))
+    hex0 = width + 2; bar = hex0 + 3 * HEX_ROW - 1 + 2; asc0 = bar + 1
+    out = np.full((rows, asc0 + HEX_ROW + 2), ord(" "), dtype=np.uint8)
+    offs = base + np.arange(rows, dtype=np.int64) * HEX_ROW
+    for d in range(width):
+        out[:, width - 1 - d] = _HEX_DIGITS[(offs >> (4 * d)) & 15]
+    m = np.zeros(rows * HEX_ROW, dtype=np.uint8); m[:n] = a; m = m.reshape(rows, HEX_ROW)
+    out[:, hex0 + _HEX_COLS] = _HEX_DIGITS[m >> 4]
+    out[:, hex0 + _HEX_COLS + 1] = _HEX_DIGITS[m & 15]
+    out[:, bar] = ord("|")
+    out[:, asc0:asc0 + HEX_ROW] = _PRINTABLE[m]
+    out[:, asc0 + HEX_ROW] = ord("|")
+    out[:, -1] = ord("\n")
+    tail = n - (rows - 1) * HEX_ROW
+    if tail < HEX_ROW:
+        # baris terakhir parsial: kolom hex kosong, kolom ASCII sepanjang sisa byte
+        last = out[-1]
+        last[hex0 + 3 * tail - 1:bar] = ord(" ")
+        last[asc0 + tail] = ord("|")
+        last[asc0 + tail + 1:] = ord(" ")
+    return out.tobytes().decode("ascii").rstrip(" \n")
+
+
+# ==============================
+# JENDELA (page) FILE
+# ==============================
+# `src` file-like seekable (upload Streamlit, file lokal, BytesIO). Dengan
+# `key`, offset adalah offset plaintext dan page didekripsi saat dilihat lewat
+# decrypt_range (fase key = offset, O(page) berapa pun ukuran file).
+def parse_offset(text: str) -> int:
+    # "4096", "0x1000", atau "1000h"; garis bawah/spasi diabaikan
+    t = text.strip().lower().replace("_", "").replace(" ", "")
+    if not t:
+        return 0
+    if t.endswith("h"):
+        t = "0x" + t[:-1]
+    value = int(t, 0)
+    if value < 0:
+        raise ValueError("Offset tidak boleh negatif.")
+    return value
+
+def page_start(offset: int, size: int, page: int = HEX_PAGE) -> int:
+    # sejajarkan ke awal baris; offset dekat EOF (atau di luar file) → page
+    # terakhir yang masih (hampir) penuh dan memuat EOF
+    last = -(-max(0, size - page) // HEX_ROW) * HEX_ROW
+    return min(max(0, offset) // HEX_ROW * HEX_ROW, last)
+
+def view_size(src, key=None, meta=None) -> int:
+    if key is not None and meta is not None:
+        return meta["size"]
+    return _stream_size(src)
+
+def read_window(src, start: int, length: int) -> bytes:
+    pos = src.tell()
+    try:
+        src.seek(start)
+        return src.read(length)
+    finally:
+        src.seek(pos)
+
+def view_page(src, offset: int, page: int = HEX_PAGE, key=None, meta=None, size: int | None = None) -> dict:
+    size = view_size(src, key, meta) if size is None else size
+    start = page_start(offset, size, page)
+    with stage("hex_view", min(page, size - start)):
+        if key is not None:
+            data = decrypt_range(src, key, start, page, meta)
+        else:
+            data = read_window(src, start, min(page, size - start))
+        text = format_hex(data, start, OFFSET_WIDTH) if data else "(kosong)"
+    return {"start": start, "end": start + len(data), "size": size, "data": data, "text": text}
@@ -0,0 +1,176 @@
+"""Antrian job latar belakang: enkripsi/dekripsi di luar siklus rerun Streamlit."""
+
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from .cache import release
+from .metrics import recording
+
+JOB_WORKERS = min(2, os.cpu_count() or 1)
+JOB_KEEP = 100   # job yang sudah selesai disimpan maksimal sebanyak ini
+
+class JobCancelled(Exception):
+    pass
+
+# Proxy file-like untuk sumber job: tiap read() memeriksa pembatalan dan
+# menambah progress, sehingga engine streaming tidak perlu diubah.
+class _ProgressReader:
+    def __init__(self, fobj, job: "Job"):
+        self._f = fobj
+        self._job = job
+
+    def read(self, n: int = -1) -> bytes:
+        self._job._check()
+        b = self._f.read(n)
+        self._job._advance(len(b))
+        return b
+
+    def seek(self, pos: int, whence: int = 0) -> int:
+        return self._f.seek(pos, whence)
+
+    def tell(self) -> int:
+        return self._f.tell()
+
+    def seekable(self) -> bool:
+        return self._f.seekable()
+
+# Status: queued → running → done | error | cancelled. Atribut ditulis oleh
+# thread worker dan dibaca oleh script Streamlit (polling).
+class Job:
+    def __init__(self, op: str, total: int = 0, key=None, profile: bool = False, trace_memory: bool = False,
+                 **labels):
+        self.id = uuid.uuid4().hex[:12]
+        self.op = op
+        self.key = key
+        self.labels = labels
+        self.profile = profile
+        self.trace_memory = trace_memory
+        self.total = total
+        self.done_bytes = 0
+        self.status = "queued"
+        self.result = None
+        self.error = None
+        self.metrics = None
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+        self.future = None
+        self._cancel = threading.Event()
+
+    @property
+    def is_active(self) -> bool:
+        return self.status in ("queued", "running")
+
+    @property
+    def progress(self) -> float:
+        if self.status == "done":
+            return 1.0
+        return min(1.0, self.done_bytes / self.total) if self.total else 0.0
+
+    @property
+    def elapsed(self) -> float:
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.time()) - self.started
+
+    @property
+    def mb_s(self) -> float:
+        secs = self.elapsed
+        return (self.done_bytes / (1 << 20)) / secs if secs > 0 else 0.0
+
+    def reader(self, fobj) -> _ProgressReader:
+        return _ProgressReader(fobj, self)
+
+    def cancel(self) -> None:
+        self._cancel.set()
+        if self.future is not None and self.future.cancel():
+            self.status = "cancelled"; self.finished = time.time()
+
+    def _check(self) -> None:
+        if self._cancel.is_set():
+            raise JobCancelled()
+
+    def _advance(self, n: int) -> None:
+        self.done_bytes += n
+
+# Executor hidup di luar rerun (di app: singleton st.cache_resource), job
+# dilacak per id. submit() dengan `key` yang sama dengan job yang masih aktif
+# mengembalikan job tersebut, sehingga rerun/klik ulang tidak menghitung ulang.
+# Hasil job yang memuat file cache (SharedFile) dipegang job sampai job
+# dibuang dari daftar (lebih dari JOB_KEEP job selesai) atau queue di-shutdown.
+class JobQueue:
+    def __init__(self, workers: int = JOB_WORKERS, keep: int = JOB_KEEP):
+        self.keep = keep
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+        self._ex = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="vigi-job")
+
+    # fn(job) dijalankan di worker; pakai job.reader(src) agar progress dan
+    # pembatalan bekerja. Return fn menjadi job.result. profile/trace_memory
+    # diteruskan ke recording() (worker tidak bisa membaca opsi sesi).
+    def submit(self, op: str, fn, total: int = 0, key=None, profile: bool = False, trace_memory: bool = False,
+               **labels) -> Job:
+        with self._lock:
+            if key is not None:
+                for job in self._jobs.values():
+                    if job.key == key and job.is_active:
+                        return job
+            job = Job(op, total, key, profile, trace_memory, **labels)
+            self._jobs[job.id] = job
+            self._prune()
+        job.future = self._ex.submit(self._run, job, fn)
+        return job
+
+    def _run(self, job: Job, fn) -> None:
+        if job._cancel.is_set():
+            job.status = "cancelled"; job.finished = time.time()
+            return
+        job.status = "running"; job.started = time.time()
+        try:
+            with recording(job.op, profile=job.profile, trace_memory=job.trace_memory, nbytes=job.total or None,
+                           sink=lambda r: setattr(job, "metrics", r), job=job.id, **job.labels):
+                job.result = fn(job)
+            job.status = "done"
+        except JobCancelled:
+            job.status = "cancelled"
+        except Exception as e:
+            job.error = str(e); job.status = "error"
+        finally:
+            job.finished = time.time()
+
+    def _prune(self) -> None:
+        done = [jid for jid, job in self._jobs.items() if not job.is_active]
+        for jid in done[:max(0, len(done) - self.keep)]:
+            release(self._jobs.pop(jid).result)
+
+    def get(self, job_id: str | None) -> Job | None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> None:
+        job = self.get(job_id)
+        if job is not None:
+            job.cancel()
+
+    def jobs(self) -> list:
+        with self._lock:
+            return list(self._jobs.values())
+
+    def shutdown(self, wait: bool = True) -> None:
+        for job in self.jobs():
+            if job.is_active:
+                job.cancel()
+        self._ex.shutdown(wait=wait)
+        with self._lock:
+            for job in self._jobs.values():
+                if not job.is_active:
+                    release(job.result)
+            self._jobs.clear()
+
+    def stats(self) -> dict:
+        jobs = self.jobs()
+        return {s: sum(j.status == s for j in jobs) for s in ("queued", "running", "done", "error", "cancelled")}
@@ -0,0 +1,33 @@
+"""Utilitas key: estimasi kekuatan, key acak, fingerprint dan digest."""
+
+import hashlib
+import math
+import secrets
+import string
+
+def estimate_key_strength(key: str) -> dict:
+    length = len(key)
+    classes = {
+        "lower": any(c.islower() for c in key),
+        "upper": any(c.isupper() for c in key),
+        "digit": any(c.isdigit() for c in key),
+        "other": any(not c.isalnum() for c in key),
+    }
+    pool = (26 if classes["lower"] else 0) + (26 if classes["upper"] else 0) + (10 if classes["digit"] else 0) + (32 if classes["other"] else 0)
+    entropy_bits = length * (math.log2(pool) if pool>0 else 0)
+    if length == 0: level = "empty"
+    elif entropy_bits < 32: level = "weak"
+    elif entropy_bits < 64: level = "fair"
+    elif entropy_bits < 96: level = "strong"
+    else: level = "very strong"
+    return {"length": length, "pool": pool, "entropy_bits": entropy_bits, "level": level}
+
+def random_key(n: int, include_symbols: bool=True) -> str:
+    alphabet = string.ascii_letters + string.digits + ("!@#$%^&*()-_=+[]{};:,.?/" if include_symbols else "")
+    return "".join(secrets.choice(alphabet) for _ in range(n))
+
+def key_fingerprint(key: str) -> bytes:
+    return hashlib.sha256(b"vigivault-key:" + key.encode("utf-8")).digest()[:8]
+
+def key_digest(key: str) -> str:
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
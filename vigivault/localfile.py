@@ -0,0 +1,133 @@
+"""Mode file lokal: enkripsi/dekripsi lewat mmap, in-place atau ke file tujuan."""
+
+import hashlib
+import mmap
+import os
+
+from .bytewise import _vigenere_bytes_into_parallel
+from .container import (INDEX_CHUNK, _ChunkIndexer, container_prefix, container_tail, container_tail_len,
+                        read_container)
+from .metrics import stage
+from .schedule import KeySchedule, key_schedule
+from .stats import FileStats
+from .utils import STREAM_CHUNK
+
+# ==============================
+# MMAP (file di disk yang sama)
+# ==============================
+# Sumber dan tujuan di-mmap; transform byte-wise bekerja langsung pada slice
+# mmap per blok, sehingga tidak ada salinan di heap (page cache OS yang
+# menangani I/O). Hasil identik dengan encrypt_to/decrypt_to.
+#
+# In-place: payload ditransformasi di tempat (src == dst, aman untuk shard
+# paralel), lalu digeser dengan mmap.move (memmove) sejauh panjang header.
+# Operasi in-place tidak atomik: bila terhenti di tengah, file rusak.
+
+def _same_file(a: str, b: str) -> bool:
+    return os.path.exists(b) and os.path.samefile(a, b)
+
+def _transform_blocks(src, dst, key: KeySchedule, size: int, decrypt: bool, block: int,
+                      stats: FileStats, on_input=None) -> None:
+    # src/dst = memoryview payload (boleh objek yang sama untuk in-place)
+    for s in range(0, size, block):
+        e = min(s + block, size)
+        if on_input is not None:
+            on_input(src[s:e])
+        with stage("cipher", e - s):
+            _vigenere_bytes_into_parallel(src[s:e], dst[s:e], key, decrypt=decrypt, offset=s)
+        stats.update(dst[s:e])
+
+def _mmap_write(path: str, size: int):
+    fh = open(path, "r+b" if os.path.exists(path) else "w+b")
+    fh.truncate(size)
+    return fh, mmap.mmap(fh.fileno(), size)
+
+def _mmap_read(path: str):
+    fh = open(path, "rb")
+    if os.fstat(fh.fileno()).st_size == 0:
+        return fh, None          # mmap tidak bisa memetakan file kosong
+    return fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+# Enkripsi `src` ke container .enc. dst=None (atau path yang sama) = in-place:
+# file `src` sendiri menjadi .enc (nama file tidak diubah). Return FileStats .enc.
+def encrypt_file(src: str, key: str | KeySchedule, dst: str | None = None, name: str | None = None,
+                 block: int = STREAM_CHUNK, index_chunk: int = INDEX_CHUNK) -> FileStats:
+    key = key_schedule(key); key.require_bytes()
+    size = os.path.getsize(src)
+    prefix = container_prefix(os.path.basename(src) if name is None else name, index_chunk)
+    hl = len(prefix); total = hl + size + container_tail_len(size, index_chunk)
+    plain_sha = hashlib.sha256(); indexer = _ChunkIndexer(index_chunk)
+    def on_input(chunk):
+        with stage("index", len(chunk)):
+            plain_sha.update(chunk); indexer.update(chunk)
+    stats = FileStats(); stats.update(prefix)
+    in_place = dst is None or _same_file(src, dst)
+    fh, mm = _mmap_write(src if in_place else dst, total)
+    try:
+        if in_place:
+            with memoryview(mm) as mv:
+                _transform_blocks(mv, mv, key, size, False, block, stats, on_input)
+            with stage("move", size):
+                mm.move(hl, 0, size)
+        else:
+            sfh, smm = _mmap_read(src)
+            try:
+                with memoryview(smm if smm is not None else b"") as sv, memoryview(mm) as mv:
+                    _transform_blocks(sv, mv[hl:hl + size], key, size, False, block, stats, on_input)
+            finally:
+                if smm is not None:
+                    smm.close()
+                sfh.close()
+        tail = container_tail(indexer.finish(), index_chunk, size, plain_sha.digest(), key)
+        mm[:hl] = prefix
+        mm[hl + size:] = tail
+        stats.update(tail)
+        mm.flush()
+    finally:
+        mm.close(); fh.close()
+    return stats
+
+# Dekripsi .enc (container atau legacy). dst=None = in-place: file menjadi
+# plaintext (header/index/trailer dibuang). Key yang tidak cocok dengan
+# fingerprint container ditolak sebelum file disentuh. Return (FileStats, meta).
+def decrypt_file(src: str, key: str | KeySchedule, dst: str | None = None, block: int = STREAM_CHUNK):
+    key = key_schedule(key); key.require_bytes()
+    with open(src, "rb") as fh:
+        meta = read_container(fh)
+    if meta is not None and meta["key_fp"] != key.fingerprint:
+        raise ValueError("Key tidak cocok dengan container .enc.")
+    ds = meta["data_start"] if meta else 0
+    size = meta["size"] if meta else os.path.getsize(src)
+    stats = FileStats()
+    if dst is None or _same_file(src, dst):
+        with open(src, "r+b") as fh:
+            if size:
+                mm = mmap.mmap(fh.fileno(), 0)
+                try:
+                    with memoryview(mm) as mv:
+                        _transform_blocks(mv[ds:ds + size], mv[ds:ds + size], key, size, True, block, stats)
+                    if ds:
+                        with stage("move", size):
+                            mm.move(0, ds, size)
+                    mm.flush()
+                finally:
+                    mm.close()
+            fh.truncate(size)
+        return stats, meta
+    sfh, smm = _mmap_read(src)
+    try:
+        if size == 0:
+            open(dst, "wb").close()
+            return stats, meta
+        fh, mm = _mmap_write(dst, size)
+        try:
+            with memoryview(smm) as sv, memoryview(mm) as mv:
+                _transform_blocks(sv[ds:ds + size], mv, key, size, True, block, stats)
+            mm.flush()
+        finally:
+            mm.close(); fh.close()
+    finally:
+        if smm is not None:
+            smm.close()
+        sfh.close()
+    return stats, meta
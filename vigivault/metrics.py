@@ -0,0 +1,165 @@
+"""Instrumentasi: waktu per tahap, throughput, memori, dan profil opsional."""
+
+import contextlib
+import contextvars
+import cProfile
+import io
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+
+PROFILE_LINES = 25
+
+# Recorder aktif dibawa lewat contextvar: engine cukup memanggil stage()/note()
+# tanpa parameter tambahan, dan tanpa recording() biayanya hanya satu lookup.
+_CURRENT = contextvars.ContextVar("vigivault_recorder", default=None)
+
+def current():
+    return _CURRENT.get()
+
+def peak_rss_mb() -> float:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return float("nan")
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1 << 20) if sys.platform == "darwin" else rss / 1024
+
+def current_rss_mb() -> float:
+    # RSS saat ini (Linux: /proc); platform lain: peak RSS sebagai pendekatan
+    try:
+        with open("/proc/self/statm") as fh:
+            return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1 << 20)
+    except (OSError, ValueError, AttributeError):
+        return peak_rss_mb()
+
+def _mb_s(nbytes: int, seconds: float) -> float | None:
+    return (nbytes / (1 << 20)) / seconds if nbytes and seconds > 0 else None
+
+
+# ==============================
+# RECORDER (per operasi)
+# ==============================
+# Tahap yang sama diakumulasi (per chunk) menjadi satu baris: total detik,
+# byte, jumlah panggilan. Thread-safe: worker batch menulis ke recorder yang
+# sama, sehingga detik per tahap adalah jumlah lintas worker (bukan wall time).
+class Recorder:
+    def __init__(self, op: str, **labels):
+        self.op = op
+        self.labels = labels
+        self.stages = {}
+        self.seconds = 0.0
+        self.bytes = None
+        self.peak_alloc = None
+        self.profile = None
+        self.error = None
+        self._lock = threading.Lock()
+
+    def add(self, stage: str, seconds: float, nbytes: int = 0) -> None:
+        with self._lock:
+            s = self.stages.setdefault(stage, [0.0, 0, 0])
+            s[0] += seconds; s[1] += nbytes; s[2] += 1
+
+    def record(self) -> dict:
+        # byte operasi = yang di-set pemanggil, atau byte tahap "read" (mmap: "cipher")
+        nbytes = self.bytes
+        if nbytes is None:
+            nbytes = next((self.stages[k][1] for k in ("read", "cipher") if k in self.stages), 0)
+        rec = {"op": self.op, **self.labels, "ts": time.strftime("%Y-%m-%dT%H:%M:%S"),
+               "seconds": self.seconds, "bytes": nbytes, "mb_s": _mb_s(nbytes, self.seconds),
+               "peak_rss_mb": peak_rss_mb(),
+               "peak_alloc_mb": None if self.peak_alloc is None else self.peak_alloc / (1 << 20),
+               "stages": {name: {"seconds": s, "bytes": b, "calls": c, "mb_s": _mb_s(b, s)}
+                          for name, (s, b, c) in self.stages.items()}}
+        if self.error is not None:
+            rec["error"] = self.error
+        if self.profile is not None:
+            rec["profile"] = self.profile
+        return rec
+
+def note(stage: str, seconds: float, nbytes: int = 0) -> None:
+    rec = _CURRENT.get()
+    if rec is not None:
+        rec.add(stage, seconds, nbytes)
+
+@contextlib.contextmanager
+def stage(name: str, nbytes: int = 0):
+    rec = _CURRENT.get()
+    if rec is None:
+        yield
+        return
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        rec.add(name, time.perf_counter() - t0, nbytes)
+
+def _profile_text(prof: cProfile.Profile, lines: int = PROFILE_LINES) -> str:
+    out = io.StringIO()
+    pstats.Stats(prof, stream=out).sort_stats("cumulative").print_stats(lines)
+    return out.getvalue()
+
+# Ukur satu operasi. profile=True menyalakan cProfile (thread pemanggil saja),
+# trace_memory=True menyalakan tracemalloc untuk peak alokasi (NumPy ikut
+# terlacak). nbytes = ukuran input untuk MB/s total (default: dari tahap read/cipher).
+# sink(record) dipanggil di akhir, juga bila operasi gagal.
+@contextlib.contextmanager
+def recording(op: str, profile: bool = False, trace_memory: bool = False, sink=None,
+              nbytes: int | None = None, **labels):
+    rec = Recorder(op, **labels)
+    rec.bytes = nbytes
+    token = _CURRENT.set(rec)
+    own_trace = trace_memory and not tracemalloc.is_tracing()
+    if own_trace:
+        tracemalloc.start()
+    elif trace_memory:
+        tracemalloc.reset_peak()
+    prof = cProfile.Profile() if profile else None
+    t0 = time.perf_counter()
+    if prof is not None:
+        try:
+            prof.enable()
+        except ValueError:  # profiler lain sudah aktif (mis. sesi lain)
+            prof = None
+    try:
+        yield rec
+    except BaseException as e:
+        rec.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        if prof is not None:
+            prof.disable()
+        rec.seconds = time.perf_counter() - t0
+        if prof is not None:
+            rec.profile = _profile_text(prof)
+        if trace_memory:
+            rec.peak_alloc = tracemalloc.get_traced_memory()[1]
+            if own_trace:
+                tracemalloc.stop()
+        _CURRENT.reset(token)
+        if sink is not None:
+            sink(rec.record())
+
+
+# ==============================
+# EKSPOR JSON LINES
+# ==============================
+def to_jsonl(records) -> str:
+    return "".join(json.dumps(r, default=str) + "\n" for r in records)
+
+def jsonl_sink(path: str):
+    # satu baris JSON per operasi, di-append; "-" = stderr (stdout bisa berisi data)
+    lock = threading.Lock()
+    def sink(record: dict) -> None:
+        line = to_jsonl([record])
+        with lock:
+            if path == "-":
+                sys.stderr.write(line); sys.stderr.flush()
+            else:
+                with open(path, "a", encoding="utf-8") as fh:
+                    fh.write(line)
+    return sink
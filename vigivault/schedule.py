@@ -0,0 +1,99 @@
+"""Key schedule: bentuk key yang sudah dinormalisasi, dihitung sekali per key."""
+
+import functools
+
+import numpy as np
+
+from .keys import key_digest, key_fingerprint
+
+KEY_TILE = 1 << 20     # panjang keystream yang disiapkan = blok engine byte-wise
+
+def _clean_key_alpha(key: str) -> str:
+    return "".join([c for c in key.upper() if c.isalpha()])
+
+# ==============================
+# KEY SCHEDULE
+# ==============================
+# Semua engine menerima str atau KeySchedule. Bagian yang mahal (array shift,
+# keystream ter-tile) baru dibangun saat pertama dipakai lalu disimpan, jadi
+# satu schedule untuk banyak buffer/chunk = biaya setup nol per panggilan.
+#
+# Byte-wise: keystream di-tile sepanjang kelipatan panjang key ≥ KEY_TILE,
+#   ditambah satu key ekstra; fase `offset` cukup berupa slice [p:p+block].
+#   Dekripsi memakai shift ternegasi (−k mod 256) sehingga keduanya cukup np.add.
+# Klasik: shift A–Z (0–25) dari huruf key, plus versi negasinya (26 − k).
+#
+# Schedule memuat key itu sendiri (key_bytes, alpha), jadi sengaja tidak ada
+# cache global yang dibagi antar sesi: key_schedule(str) membangun schedule
+# baru, dan pemanggil yang memakai satu key untuk banyak operasi membangun
+# KeySchedule sekali lalu meneruskannya (CLI per perintah, app per job).
+class KeySchedule:
+    def __init__(self, key: str):
+        self.key_bytes = key.encode("utf-8")
+        self.alpha = _clean_key_alpha(key)
+        self.fingerprint = key_fingerprint(key)
+        self.digest = key_digest(key)
+
+    def __repr__(self) -> str:
+        return f"KeySchedule(len={len(self.key_bytes)})"   # jangan bocorkan key
+
+    # ---------- byte-wise ----------
+    def require_bytes(self) -> bytes:
+        if not self.key_bytes:
+            raise ValueError("Key tidak boleh kosong.")
+        return self.key_bytes
+
+    @functools.cached_property
+    def shifts(self) -> np.ndarray:
+        return np.frombuffer(self.require_bytes(), dtype=np.uint8)
+
+    @functools.cached_property
+    def neg_shifts(self) -> np.ndarray:
+        return np.negative(self.shifts)
+
+    @functools.cached_property
+    def block(self) -> int:
+        klen = self.shifts.size
+        return max(klen, (KEY_TILE // klen) * klen)
+
+    def _tile(self, s: np.ndarray) -> np.ndarray:
+        # np.tile, bukan np.resize (jauh lebih lambat untuk key pendek)
+        n = self.block + s.size
+        return np.tile(s, -(-n // s.size))[:n]
+
+    @functools.cached_property
+    def _tiled_enc(self) -> np.ndarray:
+        return self._tile(self.shifts)
+
+    @functools.cached_property
+    def _tiled_dec(self) -> np.ndarray:
+        return self._tile(self.neg_shifts)
+
+    def keystream(self, offset: int = 0, decrypt: bool = False) -> np.ndarray:
+        # view read-only sepanjang `block` dengan fase posisi absolut `offset`
+        p = offset % self.shifts.size
+        tiled = self._tiled_dec if decrypt else self._tiled_enc
+        return tiled[p:p + self.block]
+
+    # ---------- klasik A–Z ----------
+    def require_alpha(self) -> str:
+        if not self.alpha:
+            raise ValueError("Key harus berisi huruf A–Z.")
+        return self.alpha
+
+    @functools.cached_property
+    def alpha_shifts(self) -> np.ndarray:
+        return np.array([(ord(c) - 65) % 26 for c in self.require_alpha()], dtype=np.uint8)
+
+    @functools.cached_property
+    def alpha_neg_shifts(self) -> np.ndarray:
+        return (26 - self.alpha_shifts) % 26
+
+    def classic_stream(self, n: int, j: int = 0, decrypt: bool = False) -> np.ndarray:
+        # shift untuk n huruf berikutnya, mulai dari posisi key j
+        s = self.alpha_neg_shifts if decrypt else self.alpha_shifts
+        p = j % s.size
+        return np.tile(s, -(-(p + n) // s.size))[p:p + n]
+
+def key_schedule(key) -> KeySchedule:
+    return key if isinstance(key, KeySchedule) else KeySchedule(key)
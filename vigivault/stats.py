@@ -0,0 +1,76 @@
+"""Statistik file single pass: size, SHA-256, histogram, entropi."""
+
+import hashlib
+
+import numpy as np
+
+from .metrics import stage
+from .utils import STREAM_CHUNK, iter_file_chunks
+
+# bincount meng-cast input ke intp (8× ukuran data): histogram dihitung per
+# blok 1 MiB agar memori sementara tetap kecil berapa pun ukuran chunk.
+HIST_BLOCK = 1 << 20
+
+def byte_hist(b) -> np.ndarray:
+    a = np.frombuffer(b, dtype=np.uint8)
+    hist = np.zeros(256, dtype=np.int64)
+    for s in range(0, a.size, HIST_BLOCK):
+        hist += np.bincount(a[s:s + HIST_BLOCK], minlength=256)
+    return hist
+
+def _entropy_from_hist(hist: np.ndarray) -> float:
+    total = int(hist.sum())
+    if total == 0:
+        return 0.0
+    p = hist[hist > 0] / total
+    return float(-(p * np.log2(p)).sum())
+
+def shannon_entropy(b: bytes) -> float:
+    if not b:
+        return 0.0
+    with stage("entropy", len(b)):
+        return _entropy_from_hist(byte_hist(b))
+
+
+# ==============================
+# STATISTIK FILE (single pass)
+# ==============================
+# Size, SHA-256, histogram 256-bin, entropi dan head dihitung dalam satu kali
+# baca; update() bisa dipanggil per chunk saat cipher sedang diproduksi.
+class FileStats:
+    def __init__(self, head_n: int = 64):
+        self.size = 0
+        self.hist = np.zeros(256, dtype=np.int64)
+        self.head = b""
+        self._sha = hashlib.sha256()
+        self._head_n = head_n
+
+    def update(self, chunk) -> None:
+        with stage("sha256", len(chunk)):
+            self._sha.update(chunk)
+        with stage("histogram", len(chunk)):
+            self.hist += byte_hist(chunk)
+        if len(self.head) < self._head_n:
+            self.head += bytes(chunk[:self._head_n - len(self.head)])
+        self.size += len(chunk)
+
+    @property
+    def sha256(self) -> str:
+        return self._sha.hexdigest()
+
+    @property
+    def entropy(self) -> float:
+        with stage("entropy"):
+            return _entropy_from_hist(self.hist)
+
+    @classmethod
+    def of_bytes(cls, b: bytes, head_n: int = 64) -> "FileStats":
+        fs = cls(head_n); fs.update(b)
+        return fs
+
+    @classmethod
+    def of_stream(cls, fobj, chunk_size: int = STREAM_CHUNK, head_n: int = 64) -> "FileStats":
+        fs = cls(head_n)
+        for chunk in iter_file_chunks(fobj, chunk_size):
+            fs.update(chunk)
+        return fs
@@ -0,0 +1,79 @@
+"""Utilitas umum: hex preview, hash, nama file, dan pembacaan file per chunk."""
+
+import hashlib
+import io
+import tempfile
+import time
+
+from .metrics import current, stage
+
+def hex_preview(b: bytes, n: int = 64) -> str:
+    if not b:
+        return "(kosong)"
+    from .hexview import format_hex   # NumPy baru di-load saat preview dipakai
+    with stage("hex_preview", min(len(b), n)):
+        return format_hex(b[:n])
+
+def sha256(b: bytes) -> str:
+    return hashlib.sha256(b).hexdigest()
+
+
+def clean_filename(name: str, remove_spaces: bool = False) -> str:
+    if not name:
+        return name
+    base = name
+    if remove_spaces:
+        base = base.replace(" ", "_")
+    return base.replace("(", "").replace(")", "")
+
+
+# ==============================
+# BACA FILE PER CHUNK
+# ==============================
+STREAM_CHUNK = 16 << 20
+
+def iter_file_chunks(fobj, chunk_size: int = STREAM_CHUNK, start: int = 0, limit: int | None = None):
+    # stdin/pipe tidak bisa di-seek: baca apa adanya dari posisi sekarang
+    if start or _seekable(fobj):
+        fobj.seek(start)
+    left = limit
+    rec = current()
+    while left is None or left > 0:
+        t0 = time.perf_counter()
+        chunk = fobj.read(chunk_size if left is None else min(chunk_size, left))
+        if rec is not None:
+            rec.add("read", time.perf_counter() - t0, len(chunk))
+        if not chunk:
+            break
+        if left is not None:
+            left -= len(chunk)
+        yield chunk
+
+def _seekable(fobj) -> bool:
+    if not hasattr(fobj, "seek"):
+        return False
+    return fobj.seekable() if hasattr(fobj, "seekable") else True
+
+def _tap(chunks, fn):
+    for chunk in chunks:
+        fn(chunk)
+        yield chunk
+
+# Output transform streaming ke file temporer di disk: write(w) menulis lewat
+# BufferedWriter `w`. Return (dst raw file di posisi 0, return write). Bila
+# write gagal, file temporer (output setengah jadi) langsung dibuang.
+def _spool(write, buffer_size: int = STREAM_CHUNK):
+    dst = tempfile.TemporaryFile(buffering=0)
+    w = io.BufferedWriter(dst, buffer_size=buffer_size)
+    try:
+        result = write(w)
+        w.flush()
+    except BaseException:
+        w.close()
+        raise
+    w.detach(); dst.seek(0)
+    return dst, result
+
+def _stream_size(fobj) -> int:
+    fobj.seek(0, io.SEEK_END); n = fobj.tell(); fobj.seek(0)
+    return n